@@ -0,0 +1,198 @@
+"""
+Hand throughput benchmark.
+
+Plays the same six-handed table of bots several ways and reports hands
+per second for each, as a multiple of the baseline:
+
+  baseline  - simulator play_single_hand() as it was before play_hand()
+              existed (BASELINE_REVISION): the simulator dealt the cards
+              and showdowns used evaluate(). Timed in a subprocess on a
+              copy of that revision taken with git archive
+  runner    - simulator play_single_hand(): validated actions from
+              snapshot dicts, with invariant checks after every hand
+  play_hand - DealerEngine.play_hand(): the engine deals and drives the
+              hand, and bots decide from the engine through act()
+  replay    - DealerEngine.replay() of the hands play_hand recorded:
+              the trusted path, with no decisions to make
+
+Each figure is the best of REPEATS runs. Run from the code directory:
+
+    python benchmark_hands.py [num_hands] [baseline_revision]
+"""
+
+import io
+import os
+import random
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Appended, so a baseline tree put first on the path wins (see _BASELINE_RUNNER)
+if CODE_DIR not in sys.path:
+    sys.path.append(CODE_DIR)
+
+from bots import CallingStationBot, PassiveBot, FolderBot
+from simulator.game_runner import STARTING_STACK, create_table, play_single_hand
+
+DEFAULT_HANDS = 2_000
+SEED = 2026
+REPEATS = 3
+
+# Last revision before DealerEngine.play_hand() and engine-owned dealing
+BASELINE_REVISION = "6b2f031"
+
+# Runs runner_hands_per_second() against the baseline tree's engine,
+# simulator and bots: python -c _BASELINE_RUNNER BASELINE_DIR CODE_DIR HANDS
+_BASELINE_RUNNER = (
+    "import sys; sys.path[:0] = sys.argv[1:3]; import benchmark_hands; "
+    "print(benchmark_hands.runner_hands_per_second(int(sys.argv[3])))"
+)
+
+
+def _bots() -> list:
+    """
+    Return the benchmark table: mostly showdowns, some folds.
+
+    None of these bots moves all-in with deep stacks, so the runner's
+    all-in EV measurement does not skew the comparison.
+    """
+    return [
+        CallingStationBot("CS1"),
+        CallingStationBot("CS2"),
+        CallingStationBot("CS3"),
+        PassiveBot("Pass1"),
+        PassiveBot("Pass2"),
+        FolderBot("Fold"),
+    ]
+
+
+def runner_hands_per_second(num_hands: int) -> float:
+    """
+    Time hands played by the simulator's play_single_hand().
+
+    Args:
+        num_hands (int): Hands to play.
+
+    Returns:
+        float: Hands per second.
+    """
+    random.seed(SEED)
+    bots = _bots()
+    engine = create_table(bots)
+    stacks = {bot.name: STARTING_STACK for bot in bots}
+
+    start = time.perf_counter()
+    for hand_number in range(1, num_hands + 1):
+        play_single_hand(bots, hand_number, stacks, engine=engine)
+    return num_hands / (time.perf_counter() - start)
+
+
+def play_hand_hands_per_second(num_hands: int) -> float:
+    """
+    Time hands played by DealerEngine.play_hand().
+
+    Args:
+        num_hands (int): Hands to play.
+
+    Returns:
+        float: Hands per second.
+    """
+    random.seed(SEED)
+    bots = _bots()
+    engine = create_table(bots)
+    stacks = {bot.name: STARTING_STACK for bot in bots}
+    agents = {bot.name: bot.act for bot in bots}
+
+    start = time.perf_counter()
+    for _ in range(num_hands):
+        engine.play_hand(agents, stacks)
+    return num_hands / (time.perf_counter() - start)
+
+
+def replay_hands_per_second(num_hands: int) -> float:
+    """
+    Time DealerEngine.replay() of hands recorded by play_hand().
+
+    Args:
+        num_hands (int): Hands to record and replay.
+
+    Returns:
+        float: Hands per second, for the replays only.
+    """
+    random.seed(SEED)
+    bots = _bots()
+    engine = create_table(bots)
+    stacks = {bot.name: STARTING_STACK for bot in bots}
+    agents = {bot.name: bot.act for bot in bots}
+    logs = []
+    for _ in range(num_hands):
+        engine.play_hand(agents, stacks)
+        logs.append(engine.hand_log.copy())
+
+    start = time.perf_counter()
+    for log in logs:
+        engine.replay(log)
+    return num_hands / (time.perf_counter() - start)
+
+
+def baseline_hands_per_second(num_hands: int, revision: str = BASELINE_REVISION) -> float:
+    """
+    Time the simulator's play_single_hand() at an earlier revision.
+
+    The revision's code directory (this script's, at that revision) is
+    extracted with git archive into a
+    temporary directory and runner_hands_per_second() is run there in a
+    subprocess, so the old engine, simulator and bots play the same table.
+
+    Args:
+        num_hands (int): Hands to play.
+        revision (str): Git revision to time (default: BASELINE_REVISION).
+
+    Returns:
+        float: Hands per second.
+
+    Raises:
+        subprocess.CalledProcessError: If git archive or the run fails.
+    """
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision, "."],
+        cwd=CODE_DIR, capture_output=True, check=True,
+    ).stdout
+    with tempfile.TemporaryDirectory() as tree:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tree)
+        result = subprocess.run(
+            [sys.executable, "-c", _BASELINE_RUNNER, tree, CODE_DIR, str(num_hands)],
+            cwd=tree, capture_output=True, text=True, check=True,
+        )
+    return float(result.stdout.split()[-1])
+
+
+def _best_of(measure, *args) -> float:
+    """Return the highest of REPEATS hands-per-second measurements."""
+    return max(measure(*args) for _ in range(REPEATS))
+
+
+def main() -> int:
+    """Print hands per second for the baseline, runner, play_hand() and replay()."""
+    num_hands = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_HANDS
+    revision = sys.argv[2] if len(sys.argv) > 2 else BASELINE_REVISION
+
+    baseline = _best_of(baseline_hands_per_second, num_hands, revision)
+    runner = _best_of(runner_hands_per_second, num_hands)
+    driver = _best_of(play_hand_hands_per_second, num_hands)
+    replay = _best_of(replay_hands_per_second, num_hands)
+
+    print(f"Hands: {num_hands} x 6 seats, best of {REPEATS}")
+    print(f"  baseline  : {baseline:,.0f} hands/s (runner at {revision})")
+    print(f"  runner    : {runner:,.0f} hands/s ({runner / baseline:.1f}x)")
+    print(f"  play_hand : {driver:,.0f} hands/s ({driver / baseline:.1f}x)")
+    print(f"  replay    : {replay:,.0f} hands/s ({replay / baseline:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+Memory benchmark for live tables.
+
+Seats many six-handed tables in one process and reports the bytes each
+table costs, measured with tracemalloc:
+
+  core state  - GameState, six PlayerStates and the pot objects
+  live engine - a DealerEngine after start_hand() (deck, ledger, pots)
+
+Each is reported before and after slotting the core classes. The
+"before" figure adds the measured cost of holding the same attributes
+in an instance __dict__ instead of slots, which is how GameState,
+PlayerState, Pot and SidePot stored them before they were slotted.
+
+Run from the code directory:
+
+    python benchmark_memory.py [num_tables]
+"""
+
+import sys
+import os
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from poker_engine.card import Card
+from poker_engine.dealer_engine import DealerEngine, GameType
+from poker_engine.game_state import GameState, SidePot
+from poker_engine.player_state import PlayerState
+from poker_engine.pot_manager import Pot
+
+DEFAULT_TABLES = 10_000
+SEATS = 6
+STARTING_STACK = 1000
+
+# Hole cards are shared across tables so only per-table state is measured
+_HOLE_CARDS = [Card("hearts", "A"), Card("spades", "K")]
+
+# Unslotted stand-in class per core class, created on first use
+_UNSLOTTED: Dict[type, type] = {}
+
+
+def _player_ids() -> list:
+    """Return the player IDs for one table."""
+    return [f"p{seat}" for seat in range(SEATS)]
+
+
+def build_core_state(table_number: int) -> tuple:
+    """
+    Build the core state objects of one seated table.
+
+    Args:
+        table_number (int): Used to give each table a distinct game ID.
+
+    Returns:
+        tuple: (GameState, main Pot, side Pot).
+    """
+    player_ids = _player_ids()
+    players = [
+        PlayerState(player_id, seat, STARTING_STACK)
+        for seat, player_id in enumerate(player_ids)
+    ]
+    for player in players:
+        player.deal_hole_cards(_HOLE_CARDS)
+
+    game_state = GameState(f"table-{table_number}", players, 10, 20)
+    game_state.side_pots.append(SidePot(40, player_ids[:2]))
+    return game_state, Pot(120, player_ids), Pot(40, player_ids[:2])
+
+
+def build_live_engine(table_number: int) -> DealerEngine:
+    """
+    Build a dealer engine with a hand in progress.
+
+    Args:
+        table_number (int): Used to give each table a distinct game ID.
+
+    Returns:
+        DealerEngine: Engine after start_hand().
+    """
+    players = [
+        PlayerState(player_id, seat, STARTING_STACK)
+        for seat, player_id in enumerate(_player_ids())
+    ]
+    engine = DealerEngine(
+        game_type=GameType.TEXAS_HOLDEM,
+        players=players,
+        small_blind_amount=10,
+        big_blind_amount=20,
+        game_id=f"table-{table_number}",
+    )
+    engine.start_hand()
+    return engine
+
+
+def core_objects_of_state(table: tuple) -> list:
+    """Return the slotted core objects of a build_core_state() table."""
+    game_state, main_pot, side_pot = table
+    return [game_state, *game_state.players, *game_state.side_pots, main_pot, side_pot]
+
+
+def core_objects_of_engine(engine: DealerEngine) -> list:
+    """Return the slotted core objects of a build_live_engine() table."""
+    game_state = engine.game_state
+    return [game_state, *game_state.players, *game_state.side_pots]
+
+
+def _traced_bytes(build: Callable[[], list]) -> int:
+    """Return the bytes still allocated by build() once it returns."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return allocated
+
+
+def _unslotted_copy(obj: object) -> object:
+    """
+    Copy obj's slot values into attributes of a plain (unslotted) object.
+
+    Attributes are set in slot order on one class per source class, as a
+    pre-slots __init__ did, so CPython can share dict keys between copies.
+    """
+    cls = type(obj)
+    unslotted = _UNSLOTTED.get(cls)
+    if unslotted is None:
+        unslotted = _UNSLOTTED[cls] = type(f"Unslotted{cls.__name__}", (), {})
+    copy = unslotted()
+    for klass in reversed(cls.__mro__):
+        for name in getattr(klass, "__slots__", ()):
+            if hasattr(obj, name):
+                setattr(copy, name, getattr(obj, name))
+    return copy
+
+
+def bytes_per_table(build: Callable[[int], object], num_tables: int) -> float:
+    """
+    Measure the average traced allocation of one table.
+
+    Args:
+        build (Callable[[int], object]): Builds one table.
+        num_tables (int): Tables to keep alive simultaneously.
+
+    Returns:
+        float: Bytes allocated per table.
+    """
+    return _traced_bytes(lambda: [build(i) for i in range(num_tables)]) / num_tables
+
+
+def unslotted_overhead_per_table(
+    build: Callable[[int], object],
+    core_objects: Callable[[object], list],
+    num_tables: int,
+) -> float:
+    """
+    Measure what the core objects of a table would cost more without slots.
+
+    Copies every core object twice, once with its own slotted class and
+    once as an unslotted object with the same attributes, and compares the
+    bytes the two sets of copies hold. The attribute values are shared,
+    so only the objects' own storage differs.
+
+    Args:
+        build (Callable[[int], object]): Builds one table.
+        core_objects (Callable[[object], list]): Slotted core objects of a
+            table.
+        num_tables (int): Tables to measure.
+
+    Returns:
+        float: Extra bytes per table for the unslotted layout.
+    """
+    objects: List[object] = [
+        obj for i in range(num_tables) for obj in core_objects(build(i))
+    ]
+
+    def slotted() -> list:
+        copies = []
+        for obj in objects:
+            copy = object.__new__(type(obj))
+            for klass in type(obj).__mro__:
+                for name in getattr(klass, "__slots__", ()):
+                    if hasattr(obj, name):
+                        setattr(copy, name, getattr(obj, name))
+            copies.append(copy)
+        return copies
+
+    def unslotted() -> list:
+        return [_unslotted_copy(obj) for obj in objects]
+
+    return (_traced_bytes(unslotted) - _traced_bytes(slotted)) / num_tables
+
+
+def main() -> int:
+    """Print bytes per seated table for core state and live engines."""
+    num_tables = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TABLES
+
+    num_engines = max(1, num_tables // 10)
+    rows = (
+        ("core state ", build_core_state, core_objects_of_state, num_tables),
+        ("live engine", build_live_engine, core_objects_of_engine, num_engines),
+    )
+
+    print(f"Tables: {num_tables} x {SEATS} seats")
+    for label, build, core_objects, count in rows:
+        after = bytes_per_table(build, count)
+        before = after + unslotted_overhead_per_table(build, core_objects, count)
+        print(
+            f"  {label} : {before:,.0f} -> {after:,.0f} bytes/table "
+            f"({1 - after / before:.0%} less)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
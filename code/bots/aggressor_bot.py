@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from poker_engine import ActionType
 
 BET_AMOUNT = 40    # 2x big blind opening bet
-RAISE_INCREMENT = 20   # minimum raise increment (= big blind)
+RAISE_INCREMENT = 20   # fallback raise increment (= big blind)
 
 
 class AggressorBot(BaseBot):
@@ -21,10 +21,26 @@ class AggressorBot(BaseBot):
     """
 
     def get_action(self, snapshot: dict) -> Tuple[ActionType, int]:
-        to_call = snapshot.get('current_bet_to_call', 0)
-        stack = snapshot.get('your_stack', 0)
-        my_bet = snapshot.get('your_bet_this_round', 0)
+        return self._decide(
+            snapshot.get('current_bet_to_call', 0),
+            snapshot.get('your_stack', 0),
+            snapshot.get('your_bet_this_round', 0),
+            snapshot.get('min_raise_increment', RAISE_INCREMENT),
+            snapshot.get('legal_actions'),
+        )
 
+    def act(self, engine, player, legal) -> Tuple[ActionType, int]:
+        return self._decide(
+            legal.call_amount,
+            player.stack,
+            player.current_bet,
+            engine.betting_validator.get_min_raise_increment(),
+            legal,
+        )
+
+    def _decide(
+        self, to_call: int, stack: int, my_bet: int, min_raise: int, legal
+    ) -> Tuple[ActionType, int]:
         if stack <= 0:
             return (ActionType.FOLD, 0)
 
@@ -33,8 +49,10 @@ class AggressorBot(BaseBot):
             # RAISE amount = chips to add on top of current_bet.
             # Validator: player.current_bet + amount >= max_bet + min_raise
             # Since to_call = max_bet - player.current_bet:
-            #   amount >= to_call + RAISE_INCREMENT
-            raise_amount = to_call + RAISE_INCREMENT
+            #   amount >= to_call + min_raise (the last raise size)
+            raise_amount = to_call + min_raise
+            if legal is not None and ActionType.RAISE not in legal.actions:
+                return (ActionType.ALL_IN, stack)
             if raise_amount >= stack:
                 return (ActionType.ALL_IN, stack)
             return (ActionType.RAISE, raise_amount)
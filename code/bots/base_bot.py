@@ -15,7 +15,9 @@ class BaseBot(ABC):
     Abstract base class for all bot strategies.
 
     Subclasses must implement get_action(), which receives a game state
-    snapshot and returns an (ActionType, amount) tuple.
+    snapshot and returns an (ActionType, amount) tuple. They may also
+    override act(), the entry point used by DealerEngine.play_hand(), to
+    decide from the engine directly without building a snapshot.
     """
 
     def __init__(self, name: str) -> None:
@@ -30,15 +32,35 @@ class BaseBot(ABC):
             snapshot: Game state dict from DealerEngine.request_action().
                       Keys: player_id, game_phase, your_cards, your_stack,
                       your_bet_this_round, community_cards,
-                      current_bet_to_call, pot_total, active_players.
+                      current_bet_to_call, min_raise_increment,
+                      legal_actions, pot_total, active_players.
+                      legal_actions is a LegalActions listing every
+                      permitted action and its amounts.
 
         Returns:
             Tuple of (ActionType, amount).
             amount is 0 for CHECK, FOLD, CALL.
             amount is the bet size for BET.
-            amount is the raise increment for RAISE.
+            amount is the chips added for RAISE (call plus increment).
             amount is the remaining stack for ALL_IN.
         """
 
+    def act(self, engine, player, legal) -> Tuple[ActionType, int]:
+        """
+        Decide on an action for DealerEngine.play_hand().
+
+        The default builds the get_action() snapshot; override to read the
+        engine, player and legal actions directly instead.
+
+        Args:
+            engine: DealerEngine playing the hand.
+            player: PlayerState of this bot, due to act.
+            legal: LegalActions for this bot.
+
+        Returns:
+            Tuple of (ActionType, amount), as for get_action().
+        """
+        return self.get_action(engine.request_action(player.player_id))
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r})"
@@ -24,11 +24,19 @@ class FolderBot(BaseBot):
 
     def get_action(self, snapshot: dict) -> Tuple[ActionType, int]:
         cards = snapshot.get('your_cards', [])
-        to_call = snapshot.get('current_bet_to_call', 0)
-        stack = snapshot.get('your_stack', 0)
-
         # Parse rank from "A of hearts" -> "A"
         ranks = {card.split(' of ')[0] for card in cards}
+        return self._decide(
+            ranks,
+            snapshot.get('current_bet_to_call', 0),
+            snapshot.get('your_stack', 0),
+        )
+
+    def act(self, engine, player, legal) -> Tuple[ActionType, int]:
+        ranks = {card.rank for card in player.hole_cards}
+        return self._decide(ranks, legal.call_amount, player.stack)
+
+    def _decide(self, ranks: set, to_call: int, stack: int) -> Tuple[ActionType, int]:
         has_premium = bool(ranks & PREMIUM_RANKS)
 
         if not has_premium:
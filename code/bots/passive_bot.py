@@ -21,9 +21,15 @@ class PassiveBot(BaseBot):
     """
 
     def get_action(self, snapshot: dict) -> Tuple[ActionType, int]:
-        to_call = snapshot.get('current_bet_to_call', 0)
-        stack = snapshot.get('your_stack', 0)
+        return self._decide(
+            snapshot.get('current_bet_to_call', 0),
+            snapshot.get('your_stack', 0),
+        )
 
+    def act(self, engine, player, legal) -> Tuple[ActionType, int]:
+        return self._decide(legal.call_amount, player.stack)
+
+    def _decide(self, to_call: int, stack: int) -> Tuple[ActionType, int]:
         if to_call <= 0:
             return (ActionType.CHECK, 0)
 
@@ -21,9 +21,16 @@ class RandomBot(BaseBot):
     """
 
     def get_action(self, snapshot: dict) -> Tuple[ActionType, int]:
-        to_call = snapshot.get('current_bet_to_call', 0)
-        stack = snapshot.get('your_stack', 0)
+        return self._decide(
+            snapshot.get('current_bet_to_call', 0),
+            snapshot.get('your_stack', 0),
+            snapshot.get('legal_actions'),
+        )
 
+    def act(self, engine, player, legal) -> Tuple[ActionType, int]:
+        return self._decide(legal.call_amount, player.stack, legal)
+
+    def _decide(self, to_call: int, stack: int, legal) -> Tuple[ActionType, int]:
         if stack <= 0:
             return (ActionType.FOLD, 0)
 
@@ -34,6 +41,9 @@ class RandomBot(BaseBot):
                 return (ActionType.CHECK, 0)
             elif choice == 1:
                 bet = min(BET_AMOUNT, stack)
+                if legal is not None and not legal.allows(ActionType.BET, bet):
+                    # Already bet this round (the big blind's option): check
+                    return (ActionType.CHECK, 0)
                 return (ActionType.BET, bet) if bet > 0 else (ActionType.CHECK, 0)
             else:
                 return (ActionType.ALL_IN, stack)
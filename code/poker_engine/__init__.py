@@ -4,27 +4,58 @@ __version__ = "0.2.0"
 __author__ = "Angus-Plex"
 
 from poker_engine.card import Card
+from poker_engine.deck import Deck
 from poker_engine.hand_evaluator import HandEvaluator
+from poker_engine.evaluation_cache import EvaluationCache, SharedEvaluationTable
 from poker_engine.player_state import PlayerState, PlayerStatus, RoundStatus
-from poker_engine.game_state import GameState, GamePhase, SidePot
+from poker_engine.game_state import GameState, GamePhase, SidePot, BettingRound
+from poker_engine.seat_ring import SeatRing
+from poker_engine.pot_manager import PotManager, PotLayer, PotStructure
+from poker_engine.chip_ledger import ChipLedger, LedgerEntryKind
+from poker_engine.hand_log import HandLog, HandEvent, EventKind
+from poker_engine.zobrist import ZobristKeys
+from poker_engine.table_view import SeatView, TableView
+from poker_engine.betting_structure import BettingLimit, BettingStructure
 from poker_engine.betting_validator import (
     BettingValidator,
     ActionType,
+    ActionResult,
+    LegalActions,
     InvalidActionError,
     NotPlayersTurnError,
 )
 
 __all__ = [
     "Card",
+    "Deck",
     "HandEvaluator",
+    "EvaluationCache",
+    "SharedEvaluationTable",
     "PlayerState",
     "PlayerStatus",
     "RoundStatus",
     "GameState",
     "GamePhase",
     "SidePot",
+    "BettingRound",
+    "SeatRing",
+    "PotManager",
+    "PotLayer",
+    "PotStructure",
+    "ChipLedger",
+    "LedgerEntryKind",
+    "HandLog",
+    "HandEvent",
+    "EventKind",
+    "ZobristKeys",
+    "SeatView",
+    "TableView",
+    "BettingLimit",
+    "BettingStructure",
     "BettingValidator",
     "ActionType",
+    "ActionResult",
+    "LegalActions",
     "InvalidActionError",
     "NotPlayersTurnError",
 ]
@@ -0,0 +1,151 @@
+"""Betting structures: no-limit, pot-limit and fixed-limit bet sizing."""
+
+from enum import Enum
+from typing import Optional, Sequence
+
+from poker_engine.game_state import GameState, GamePhase
+
+# Betting street of each phase, in GamePhase (and so GameState phase code)
+# order; phases outside betting use the nearest street
+_STREET_OF_PHASE = {
+    GamePhase.FLOP: 1,
+    GamePhase.TURN: 2,
+    GamePhase.RIVER: 3,
+    GamePhase.SHOWDOWN: 3,
+    GamePhase.POT_DISTRIBUTION: 3,
+    GamePhase.HAND_COMPLETE: 3,
+}
+
+DEFAULT_RAISE_CAP = 4
+
+
+class BettingLimit(Enum):
+    """How large a bet or raise may be."""
+
+    NO_LIMIT = "NO_LIMIT"
+    """Any amount up to the stack."""
+
+    POT_LIMIT = "POT_LIMIT"
+    """Raise to at most the pot after calling."""
+
+    FIXED_LIMIT = "FIXED_LIMIT"
+    """Exactly one bet size per street, with a cap on raises."""
+
+
+class BettingStructure:
+    """
+    Bet sizing rules for a table.
+
+    The validator reads the limit to bound bets and raises. Fixed-limit
+    bet sizes are expanded into a table indexed by GameState phase code
+    when the structure is built, so the size for the current street is a
+    single lookup.
+
+    Attributes:
+        limit (BettingLimit): NO_LIMIT, POT_LIMIT or FIXED_LIMIT.
+        bet_sizes (Tuple[int, ...]): Fixed-limit bet size for pre-flop,
+            flop, turn and river (empty otherwise).
+        raise_cap (int): Fixed-limit maximum bets plus raises per street,
+            counting the big blind pre-flop (0 otherwise).
+    """
+
+    __slots__ = ("limit", "bet_sizes", "raise_cap", "_phase_bet_sizes")
+
+    def __init__(
+        self,
+        limit: BettingLimit = BettingLimit.NO_LIMIT,
+        bet_sizes: Sequence[int] = (),
+        raise_cap: int = 0,
+    ):
+        """
+        Initialise a betting structure.
+
+        Args:
+            limit (BettingLimit): Kind of limit (default: NO_LIMIT).
+            bet_sizes (Sequence[int]): Four bet sizes, one per street
+                (fixed-limit only).
+            raise_cap (int): Bets plus raises allowed per street
+                (fixed-limit only).
+
+        Raises:
+            ValueError: If bet sizes or cap do not suit the limit.
+        """
+        bet_sizes = tuple(bet_sizes)
+        if limit == BettingLimit.FIXED_LIMIT:
+            if len(bet_sizes) != 4 or min(bet_sizes) <= 0:
+                raise ValueError(
+                    f"Fixed limit needs four positive bet sizes, got {bet_sizes}"
+                )
+            if raise_cap < 1:
+                raise ValueError(f"Raise cap must be at least 1, got {raise_cap}")
+        elif bet_sizes or raise_cap:
+            raise ValueError(f"{limit.value} takes no bet sizes or raise cap")
+
+        self.limit = limit
+        self.bet_sizes = bet_sizes
+        self.raise_cap = raise_cap
+        self._phase_bet_sizes = tuple(
+            bet_sizes[_STREET_OF_PHASE.get(phase, 0)] if bet_sizes else 0
+            for phase in GamePhase
+        )
+
+    @classmethod
+    def no_limit(cls) -> "BettingStructure":
+        """Build a no-limit structure."""
+        return cls(BettingLimit.NO_LIMIT)
+
+    @classmethod
+    def pot_limit(cls) -> "BettingStructure":
+        """Build a pot-limit structure."""
+        return cls(BettingLimit.POT_LIMIT)
+
+    @classmethod
+    def fixed_limit(
+        cls,
+        small_bet: int,
+        big_bet: Optional[int] = None,
+        raise_cap: int = DEFAULT_RAISE_CAP,
+    ) -> "BettingStructure":
+        """
+        Build a fixed-limit structure.
+
+        Args:
+            small_bet (int): Bet size pre-flop and on the flop (usually the
+                big blind).
+            big_bet (Optional[int]): Bet size on the turn and river
+                (default: twice small_bet).
+            raise_cap (int): Bets plus raises per street (default: 4).
+
+        Returns:
+            BettingStructure: Fixed-limit structure.
+        """
+        if big_bet is None:
+            big_bet = 2 * small_bet
+        return cls(
+            BettingLimit.FIXED_LIMIT, (small_bet, small_bet, big_bet, big_bet), raise_cap
+        )
+
+    def bet_size(self, game_state: GameState) -> int:
+        """
+        Get the fixed-limit bet size for the table's current street.
+
+        Args:
+            game_state (GameState): Table to read.
+
+        Returns:
+            int: Bet size (0 unless fixed-limit).
+        """
+        return self._phase_bet_sizes[game_state._phase]
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        if self.limit == BettingLimit.FIXED_LIMIT:
+            return (
+                f"BettingStructure({self.limit.value}, bet_sizes={self.bet_sizes}, "
+                f"raise_cap={self.raise_cap})"
+            )
+        return f"BettingStructure({self.limit.value})"
+
+
+# Default for validators and engines built without a structure
+NO_LIMIT = BettingStructure.no_limit()
@@ -0,0 +1,346 @@
+"""Public betting tree stored in flat arrays, for solvers and analysis."""
+
+from array import array
+from enum import IntEnum
+from typing import List, Sequence, Tuple
+
+from poker_engine.betting_validator import ActionType, LegalActions
+from poker_engine.dealer_engine import DealerEngine, STREET_INDEX
+from poker_engine.game_state import GamePhase
+
+# Action codes stored in BettingTree.action (-1 at the root)
+_ACTIONS = tuple(ActionType)
+_ACTION_CODES = {action: code for code, action in enumerate(_ACTIONS)}
+
+DEFAULT_BET_FRACTIONS = (0.5, 1.0)
+DEFAULT_MAX_NODES = 1_000_000
+
+
+class NodeKind(IntEnum):
+    """What happens at a betting tree node."""
+
+    DECISION = 0
+    """A player is due to act."""
+
+    FOLD = 1
+    """Everyone else folded; the hand is over."""
+
+    SHOWDOWN = 2
+    """Betting is over; the board is run out and hands are shown."""
+
+
+class BettingTree:
+    """
+    Every public action sequence from a starting table, in flat arrays.
+
+    Node 0 is the root; node i was reached by action[i] (amount[i] chips
+    added) from parent[i]. The children of a node are stored together at
+    first_child[i] .. first_child[i] + child_count[i] - 1, so a solver
+    can hold per-node values in arrays of the same length and never walk
+    Python objects. Cards are not part of the tree: a street change is the
+    action that closes the previous street's betting.
+
+    Attributes:
+        parent (array): Parent node (-1 at the root).
+        action (array): ActionType code of the action taken to reach the
+            node (index into tuple(ActionType); -1 at the root).
+        amount (array): Chips added by that action.
+        pot (array): Chips in the pot at the node.
+        player (array): Seat due to act (-1 at terminal nodes).
+        street (array): Betting street (0 = pre-flop ... 3 = river).
+        kind (array): NodeKind of the node.
+        first_child (array): Index of the node's first child.
+        child_count (array): Number of children (0 at terminal nodes).
+    """
+
+    __slots__ = (
+        "parent",
+        "action",
+        "amount",
+        "pot",
+        "player",
+        "street",
+        "kind",
+        "first_child",
+        "child_count",
+    )
+
+    def __init__(self):
+        """Initialise an empty tree; use build() to fill one."""
+        self.parent = array("i")
+        self.action = array("b")
+        self.amount = array("q")
+        self.pot = array("q")
+        self.player = array("b")
+        self.street = array("b")
+        self.kind = array("b")
+        self.first_child = array("i")
+        self.child_count = array("H")
+
+    @classmethod
+    def build(
+        cls,
+        engine: DealerEngine,
+        bet_fractions: Sequence[float] = DEFAULT_BET_FRACTIONS,
+        include_all_in: bool = True,
+        max_nodes: int = DEFAULT_MAX_NODES,
+    ) -> "BettingTree":
+        """
+        Build the tree of every action sequence from the engine's table.
+
+        Actions come from the engine's own legal_actions(), so the tree
+        follows its betting structure. Fixed limit has one bet or raise
+        size per node. No limit and pot limit are abstracted: bets and
+        raises are offered at each fraction of the pot (a raise's
+        fraction applies to the pot after calling), within the legal
+        range. Folding is only offered when facing a bet. The engine is
+        left as it was.
+
+        Args:
+            engine (DealerEngine): Engine with a betting round in progress,
+                e.g. just after start_hand().
+            bet_fractions (Sequence[float]): Pot fractions for no-limit and
+                pot-limit bets and raises (default: half pot and pot).
+            include_all_in (bool): Offer ALL_IN where it is legal
+                (default: True).
+            max_nodes (int): Stop with an error beyond this many nodes.
+
+        Returns:
+            BettingTree: The built tree.
+
+        Raises:
+            ValueError: If nobody is due to act, or the tree exceeds
+                max_nodes.
+        """
+        if engine.game_state.current_action_player is None:
+            raise ValueError("No player is due to act")
+
+        tree = cls()
+        tree._append(-1, -1, 0, engine)
+        token = engine.snapshot()
+        try:
+            tree._expand(0, engine, tuple(bet_fractions), include_all_in, max_nodes)
+        finally:
+            engine.restore(token)
+        return tree
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.parent)
+
+    def children(self, node: int) -> range:
+        """
+        Get a node's children.
+
+        Args:
+            node (int): Node index.
+
+        Returns:
+            range: Indices of the node's children.
+        """
+        start = self.first_child[node]
+        return range(start, start + self.child_count[node])
+
+    def child(self, node: int, action: ActionType, amount: int = 0) -> int:
+        """
+        Follow an action from a node.
+
+        Scans only the node's own children, so the cost does not grow
+        with the tree.
+
+        Args:
+            node (int): Node index.
+            action (ActionType): Action taken.
+            amount (int): Chips added, as passed to process_action().
+
+        Returns:
+            int: Index of the resulting node.
+
+        Raises:
+            KeyError: If the action is not in the tree at this node.
+        """
+        code = _ACTION_CODES[action]
+        for child in self.children(node):
+            if self.action[child] == code and (
+                self.amount[child] == amount
+                or action in (ActionType.FOLD, ActionType.CHECK)
+            ):
+                return child
+        raise KeyError(f"No {action.value} {amount} at node {node}")
+
+    def node_id(self, history: Sequence[Tuple[ActionType, int]]) -> int:
+        """
+        Find the node reached by a sequence of actions from the root.
+
+        Args:
+            history (Sequence[Tuple[ActionType, int]]): (action, amount)
+                pairs, across streets.
+
+        Returns:
+            int: Node index.
+
+        Raises:
+            KeyError: If the history leaves the tree.
+        """
+        node = 0
+        for action, amount in history:
+            node = self.child(node, action, amount)
+        return node
+
+    def history(self, node: int) -> List[Tuple[ActionType, int]]:
+        """
+        Get the actions leading to a node.
+
+        Args:
+            node (int): Node index.
+
+        Returns:
+            List[Tuple[ActionType, int]]: (action, amount) pairs from the root.
+        """
+        actions = []
+        while node > 0:
+            actions.append((_ACTIONS[self.action[node]], self.amount[node]))
+            node = self.parent[node]
+        actions.reverse()
+        return actions
+
+    def action_type(self, node: int) -> ActionType:
+        """
+        Get the action taken to reach a node.
+
+        Args:
+            node (int): Node index (not the root).
+
+        Returns:
+            ActionType: Action taken.
+        """
+        return _ACTIONS[self.action[node]]
+
+    def is_terminal(self, node: int) -> bool:
+        """Return True if the hand's betting ends at node."""
+        return self.kind[node] != NodeKind.DECISION
+
+    def _append(self, parent: int, code: int, amount: int, engine: DealerEngine) -> int:
+        """Add a node for the engine's current table and return its index."""
+        game_state = engine.game_state
+        if game_state.count_active_players() <= 1:
+            kind, seat = NodeKind.FOLD, -1
+        elif game_state.current_action_player is None:
+            kind, seat = NodeKind.SHOWDOWN, -1
+        else:
+            kind, seat = NodeKind.DECISION, game_state.current_action_player
+
+        self.parent.append(parent)
+        self.action.append(code)
+        self.amount.append(amount)
+        self.pot.append(engine.pot_manager.get_pot_total())
+        self.player.append(seat)
+        self.street.append(min(STREET_INDEX[game_state.current_phase], 3))
+        self.kind.append(kind)
+        self.first_child.append(0)
+        self.child_count.append(0)
+        return len(self.parent) - 1
+
+    def _expand(
+        self,
+        node: int,
+        engine: DealerEngine,
+        bet_fractions: Tuple[float, ...],
+        include_all_in: bool,
+        max_nodes: int,
+    ) -> None:
+        """
+        Add the children of a decision node, then expand each in turn.
+
+        Children are appended together before any is expanded, which keeps
+        each node's children contiguous.
+        """
+        game_state = engine.game_state
+        seat = game_state.current_action_player
+        legal = engine.betting_validator.legal_actions(game_state.players[seat].player_id)
+        actions = _tree_actions(
+            legal, engine.pot_manager.get_pot_total(), bet_fractions, include_all_in
+        )
+        if len(self) + len(actions) > max_nodes:
+            raise ValueError(f"Betting tree exceeds {max_nodes} nodes")
+
+        token = engine.snapshot()
+        first = len(self)
+        for action, amount in actions:
+            engine.apply(action, amount, trusted=True)
+            _close_round(engine)
+            self._append(node, _ACTION_CODES[action], amount, engine)
+            engine.restore(token)
+        self.first_child[node] = first
+        self.child_count[node] = len(actions)
+
+        for child, (action, amount) in enumerate(actions, first):
+            if self.kind[child] != NodeKind.DECISION:
+                continue
+            engine.apply(action, amount, trusted=True)
+            _close_round(engine)
+            self._expand(child, engine, bet_fractions, include_all_in, max_nodes)
+            engine.restore(token)
+
+
+def _close_round(engine: DealerEngine) -> None:
+    """
+    Move past a completed betting round to the next one that needs action.
+
+    Leaves current_action_player None when betting is over: one player
+    left, the river closed, or fewer than two players able to bet.
+    """
+    game_state = engine.game_state
+    while engine.is_round_complete():
+        if (
+            game_state.count_active_players() <= 1
+            or game_state.current_phase == GamePhase.RIVER
+            or game_state.count_acting_players() < 2
+        ):
+            game_state.current_action_player = None
+            return
+        engine.advance_round()
+
+
+def _tree_actions(
+    legal: LegalActions,
+    pot: int,
+    bet_fractions: Tuple[float, ...],
+    include_all_in: bool,
+) -> List[Tuple[ActionType, int]]:
+    """List the (action, amount) pairs offered at a decision node."""
+    call_amount = legal.call_amount
+    actions = []
+    if ActionType.CHECK in legal.actions:
+        actions.append((ActionType.CHECK, 0))
+    else:
+        actions.append((ActionType.FOLD, 0))
+    if ActionType.CALL in legal.actions:
+        actions.append((ActionType.CALL, call_amount))
+
+    if ActionType.BET in legal.actions:
+        action, low, high = ActionType.BET, legal.min_bet, legal.max_bet
+        sizes = [round(fraction * pot) for fraction in bet_fractions]
+    elif ActionType.RAISE in legal.actions:
+        action, low, high = ActionType.RAISE, legal.min_raise, legal.max_raise
+        sizes = [
+            call_amount + round(fraction * (pot + call_amount))
+            for fraction in bet_fractions
+        ]
+    else:
+        action, low, high, sizes = None, 0, 0, []
+    if action is not None:
+        if low == high:
+            sizes = [low]
+        # A size equal to the stack is offered as ALL_IN instead
+        for amount in sorted({min(max(size, low), high) for size in sizes}):
+            if amount < legal.all_in_amount or not include_all_in:
+                actions.append((action, amount))
+
+    if (
+        include_all_in
+        and ActionType.ALL_IN in legal.actions
+        and not (ActionType.CALL in legal.actions and legal.all_in_amount == call_amount)
+    ):
+        actions.append((ActionType.ALL_IN, legal.all_in_amount))
+    return actions
@@ -1,8 +1,11 @@
 """Validates poker actions and betting decisions."""
 
-from enum import Enum
-from typing import Optional
+from enum import Enum, IntEnum
+from typing import NamedTuple, Optional, Tuple
 from poker_engine.game_state import GameState
+from poker_engine.player_state import PlayerState
+from poker_engine.chip_ledger import ChipLedger
+from poker_engine.betting_structure import BettingLimit, BettingStructure, NO_LIMIT
 
 
 class ActionType(Enum):
@@ -27,6 +30,122 @@ class ActionType(Enum):
     """Player bets all remaining chips."""
 
 
+class ActionResult(IntEnum):
+    """
+    Outcome of BettingValidator.check_action().
+    
+    OK is 0, so any failure code is truthy.
+    """
+    
+    OK = 0
+    """Action is legal."""
+    
+    NOT_YOUR_TURN = 1
+    """Player is not the one due to act."""
+    
+    CHECK_FACING_BET = 2
+    """Check while there is a bet to call."""
+    
+    WRONG_CALL_AMOUNT = 3
+    """Call amount differs from the chips owed."""
+    
+    CALL_EXCEEDS_STACK = 4
+    """Call costs more than the stack (go all-in instead)."""
+    
+    BET_FACING_BET = 5
+    """Bet after someone has already bet this round."""
+    
+    BET_NOT_POSITIVE = 6
+    """Bet of zero or fewer chips."""
+    
+    BET_EXCEEDS_STACK = 7
+    """Bet larger than the stack."""
+    
+    RAISE_WITHOUT_BET = 8
+    """Raise with no bet to raise."""
+    
+    RAISE_TOO_SMALL = 9
+    """Raise below the minimum raise."""
+    
+    RAISE_EXCEEDS_STACK = 10
+    """Raise larger than the stack."""
+    
+    WRONG_ALL_IN_AMOUNT = 11
+    """All-in amount differs from the stack."""
+    
+    ALL_IN_WITHOUT_CHIPS = 12
+    """All-in with an empty stack."""
+    
+    UNKNOWN_ACTION = 13
+    """Not an ActionType."""
+    
+    BET_WRONG_SIZE = 14
+    """Bet outside the sizes the betting structure allows."""
+    
+    RAISE_TOO_LARGE = 15
+    """Raise above the pot-limit or fixed-limit maximum."""
+    
+    RAISE_CAPPED = 16
+    """Raise after the fixed-limit raise cap was reached."""
+    
+    ALL_IN_EXCEEDS_LIMIT = 17
+    """All-in for more than the largest bet or raise allowed."""
+
+
+class LegalActions(NamedTuple):
+    """
+    Every action a player may take now, with exact amounts.
+    
+    Amounts follow validate_action(): CALL and ALL_IN take exactly
+    call_amount and the stack; BET and RAISE take any amount (chips added)
+    in their closed range. Ranges are 0 when the action is not permitted.
+    Under fixed limit the ranges are single amounts, so the action set is
+    small and fixed.
+    
+    Attributes:
+        actions (Tuple[ActionType, ...]): Permitted actions, in ActionType
+            order. CALL is listed only when there is something to call.
+        call_amount (int): Chips needed to call (0 if nothing to call).
+        min_bet (int): Smallest BET.
+        max_bet (int): Largest BET (the stack, or the limit).
+        min_raise (int): Smallest RAISE (call plus minimum increment).
+        max_raise (int): Largest RAISE (the stack, or the limit).
+        all_in_amount (int): Amount for ALL_IN (the stack).
+    """
+    
+    actions: Tuple["ActionType", ...]
+    call_amount: int
+    min_bet: int
+    max_bet: int
+    min_raise: int
+    max_raise: int
+    all_in_amount: int
+    
+    def allows(self, action: "ActionType", amount: int = 0) -> bool:
+        """
+        Check an action and amount against these limits.
+        
+        Args:
+            action (ActionType): Action to check.
+            amount (int): Amount as passed to validate_action().
+        
+        Returns:
+            bool: True if validate_action() would accept it. That includes
+            a CALL of 0 with nothing to call, which actions lists as CHECK.
+        """
+        if action not in self.actions:
+            return action == ActionType.CALL and amount == self.call_amount == 0
+        if action == ActionType.BET:
+            return self.min_bet <= amount <= self.max_bet
+        if action == ActionType.RAISE:
+            return self.min_raise <= amount <= self.max_raise
+        if action == ActionType.CALL:
+            return amount == self.call_amount
+        if action == ActionType.ALL_IN:
+            return amount == self.all_in_amount
+        return True
+
+
 class InvalidActionError(Exception):
     """Raised when a player attempts an invalid action."""
 
@@ -42,27 +161,92 @@ class BettingValidator:
     This class checks whether a player's action is legal according to poker
     rules. It does NOT modify game state or pot management; it only validates.
     
+    The minimum raise increment follows no-limit rules: the size of the last
+    full bet or raise this round (the big blind until someone bets), read
+    from the game state's BettingRound. Passing min_raise_amount fixes the
+    increment instead.
+    
+    The betting structure bounds bets and raises from above. No-limit
+    allows any amount up to the stack; pot-limit caps a raise at the pot
+    after calling, read in O(1) from the ledger's running pot total;
+    fixed-limit allows exactly one bet size per street and stops raising
+    at the raise cap. All three go through the same bounds check.
+    
     Attributes:
         game_state (GameState): Reference to the current game state.
-        min_raise_amount (int): Minimum amount required to raise (default: big blind).
+        min_raise_amount (int): Fixed minimum raise increment, or the big
+            blind floor when the increment follows the last raise.
+        fixed_min_raise (bool): True if min_raise_amount was given explicitly.
+        betting_structure (BettingStructure): Limit on bet and raise sizes.
+        ledger (Optional[ChipLedger]): Running pot total for pot-limit; the
+            dealer engine keeps this pointed at the current hand's ledger.
     """
     
-    def __init__(self, game_state: GameState, min_raise_amount: Optional[int] = None):
+    def __init__(
+        self,
+        game_state: GameState,
+        min_raise_amount: Optional[int] = None,
+        betting_structure: Optional[BettingStructure] = None,
+        ledger: Optional[ChipLedger] = None,
+    ):
         """
         Initialise the betting validator.
         
         Args:
             game_state (GameState): Reference to the current game state.
-            min_raise_amount (Optional[int]): Minimum raise amount (default: big blind).
+            min_raise_amount (Optional[int]): Fixed minimum raise increment
+                (default: none, use the last raise size).
+            betting_structure (Optional[BettingStructure]): Bet sizing
+                rules (default: no limit).
+            ledger (Optional[ChipLedger]): Ledger to read the pot from
+                (default: none, sum the table's pots and bets).
         
         Raises:
-            ValueError: If game_state is None.
+            ValueError: If game_state is None, or min_raise_amount is given
+                for fixed limit.
         """
         if game_state is None:
             raise ValueError("game_state cannot be None")
+        betting_structure = betting_structure or NO_LIMIT
+        if (
+            min_raise_amount is not None
+            and betting_structure.limit == BettingLimit.FIXED_LIMIT
+        ):
+            raise ValueError("Fixed limit sets its own raise sizes; omit min_raise_amount")
         
         self.game_state = game_state
+        self.fixed_min_raise = min_raise_amount is not None
         self.min_raise_amount = min_raise_amount or game_state.big_blind_amount
+        self.betting_structure = betting_structure
+        self.ledger = ledger
+    
+    def get_min_raise_increment(self) -> int:
+        """
+        Get the smallest legal raise above the current high bet.
+        
+        Returns:
+            int: min_raise_amount if fixed, the street's bet size under
+            fixed limit, otherwise the last full raise size this round.
+        """
+        if self.fixed_min_raise:
+            return self.min_raise_amount
+        if self.betting_structure.limit == BettingLimit.FIXED_LIMIT:
+            return self.betting_structure.bet_size(self.game_state)
+        return self.game_state.betting_round.last_raise_size
+    
+    def get_pot_total(self) -> int:
+        """
+        Get the chips in the pot, including bets this round.
+        
+        Returns:
+            int: The ledger's running total (O(1)), or without a ledger
+            the table's pots plus every current bet.
+        """
+        if self.ledger is not None:
+            return self.ledger.pot_total
+        return self.game_state.get_total_pot() + sum(
+            player.current_bet for player in self.game_state.players
+        )
     
     def is_valid_turn(self, player_id: str) -> bool:
         """
@@ -87,157 +271,280 @@ class BettingValidator:
         
         return player.seat_number == current_player.seat_number
     
-    def validate_action(
+    def check_action(
         self,
         player_id: str,
         action: ActionType,
         amount: int = 0,
-    ) -> None:
+    ) -> "ActionResult":
         """
-        Validate a player's action.
+        Check a player's action without raising or formatting messages.
         
-        Checks turn order, action legality, and bet constraints.
-        Raises InvalidActionError if action is illegal.
+        Performs the same checks as validate_action() and returns the first
+        failure as a code; describe_result() turns a code into the message
+        validate_action() would raise, only when it is wanted.
         
         Args:
             player_id (str): The player making the action.
             action (ActionType): The type of action.
             amount (int): Bet/raise amount (ignored for check/fold/call).
         
-        Raises:
-            NotPlayersTurnError: If it is not this player's turn.
-            InvalidActionError: If the action is illegal.
+        Returns:
+            ActionResult: OK if the action is legal, otherwise why not.
         """
         if not self.is_valid_turn(player_id):
-            raise NotPlayersTurnError(
-                f"Player {player_id} is not the current actor"
-            )
+            return ActionResult.NOT_YOUR_TURN
         
         player = self.game_state.get_player_by_id(player_id)
+        max_bet = self._max_bet()
         
         if action == ActionType.CHECK:
-            self._validate_check(player)
+            if max_bet > player.current_bet:
+                return ActionResult.CHECK_FACING_BET
         elif action == ActionType.FOLD:
-            self._validate_fold(player)
+            pass
         elif action == ActionType.CALL:
-            self._validate_call(player, amount)
+            call_amount = max_bet - player.current_bet
+            if amount != call_amount:
+                return ActionResult.WRONG_CALL_AMOUNT
+            if call_amount > player.stack:
+                return ActionResult.CALL_EXCEEDS_STACK
         elif action == ActionType.BET:
-            self._validate_bet(player, amount)
+            if max_bet > 0:
+                return ActionResult.BET_FACING_BET
+            if amount <= 0:
+                return ActionResult.BET_NOT_POSITIVE
+            if amount > player.stack:
+                return ActionResult.BET_EXCEEDS_STACK
+            low, high = self._bet_limits(player, max_bet)
+            if not low <= amount <= high:
+                return ActionResult.BET_WRONG_SIZE
         elif action == ActionType.RAISE:
-            self._validate_raise(player, amount)
+            if max_bet == 0:
+                return ActionResult.RAISE_WITHOUT_BET
+            low, high = self._bet_limits(player, max_bet)
+            if high < low:
+                return ActionResult.RAISE_CAPPED
+            total = player.current_bet + amount
+            if total < low:
+                return ActionResult.RAISE_TOO_SMALL
+            if amount > player.stack:
+                return ActionResult.RAISE_EXCEEDS_STACK
+            if total > high:
+                return ActionResult.RAISE_TOO_LARGE
         elif action == ActionType.ALL_IN:
-            self._validate_all_in(player, amount)
+            if amount != player.stack:
+                return ActionResult.WRONG_ALL_IN_AMOUNT
+            if amount <= 0:
+                return ActionResult.ALL_IN_WITHOUT_CHIPS
+            total = player.current_bet + amount
+            if total > max_bet and total > self._bet_limits(player, max_bet)[1]:
+                return ActionResult.ALL_IN_EXCEEDS_LIMIT
         else:
-            raise InvalidActionError(f"Unknown action type: {action}")
-    
-    def _validate_check(self, player) -> None:
-        """
-        Validate a check action.
-
-        Only valid if the player has no unmatched bet to call this round.
-        A player who has already matched the maximum bet (e.g., the BB when
-        no one has raised) may always check.
-        """
-        active_players = self.game_state.get_active_players()
-        max_bet = max(p.current_bet for p in active_players) if active_players else 0
-
-        if max_bet > player.current_bet:
-            raise InvalidActionError(
-                f"Cannot check; current bet is {max_bet}"
-            )
+            return ActionResult.UNKNOWN_ACTION
+        return ActionResult.OK
     
-    def _validate_fold(self, player) -> None:
+    def describe_result(
+        self,
+        result: "ActionResult",
+        player_id: str,
+        action: ActionType,
+        amount: int = 0,
+    ) -> str:
         """
-        Validate a fold action.
+        Format the message for a check_action() result.
         
-        Fold is always valid (can be played anytime).
-        """
-        pass
-    
-    def _validate_call(self, player, amount: int) -> None:
-        """
-        Validate a call action.
+        Must be called before the state changes, as messages quote the
+        current bet and stack.
+        
+        Args:
+            result (ActionResult): Code returned by check_action().
+            player_id (str): The player who attempted the action.
+            action (ActionType): The attempted action.
+            amount (int): The attempted amount.
         
-        Call amount must equal the highest bet in the current round.
+        Returns:
+            str: Human-readable reason (empty for OK).
         """
-        active_players = self.game_state.get_active_players()
-        max_bet = max(p.current_bet for p in active_players) if active_players else 0
-        call_amount = max_bet - player.current_bet
+        if result == ActionResult.OK:
+            return ""
+        if result == ActionResult.NOT_YOUR_TURN:
+            return f"Player {player_id} is not the current actor"
+        if result == ActionResult.UNKNOWN_ACTION:
+            return f"Unknown action type: {action}"
         
-        if amount != call_amount:
-            raise InvalidActionError(
-                f"Call amount must be {call_amount}, got {amount}"
+        player = self.game_state.get_player_by_id(player_id)
+        max_bet = self._max_bet()
+        if result == ActionResult.CHECK_FACING_BET:
+            return f"Cannot check; current bet is {max_bet}"
+        if result == ActionResult.WRONG_CALL_AMOUNT:
+            return f"Call amount must be {max_bet - player.current_bet}, got {amount}"
+        if result == ActionResult.CALL_EXCEEDS_STACK:
+            return (
+                f"Call amount {max_bet - player.current_bet} exceeds stack {player.stack}"
+            )
+        if result == ActionResult.BET_FACING_BET:
+            return f"Cannot bet; someone has already bet {max_bet}"
+        if result == ActionResult.BET_NOT_POSITIVE:
+            return f"Bet amount must be positive, got {amount}"
+        if result == ActionResult.BET_EXCEEDS_STACK:
+            return f"Bet amount {amount} exceeds stack {player.stack}"
+        if result == ActionResult.RAISE_WITHOUT_BET:
+            return "Cannot raise; no bet to raise yet"
+        if result == ActionResult.RAISE_CAPPED:
+            return (
+                f"Cannot raise; betting is capped at "
+                f"{self.betting_structure.raise_cap} bets this round"
             )
+        if result == ActionResult.RAISE_EXCEEDS_STACK:
+            return f"Raise amount {amount} exceeds stack {player.stack}"
+        if result == ActionResult.WRONG_ALL_IN_AMOUNT:
+            return f"All-in amount must equal remaining stack {player.stack}, got {amount}"
+        if result == ActionResult.ALL_IN_WITHOUT_CHIPS:
+            return "Cannot go all-in with zero chips"
         
-        if call_amount > player.stack:
-            raise InvalidActionError(
-                f"Call amount {call_amount} exceeds stack {player.stack}"
+        low, high = self._bet_limits(player, max_bet)
+        limit = self.betting_structure.limit.value
+        if result == ActionResult.BET_WRONG_SIZE:
+            if low == high:
+                return f"Bet must be {low} under {limit}, got {amount}"
+            return f"Bet must be between {low} and {high} under {limit}, got {amount}"
+        if result == ActionResult.RAISE_TOO_SMALL:
+            return f"Raise must be at least {low}, got {player.current_bet + amount}"
+        if result == ActionResult.RAISE_TOO_LARGE:
+            return (
+                f"Raise must be at most {high} under {limit}, "
+                f"got {player.current_bet + amount}"
             )
+        return (
+            f"All-in to {player.current_bet + amount} exceeds the {limit} "
+            f"maximum of {high}"
+        )
     
-    def _validate_bet(self, player, amount: int) -> None:
-        """
-        Validate a bet action.
-        
-        Bet is only valid if no one has bet this round yet.
-        Amount must be positive and <= stack.
+    def validate_action(
+        self,
+        player_id: str,
+        action: ActionType,
+        amount: int = 0,
+    ) -> None:
         """
-        active_players = self.game_state.get_active_players()
-        max_bet = max(p.current_bet for p in active_players) if active_players else 0
+        Validate a player's action.
         
-        if max_bet > 0:
-            raise InvalidActionError(
-                f"Cannot bet; someone has already bet {max_bet}"
-            )
+        Checks turn order, action legality, and bet constraints.
+        Raises InvalidActionError if action is illegal. A wrapper over
+        check_action() for callers that prefer exceptions.
         
-        if amount <= 0:
-            raise InvalidActionError(
-                f"Bet amount must be positive, got {amount}"
-            )
+        Args:
+            player_id (str): The player making the action.
+            action (ActionType): The type of action.
+            amount (int): Bet/raise amount (ignored for check/fold/call).
         
-        if amount > player.stack:
-            raise InvalidActionError(
-                f"Bet amount {amount} exceeds stack {player.stack}"
-            )
+        Raises:
+            NotPlayersTurnError: If it is not this player's turn.
+            InvalidActionError: If the action is illegal.
+        """
+        result = self.check_action(player_id, action, amount)
+        if result != ActionResult.OK:
+            raise self.error_for(result, player_id, action, amount)
     
-    def _validate_raise(self, player, amount: int) -> None:
+    def error_for(
+        self,
+        result: "ActionResult",
+        player_id: str,
+        action: ActionType,
+        amount: int = 0,
+    ) -> Exception:
         """
-        Validate a raise action.
+        Build the exception validate_action() raises for a failed result.
         
-        Raise amount must be >= min_raise_amount and <= stack.
-        Must be more than the current highest bet.
+        Args:
+            result (ActionResult): Failure code from check_action().
+            player_id (str): The player who attempted the action.
+            action (ActionType): The attempted action.
+            amount (int): The attempted amount.
+        
+        Returns:
+            Exception: NotPlayersTurnError or InvalidActionError.
+        """
+        message = self.describe_result(result, player_id, action, amount)
+        if result == ActionResult.NOT_YOUR_TURN:
+            return NotPlayersTurnError(message)
+        return InvalidActionError(message)
+    
+    def legal_actions(self, player_id: str) -> LegalActions:
         """
-        active_players = self.game_state.get_active_players()
-        max_bet = max(p.current_bet for p in active_players) if active_players else 0
+        Enumerate the actions validate_action() would accept from a player.
         
-        if max_bet == 0:
-            raise InvalidActionError(
-                "Cannot raise; no bet to raise yet"
-            )
+        Reads the player's stack and bet and the round aggregates once, so
+        callers can choose a legal action instead of trying and catching
+        InvalidActionError.
         
-        raise_total = player.current_bet + amount
+        Args:
+            player_id (str): The player due to act.
         
-        if raise_total < max_bet + self.min_raise_amount:
-            raise InvalidActionError(
-                f"Raise must be at least {max_bet + self.min_raise_amount}, got {raise_total}"
-            )
+        Returns:
+            LegalActions: Permitted actions and amount ranges.
         
-        if amount > player.stack:
-            raise InvalidActionError(
-                f"Raise amount {amount} exceeds stack {player.stack}"
+        Raises:
+            NotPlayersTurnError: If it is not this player's turn.
+        """
+        if not self.is_valid_turn(player_id):
+            raise NotPlayersTurnError(
+                f"Player {player_id} is not the current actor"
             )
+        
+        player = self.game_state.get_player_by_id(player_id)
+        stack = player.stack
+        max_bet = self._max_bet()
+        call_amount = max(0, max_bet - player.current_bet)
+        
+        low, high = self._bet_limits(player, max_bet)
+        low -= player.current_bet
+        high = min(high - player.current_bet, stack)
+        
+        actions = []
+        min_bet = bet_limit = min_raise = raise_limit = 0
+        if call_amount == 0:
+            actions.append(ActionType.CHECK)
+        actions.append(ActionType.FOLD)
+        if 0 < call_amount <= stack:
+            actions.append(ActionType.CALL)
+        if max_bet == 0 and 0 < low <= high:
+            actions.append(ActionType.BET)
+            min_bet, bet_limit = low, high
+        if max_bet > 0 and low <= high:
+            actions.append(ActionType.RAISE)
+            min_raise, raise_limit = low, high
+        if stack > 0 and (stack <= call_amount or stack <= high):
+            actions.append(ActionType.ALL_IN)
+        
+        return LegalActions(
+            tuple(actions), call_amount, min_bet, bet_limit, min_raise, raise_limit, stack
+        )
     
-    def _validate_all_in(self, player, amount: int) -> None:
+    def _max_bet(self) -> int:
+        """Return the highest current bet this round."""
+        return self.game_state.betting_round.high_bet
+    
+    def _bet_limits(self, player: PlayerState, max_bet: int) -> Tuple[int, int]:
         """
-        Validate an all-in action.
+        Return the smallest and largest total bet a bet or raise may reach.
         
-        Amount must equal the player's remaining stack.
+        The stack is the only upper bound under no limit. Only the
+        fixed-limit cap makes the largest total smaller than the smallest;
+        it is then max_bet, which an all-in may only call.
         """
-        if amount != player.stack:
-            raise InvalidActionError(
-                f"All-in amount must equal remaining stack {player.stack}, got {amount}"
-            )
+        structure = self.betting_structure
+        if structure.limit == BettingLimit.FIXED_LIMIT:
+            size = structure.bet_size(self.game_state)
+            if max_bet // size >= structure.raise_cap:
+                return max_bet + size, max_bet
+            return max_bet + size, max_bet + size
         
-        if amount <= 0:
-            raise InvalidActionError(
-                "Cannot go all-in with zero chips"
-            )
+        low = max_bet + self.get_min_raise_increment() if max_bet > 0 else 1
+        if structure.limit == BettingLimit.POT_LIMIT:
+            # Raise to the pot after calling: high bet + pot + call
+            high = 2 * max_bet - player.current_bet + self.get_pot_total()
+        else:
+            high = player.current_bet + player.stack
+        return low, max(low, high)
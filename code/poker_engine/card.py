@@ -10,6 +10,7 @@ class Card:
     SPADES = "spades"
     
     SUITS = [HEARTS, DIAMONDS, CLUBS, SPADES]
+    SUIT_VALUES = {suit: i for i, suit in enumerate(SUITS)}
     
     # Rank constants (ordered by value, lowest to highest)
     RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
@@ -60,3 +61,34 @@ class Card:
             int: 0-12 (2=0, 3=1, ..., A=12)
         """
         return self.RANK_VALUES[self.rank]
+    
+    def get_index(self):
+        """
+        Get the position of this card in a 52-card deck.
+        
+        Cards are ordered by suit (SUITS order) then rank, so bit
+        ``get_index()`` of a 52-bit mask identifies this card.
+        
+        Returns:
+            int: 0-51 (suit_value * 13 + rank_value)
+        """
+        return self.SUIT_VALUES[self.suit] * 13 + self.RANK_VALUES[self.rank]
+    
+    @classmethod
+    def from_index(cls, index):
+        """
+        Build the card at a deck position (inverse of get_index()).
+        
+        Args:
+            index (int): 0-51
+            
+        Returns:
+            Card: The card at that position.
+            
+        Raises:
+            ValueError: If index is outside 0-51
+        """
+        if not 0 <= index < 52:
+            raise ValueError(f"Invalid card index: {index}")
+        suit_value, rank_value = divmod(index, 13)
+        return cls(cls.SUITS[suit_value], cls.RANKS[rank_value])
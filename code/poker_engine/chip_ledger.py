@@ -0,0 +1,303 @@
+"""Append-only record of every chip movement in a hand."""
+
+from array import array
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+
+
+class LedgerEntryKind(IntEnum):
+    """Kind of chip movement."""
+
+    BLIND = 0
+    """Forced bet moved from a stack into the pot."""
+
+    BET = 1
+    """Voluntary call, bet, raise or all-in moved into the pot."""
+
+    AWARD = 2
+    """Pot chips paid out to a player."""
+
+
+class ChipLedger:
+    """
+    Array-backed ledger of chip movements for one hand.
+
+    Each entry is (player index, street, amount, kind), stored in parallel
+    typed arrays. Running totals are updated as entries are appended, so
+    per-player contributions, the chips currently in the pot and each
+    player's expected stack are all O(1) reads.
+
+    Attributes:
+        player_ids (List[str]): Player for each index.
+        starting_stacks (List[int]): Stack of each player when the hand began.
+        contributions (List[int]): Chips each player has put in the pot.
+        awards (List[int]): Chips each player has been paid from the pot.
+        total_contributed (int): Sum of contributions.
+        total_awarded (int): Sum of awards.
+    """
+
+    def __init__(
+        self,
+        player_ids: List[str],
+        starting_stacks: Optional[List[int]] = None,
+    ):
+        """
+        Initialise an empty ledger.
+
+        Args:
+            player_ids (List[str]): Players in seat order.
+            starting_stacks (Optional[List[int]]): Stacks at hand start
+                (default: zeros, when only contributions are tracked).
+
+        Raises:
+            ValueError: If starting_stacks length differs from player_ids.
+        """
+        if starting_stacks is not None and len(starting_stacks) != len(player_ids):
+            raise ValueError(
+                f"Expected {len(player_ids)} starting stacks, got {len(starting_stacks)}"
+            )
+
+        self.player_ids = list(player_ids)
+        self.starting_stacks = (
+            list(starting_stacks) if starting_stacks is not None else [0] * len(player_ids)
+        )
+        self._index: Dict[str, int] = {pid: i for i, pid in enumerate(self.player_ids)}
+
+        self._players = array("B")
+        self._streets = array("B")
+        self._amounts = array("q")
+        self._kinds = array("B")
+
+        self.contributions = [0] * len(self.player_ids)
+        self.awards = [0] * len(self.player_ids)
+        self.total_contributed = 0
+        self.total_awarded = 0
+
+    def reset(self, starting_stacks: Optional[List[int]] = None) -> None:
+        """
+        Empty the ledger for a new hand between the same players.
+        
+        The typed arrays and total lists are cleared in place, so a table
+        reuses one ledger for every hand.
+        
+        Args:
+            starting_stacks (Optional[List[int]]): Stacks at hand start
+                (default: zeros).
+        
+        Raises:
+            ValueError: If starting_stacks length differs from player_ids.
+        """
+        count = len(self.player_ids)
+        if starting_stacks is not None and len(starting_stacks) != count:
+            raise ValueError(
+                f"Expected {count} starting stacks, got {len(starting_stacks)}"
+            )
+        # Replaced, not updated in place: snapshot() tokens share the list
+        self.starting_stacks = (
+            list(starting_stacks) if starting_stacks is not None else [0] * count
+        )
+        del self._players[:]
+        del self._streets[:]
+        del self._amounts[:]
+        del self._kinds[:]
+        self.contributions[:] = [0] * count
+        self.awards[:] = [0] * count
+        self.total_contributed = 0
+        self.total_awarded = 0
+    
+    def index_of(self, player_id: str) -> int:
+        """
+        Get the ledger index of a player.
+
+        Args:
+            player_id (str): Player's ID.
+
+        Returns:
+            int: Index into player_ids.
+
+        Raises:
+            ValueError: If player_id is not in the ledger.
+        """
+        index = self._index.get(player_id)
+        if index is None:
+            raise ValueError(f"Player {player_id} not in this game")
+        return index
+
+    def record(
+        self,
+        player_index: int,
+        street: int,
+        amount: int,
+        kind: LedgerEntryKind,
+    ) -> None:
+        """
+        Append a chip movement and update running totals.
+
+        Args:
+            player_index (int): Index of the player moving chips.
+            street (int): Betting round (0 = pre-flop ... 3 = river, 4 = showdown).
+            amount (int): Chips moved (must be positive).
+            kind (LedgerEntryKind): BLIND, BET or AWARD.
+
+        Raises:
+            ValueError: If amount <= 0, or an award exceeds the pot.
+        """
+        if amount <= 0:
+            raise ValueError(f"Ledger amount must be positive: {amount}")
+
+        if kind == LedgerEntryKind.AWARD:
+            if amount > self.pot_total:
+                raise ValueError(
+                    f"Award {amount} exceeds chips in pot {self.pot_total}"
+                )
+            self.awards[player_index] += amount
+            self.total_awarded += amount
+        else:
+            self.contributions[player_index] += amount
+            self.total_contributed += amount
+
+        self._players.append(player_index)
+        self._streets.append(street)
+        self._amounts.append(amount)
+        self._kinds.append(kind)
+
+    def pop(self) -> None:
+        """
+        Remove the most recent entry and reverse its running totals.
+        
+        Raises:
+            IndexError: If the ledger is empty.
+        """
+        player_index = self._players.pop()
+        self._streets.pop()
+        amount = self._amounts.pop()
+        if self._kinds.pop() == LedgerEntryKind.AWARD:
+            self.awards[player_index] -= amount
+            self.total_awarded -= amount
+        else:
+            self.contributions[player_index] -= amount
+            self.total_contributed -= amount
+    
+    @property
+    def pot_total(self) -> int:
+        """Chips contributed and not yet awarded."""
+        return self.total_contributed - self.total_awarded
+
+    def expected_stack(self, player_index: int) -> int:
+        """
+        Stack a player should hold given the ledger.
+
+        Args:
+            player_index (int): Player index.
+
+        Returns:
+            int: Starting stack - contributions + awards.
+        """
+        return (
+            self.starting_stacks[player_index]
+            - self.contributions[player_index]
+            + self.awards[player_index]
+        )
+
+    def find_discrepancies(self, stacks: Dict[str, int]) -> List[str]:
+        """
+        Compare actual stacks against the ledger.
+
+        Args:
+            stacks (Dict[str, int]): Actual stack per player_id.
+
+        Returns:
+            List[str]: Descriptions of mismatches (empty if consistent).
+        """
+        violations = []
+        for i, player_id in enumerate(self.player_ids):
+            expected = self.expected_stack(i)
+            actual = stacks.get(player_id)
+            if actual is not None and actual != expected:
+                violations.append(
+                    f"Ledger mismatch: {player_id} stack={actual}, ledger={expected}"
+                )
+        return violations
+
+    def snapshot(self) -> Tuple:
+        """
+        Capture the entries and running totals.
+        
+        Returns:
+            Tuple: Opaque token for restore(); the typed arrays are copied
+            with a single buffer copy each.
+        """
+        return (
+            self._players[:],
+            self._streets[:],
+            self._amounts[:],
+            self._kinds[:],
+            tuple(self.contributions),
+            tuple(self.awards),
+            self.total_contributed,
+            self.total_awarded,
+            self.starting_stacks,
+        )
+    
+    def restore(self, token: Tuple) -> None:
+        """
+        Return the ledger to a snapshot() of itself.
+        
+        Args:
+            token (Tuple): Value returned by snapshot().
+        """
+        (
+            players, streets, amounts, kinds,
+            contributions, awards, self.total_contributed, self.total_awarded,
+            self.starting_stacks,
+        ) = token
+        self._players[:] = players
+        self._streets[:] = streets
+        self._amounts[:] = amounts
+        self._kinds[:] = kinds
+        self.contributions[:] = contributions
+        self.awards[:] = awards
+    
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._amounts)
+
+    def to_dict(self) -> Dict:
+        """
+        Serialise the ledger for a hand history.
+
+        Returns:
+            Dict: 'player_ids', 'starting_stacks' and 'entries', where each
+            entry is [player_index, street, amount, kind].
+        """
+        return {
+            "player_ids": list(self.player_ids),
+            "starting_stacks": list(self.starting_stacks),
+            "entries": [
+                [self._players[i], self._streets[i], self._amounts[i], self._kinds[i]]
+                for i in range(len(self._amounts))
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ChipLedger":
+        """
+        Rebuild a ledger (and its running totals) from to_dict() output.
+
+        Args:
+            data (Dict): Serialised ledger.
+
+        Returns:
+            ChipLedger: Equivalent ledger.
+        """
+        ledger = cls(data["player_ids"], data["starting_stacks"])
+        for player_index, street, amount, kind in data["entries"]:
+            ledger.record(player_index, street, amount, LedgerEntryKind(kind))
+        return ledger
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"ChipLedger(entries={len(self)}, pot={self.pot_total}, "
+            f"contributed={self.total_contributed}, awarded={self.total_awarded})"
+        )
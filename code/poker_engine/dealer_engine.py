@@ -1,18 +1,70 @@
 """Dealer engine orchestrating all poker game components."""
 
+from collections import deque
+from itertools import islice
 from enum import Enum
-from typing import Optional, List, Dict, Tuple
+from typing import Callable, Optional, List, Dict, Mapping, NamedTuple, Tuple, Union
 import logging
+import random
 
+from poker_engine.card import Card
+from poker_engine.deck import Deck
 from poker_engine.game_state import GameState, GamePhase
 from poker_engine.player_state import PlayerState, PlayerStatus, RoundStatus
-from poker_engine.betting_validator import BettingValidator, ActionType
+from poker_engine.betting_validator import (
+    BettingValidator,
+    ActionType,
+    ActionResult,
+    LegalActions,
+    InvalidActionError,
+    NotPlayersTurnError,
+)
+from poker_engine.betting_structure import BettingStructure
 from poker_engine.pot_manager import PotManager
+from poker_engine.chip_ledger import ChipLedger, LedgerEntryKind
+from poker_engine.deck import FULL_DECK
+from poker_engine.hand_log import (
+    HandLog,
+    EventKind,
+    ACTIONS,
+    ACTION_CODES,
+    BOARD_SEAT,
+    RUNOUT_SEAT,
+)
 from poker_engine.winner_determiner import WinnerDeterminer
 from poker_engine.hand_evaluator import HandEvaluator
+from poker_engine.evaluation_cache import EvaluationCache
+from poker_engine.equity import expected_winnings, DEFAULT_MAX_RUNOUTS
+from poker_engine.zobrist import ZobristKeys, DEFAULT_KEYS
+from poker_engine.table_view import SeatView, TableView
 
 logger = logging.getLogger(__name__)
 
+# Phases in which players bet; completing one of these can auto-advance
+BETTING_PHASES = frozenset(
+    (GamePhase.PRE_FLOP, GamePhase.FLOP, GamePhase.TURN, GamePhase.RIVER)
+)
+
+# Ledger street index for each phase (blinds count as pre-flop)
+STREET_INDEX = {
+    GamePhase.WAITING_FOR_PLAYERS: 0,
+    GamePhase.GAME_STARTED: 0,
+    GamePhase.BLINDS_POSTED: 0,
+    GamePhase.PRE_FLOP: 0,
+    GamePhase.FLOP: 1,
+    GamePhase.TURN: 2,
+    GamePhase.RIVER: 3,
+    GamePhase.SHOWDOWN: 4,
+    GamePhase.POT_DISTRIBUTION: 4,
+    GamePhase.HAND_COMPLETE: 4,
+}
+
+# Community cards dealt on reaching each phase (Texas Hold'em)
+BOARD_CARDS = {GamePhase.FLOP: 3, GamePhase.TURN: 1, GamePhase.RIVER: 1}
+
+# Change records kept for get_game_state_delta()
+DEFAULT_CHANGE_LOG_SIZE = 128
+
 
 class GameType(Enum):
     """Supported poker variants."""
@@ -24,6 +76,103 @@ class GameType(Enum):
     """Five-card draw: no community cards, 5-card hand."""
 
 
+# Hole cards dealt to each player per variant
+HOLE_CARDS = {GameType.TEXAS_HOLDEM: 2, GameType.FIVE_CARD_DRAW: 5}
+
+# Called by DealerEngine.play_hand() for each decision
+Agent = Callable[["DealerEngine", PlayerState, LegalActions], Tuple[ActionType, int]]
+
+
+class EngineSnapshot(NamedTuple):
+    """
+    Flat copy of a DealerEngine's mutable state (see DealerEngine.snapshot).
+    
+    Attributes:
+        game_state (Tuple): GameState.snapshot() token.
+        pot_manager (PotManager): Pot manager of the hand when captured.
+        pots (Tuple): PotManager.snapshot() token.
+        deck (Optional[Tuple]): Deck.snapshot() token (None without a deck).
+        hand_log (Tuple): HandLog.snapshot() token.
+        table_hash (int): Zobrist hash without the turn term.
+        seat_hashes (Tuple[int, ...]): Each seat's stack/bet/status term.
+    """
+    
+    game_state: Tuple
+    pot_manager: PotManager
+    pots: Tuple
+    deck: Optional[Tuple]
+    hand_log: Tuple
+    table_hash: int
+    seat_hashes: Tuple[int, ...]
+
+
+class UndoRecord(NamedTuple):
+    """
+    What one DealerEngine.apply() changed (see DealerEngine.undo).
+    
+    Attributes:
+        seat (int): Seat that acted (and acts again after undo).
+        chips (int): Chips moved from the stack into the pot (the stack
+            and bet delta; also whether a ledger entry was appended).
+        status (PlayerStatus): Actor's status before the action.
+        round_status (RoundStatus): Actor's round status before the action.
+        high_bet (int): Round high bet before the action.
+        last_raise_size (int): Round minimum raise before the action.
+        aggressor_seat (Optional[int]): Round aggressor before the action.
+        pending_mask (int): Seats still to act before the action.
+        next_seat (Optional[int]): Seat due to act after the action.
+        others_round_status (Optional[Tuple[RoundStatus, ...]]): Every
+            player's round status before a RAISE re-opened action, else None.
+        folded (bool): The action was a fold.
+        went_all_in (bool): The action was an all-in.
+        table_hash (int): Engine's table hash before the action.
+        seat_hashes (Union[int, Tuple[int, ...]]): Actor's seat hash term
+            before the action, or every seat's term for a RAISE.
+    """
+    
+    seat: int
+    chips: int
+    status: PlayerStatus
+    round_status: RoundStatus
+    high_bet: int
+    last_raise_size: int
+    aggressor_seat: Optional[int]
+    pending_mask: int
+    next_seat: Optional[int]
+    others_round_status: Optional[Tuple[RoundStatus, ...]]
+    folded: bool
+    went_all_in: bool
+    table_hash: int
+    seat_hashes: Union[int, Tuple[int, ...]]
+
+
+class StateChange(NamedTuple):
+    """
+    One versioned change to the table (see DealerEngine.get_game_state_delta).
+    
+    Only the seats touched and the scalar values from before the change are
+    kept; deltas read everything else from the live table.
+    
+    Attributes:
+        version (int): state_version after the change.
+        seat_mask (int): Bit per seat whose stack, bet, status or cards changed.
+        phase_before (GamePhase): Phase before the change.
+        action_before (Optional[int]): Seat due to act before the change.
+        pot_before (int): Pot total before the change.
+        board_before (int): Community cards before the change.
+        board_replaced (bool): The board was swapped rather than dealt to
+            (restore() or load_bytes()), so a delta resends all of it.
+    """
+    
+    version: int
+    seat_mask: int
+    phase_before: GamePhase
+    action_before: Optional[int]
+    pot_before: int
+    board_before: int
+    board_replaced: bool
+
+
 class DealerEngine:
     """
     Orchestrates poker game flow and state management.
@@ -36,9 +185,11 @@ class DealerEngine:
       * PotManager: pot and side pot tracking
       * WinnerDeterminer: hand comparison and pot distribution
     
+    Given a Deck, the engine also deals: hole cards on start_hand() and
+    the board on advance_round(). Without one the caller deals.
+    
     Does NOT handle:
     - AI strategy (bot responsibility)
-    - Card dealing (game coordinator responsibility)
     - Network communication (platform responsibility)
     
     Attributes:
@@ -46,7 +197,25 @@ class DealerEngine:
         betting_validator (BettingValidator): Action validator.
         pot_manager (PotManager): Pot and side pot manager.
         winner_determiner (WinnerDeterminer): Hand evaluator and distribution.
+        ledger (ChipLedger): Every chip movement in the current hand.
+        hand_log (HandLog): Every event of the current hand: cards dealt,
+            blinds, actions, streets, showdown and awards. See replay().
+        deck (Optional[Deck]): Deck the engine deals from, if it deals.
         game_type (GameType): Variant being played.
+        auto_advance (bool): Advance to the next phase as soon as an action
+            completes a betting round.
+        zobrist_keys (ZobristKeys): Keys behind state_hash.
+        state_version (int): Bumped by every engine call that changes the
+            table; see get_game_state_delta().
+        track_changes (bool): Keep the change log behind
+            get_game_state_delta(); see __init__.
+        published (Optional[TableView]): Immutable view of the table at
+            state_version, replaced (never modified) on each change. Safe to
+            read from other threads without locking. None unless
+            publish_views is set.
+        publish_views (bool): Keep published current; see __init__.
+            Turning it on publishes a view of every seat, and turning it
+            off clears published.
     """
     
     def __init__(
@@ -55,7 +224,16 @@ class DealerEngine:
         players: List[PlayerState],
         small_blind_amount: int,
         big_blind_amount: int,
-        game_id: str = "game_001"
+        game_id: str = "game_001",
+        evaluation_cache: Optional[EvaluationCache] = None,
+        auto_advance: bool = False,
+        zobrist_keys: Optional[ZobristKeys] = None,
+        change_log_size: int = DEFAULT_CHANGE_LOG_SIZE,
+        track_changes: bool = False,
+        publish_views: bool = False,
+        trusted: bool = False,
+        betting_structure: Optional[BettingStructure] = None,
+        deck: Optional[Deck] = None,
     ):
         """
         Initialise the dealer engine.
@@ -66,6 +244,32 @@ class DealerEngine:
             small_blind_amount (int): Small blind stake.
             big_blind_amount (int): Big blind stake.
             game_id (str): Unique game identifier.
+            evaluation_cache (Optional[EvaluationCache]): Shared hand-strength
+                cache for showdowns (default: none, evaluate every time).
+            auto_advance (bool): Call advance_round() automatically when an
+                action completes the betting round (default: False; the
+                caller advances, e.g. after dealing community cards).
+            zobrist_keys (Optional[ZobristKeys]): Keys for state_hash
+                (default: DEFAULT_KEYS, shared by every engine).
+            change_log_size (int): Changes kept for get_game_state_delta();
+                older versions get a full state instead.
+            track_changes (bool): Record changes for get_game_state_delta()
+                (default: False). Consumers that poll for deltas turn it
+                on; without it every mutating call just bumps state_version
+                and deltas fall back to the full state, so search and
+                replay pay nothing for change tracking.
+            publish_views (bool): Maintain published (default: False). Turn
+                on for tables read from other threads, e.g. by spectators;
+                search and replay engines leave it off and build no views.
+            trusted (bool): Accept actions without full validation by
+                default (default: False). Only for in-process callers that
+                submit legal actions, e.g. bots choosing from legal_actions;
+                see process_action().
+            betting_structure (Optional[BettingStructure]): No-limit,
+                pot-limit or fixed-limit bet sizing (default: no limit).
+            deck (Optional[Deck]): Deck to deal every hand from; start_hand()
+                shuffles it (default: none, the caller deals with
+                deal_hole_cards() and reveal_community_card()).
         
         Raises:
             ValueError: If parameters invalid.
@@ -76,10 +280,15 @@ class DealerEngine:
             raise ValueError(
                 f"Big blind {big_blind_amount} must exceed small blind {small_blind_amount}"
             )
+        if change_log_size <= 0:
+            raise ValueError(f"change_log_size must be positive, got {change_log_size}")
         
         self.game_type = game_type
+        self.auto_advance = auto_advance
+        self.trusted = trusted
         self.small_blind_amount = small_blind_amount
         self.big_blind_amount = big_blind_amount
+        self.deck = deck
         
         # Initialise core components
         self.game_state = GameState(
@@ -89,17 +298,45 @@ class DealerEngine:
             big_blind_amount=big_blind_amount
         )
         
-        self.betting_validator = BettingValidator(
-            self.game_state,
-            min_raise_amount=big_blind_amount
+        self.ledger = self._new_ledger()
+        self.game_state.ledger = self.ledger
+        self.hand_log = HandLog(
+            [p.player_id for p in players],
+            [p.stack for p in players],
+            self.game_state.dealer_button
         )
-        
         self.pot_manager = PotManager(
-            active_player_ids=[p.player_id for p in players]
+            active_player_ids=[p.player_id for p in players],
+            ledger=self.ledger
+        )
+        
+        # No fixed minimum: raises must match the last raise increment
+        self.betting_validator = BettingValidator(
+            self.game_state,
+            betting_structure=betting_structure,
+            ledger=self.ledger
         )
         
         hand_evaluator = HandEvaluator()
-        self.winner_determiner = WinnerDeterminer(hand_evaluator)
+        self.winner_determiner = WinnerDeterminer(hand_evaluator, evaluation_cache)
+        
+        self.zobrist_keys = zobrist_keys or DEFAULT_KEYS
+        self._seat_hashes: List[int] = []
+        self._table_hash = 0
+        self.rehash()
+        
+        # Bounded change log; the values below are the table as last recorded
+        self.state_version = 0
+        self._changes: deque = deque(maxlen=change_log_size)
+        self._dirty_seats = 0
+        self._recorded_phase = self.game_state.current_phase
+        self._recorded_action = self.game_state.current_action_player
+        self._recorded_pot = 0
+        self._recorded_board = 0
+        self._track_changes = track_changes
+        self.published: Optional[TableView] = None
+        self._publish_views = False
+        self.publish_views = publish_views
         
         logger.info(
             f"Dealer engine initialised: game_id={game_id}, "
@@ -110,28 +347,79 @@ class DealerEngine:
     # HAND LIFECYCLE
     # =========================================================================
     
-    def start_hand(self) -> None:
+    def start_hand(
+        self,
+        stacks: Optional[Dict[str, int]] = None,
+        button: Optional[int] = None
+    ) -> None:
         """
         Initialise a new hand.
         
         Resets player states, posts blinds, and transitions to PRE_FLOP.
+        With a deck, also shuffles it and deals hole cards to every player
+        in the hand, in seat order. One engine can play any number of
+        hands: every component is reset in place rather than rebuilt,
+        stacks carry forward from the last hand, and the button moves to
+        the next player with chips. Players with no chips sit the hand out.
+        
+        Args:
+            stacks (Optional[Dict[str, int]]): Stack per player_id to start
+                this hand with (default: keep the current stacks).
+            button (Optional[int]): Seat to put the button on (default: move
+                it on from the last hand).
         
         Raises:
-            ValueError: If fewer than 2 players with chips.
+            ValueError: If a stack is for an unknown player or negative, the
+                button seat does not exist, or fewer than 2 players have
+                chips.
         """
+        game_state = self.game_state
+        if button is not None and not 0 <= button < len(game_state.players):
+            raise ValueError(f"No seat {button} for the button")
+        if stacks:
+            for player_id, stack in stacks.items():
+                player = game_state.get_player_by_id(player_id)
+                if player is None:
+                    raise ValueError(f"Player {player_id} not in this game")
+                if stack < 0:
+                    raise ValueError(f"Stack cannot be negative: {player_id}={stack}")
+                player.stack = stack
+        
         # Reset game state for new hand
-        self.game_state.reset_for_new_hand()
+        game_state.reset_for_new_hand(button)
+        if game_state.count_active_players() < 2:
+            raise ValueError(
+                f"Need 2 players with chips, got {game_state.count_active_players()}"
+            )
         
-        # Reinitialise pot manager
-        active_ids = [p.player_id for p in self.game_state.get_active_players()]
-        self.pot_manager = PotManager(active_ids)
+        # Reset the ledger, hand log and pot manager in place
+        active_ids = [p.player_id for p in game_state.active_players]
+        starting_stacks = [p.stack for p in game_state.players]
+        self.ledger.reset(starting_stacks)
+        self.hand_log.reset(starting_stacks, game_state.dealer_button)
+        self.pot_manager.reset(active_ids)
         
-        # Post blinds
+        # Post blinds; the pre-flop round then opens with every seat to act
         self._post_blinds()
         
+        if self.deck is not None:
+            self.deck.shuffle()
+            count = HOLE_CARDS[self.game_type]
+            record = self.hand_log.record
+            for seat, player in enumerate(game_state.players):
+                if player.is_active_in_hand():
+                    cards = self.deck.deal(count)
+                    player.deal_hole_cards(cards)
+                    for card in cards:
+                        record(EventKind.DEAL, seat, card.get_index())
+        
+        self.game_state.start_betting_round()
+        
         # Set first action player (UTG in Texas Hold'em)
         self.game_state.current_action_player = self._get_first_action_seat()
         self.game_state.advance_phase(GamePhase.PRE_FLOP)
+        self.rehash()
+        self._record_change()
         
         logger.info(
             f"Hand started: {self.game_state.game_id}, "
@@ -146,8 +434,552 @@ class DealerEngine:
         Advances to HAND_COMPLETE phase.
         """
         self.game_state.advance_phase(GamePhase.HAND_COMPLETE)
+        self._record_change()
         logger.info(f"Hand completed: {self.game_state.game_id}")
     
+    def play_hand(
+        self,
+        agents: Mapping[str, Agent],
+        stacks: Optional[Dict[str, int]] = None,
+        trusted: Optional[bool] = None
+    ) -> Dict[str, int]:
+        """
+        Play a whole hand: deal, take every decision from the agents, settle.
+        
+        Each agent is called as agent(engine, player, legal) with this
+        engine, the PlayerState due to act and its LegalActions, and returns
+        an (ActionType, amount) pair as for process_action(). Agents read
+        anything else they need (board, pot) from the engine, so no
+        snapshot dict is built per decision. The loop moves to the next
+        street only when an action completes the round, and runs the board
+        out once betting is over.
+        
+        Args:
+            agents (Mapping[str, Agent]): Agent per player_id; players with
+                no chips need none.
+            stacks (Optional[Dict[str, int]]): Stacks to start the hand
+                with, as for start_hand() (default: keep the current stacks).
+            trusted (Optional[bool]): Skip full validation of the agents'
+                actions, as for process_action() (default: None, use the
+                engine's setting).
+        
+        Returns:
+            Dict[str, int]: Winnings per player_id.
+        
+        Raises:
+            ValueError: If the engine has no deck or a player in the hand
+                has no agent.
+            NotPlayersTurnError: If a trusted action is out of turn.
+            InvalidActionError: If an agent's action is illegal. The hand is
+                left in progress, before that action.
+        """
+        if self.deck is None:
+            raise ValueError("play_hand() needs an engine with a deck")
+        
+        self.start_hand(stacks)
+        game_state = self.game_state
+        players = game_state.players
+        seat_agents = [agents.get(player.player_id) for player in players]
+        for seat, player in enumerate(players):
+            if seat_agents[seat] is None and player.is_active_in_hand():
+                raise ValueError(f"No agent for {player.player_id}")
+        
+        validator = self.betting_validator
+        trusted = self.trusted if trusted is None else trusted
+        while True:
+            while not self.is_round_complete():
+                seat = game_state.current_action_player
+                player = players[seat]
+                player_id = player.player_id
+                legal = validator.legal_actions(player_id)
+                action, amount = seat_agents[seat](self, player, legal)
+                if trusted:
+                    self._trusted_actor(player_id, amount)
+                elif not legal.allows(action, amount):
+                    # Only a rejected action pays for the full check
+                    result = validator.check_action(player_id, action, amount)
+                    if result != ActionResult.OK:
+                        raise validator.error_for(result, player_id, action, amount)
+                self._execute_action(player, action, amount)
+                self._record_change()
+            
+            if (
+                game_state.count_active_players() <= 1
+                or game_state.current_phase not in BETTING_PHASES
+                or game_state.current_phase == GamePhase.RIVER
+            ):
+                break
+            self.advance_round()
+        
+        winnings = self.determine_winners()
+        self.distribute_pot(winnings)
+        self.end_hand()
+        return winnings
+    
+    def replay(self, log: HandLog, until: Optional[int] = None) -> Optional[Dict[str, int]]:
+        """
+        Play a recorded hand again from its hand log.
+        
+        Starts the hand with the log's stacks and button, then applies the
+        events in order: cards are dealt as recorded (the deck is left
+        alone), actions go through the trusted path, and the streets,
+        showdown and awards follow the log. Stopping after until events
+        rebuilds the table as it stood at that point of the hand (the
+        blinds are always posted). The replay is itself recorded in
+        hand_log, so comparing it with log, or the winnings returned with
+        log.awards(), checks this engine against recorded hands.
+        
+        Args:
+            log (HandLog): Events of one hand at this table, e.g. a copy()
+                of hand_log.
+            until (Optional[int]): Number of events to apply (default: all).
+        
+        Returns:
+            Optional[Dict[str, int]]: Winnings determined at the showdown,
+            or None if the replay stopped before it.
+        
+        Raises:
+            ValueError: If the log is for other players.
+            NotPlayersTurnError: If a recorded action is out of turn.
+        """
+        players = self.game_state.players
+        if log.player_ids != [p.player_id for p in players]:
+            raise ValueError(f"Hand log is for players {log.player_ids}")
+        if log is self.hand_log:
+            # start_hand() empties hand_log
+            log = log.copy()
+        
+        # Cards come from the log, so the deck must not deal
+        deck, self.deck = self.deck, None
+        try:
+            self.start_hand(dict(zip(log.player_ids, log.starting_stacks)), log.button)
+            winnings = None
+            runout_cards: List[Card] = []
+            for kind, seat, code, amount in islice(log, until):
+                if kind == EventKind.ACTION:
+                    player = self._trusted_actor(players[seat].player_id, amount)
+                    self._execute_action(player, ACTIONS[code], amount)
+                elif kind == EventKind.DEAL:
+                    if seat == RUNOUT_SEAT:
+                        runout_cards.append(FULL_DECK[code])
+                        continue
+                    if seat == BOARD_SEAT:
+                        self._reveal(FULL_DECK[code])
+                    else:
+                        self._deal_hole_card(seat, FULL_DECK[code])
+                elif kind == EventKind.STREET:
+                    self.advance_round()
+                elif kind == EventKind.SHOWDOWN:
+                    runouts = None
+                    if code:
+                        # Runs of a complete board hold no cards
+                        length = len(runout_cards) // code
+                        runouts = [
+                            runout_cards[i * length:(i + 1) * length]
+                            for i in range(code)
+                        ]
+                    winnings = self.determine_winners(runouts)
+                elif kind == EventKind.AWARD:
+                    self.distribute_pot({players[seat].player_id: amount})
+                # BLIND events were replayed by start_hand()
+        finally:
+            self.deck = deck
+        # Actions and cards since the last street change, as one change
+        self._record_change()
+        return winnings
+    
+    def snapshot(self) -> EngineSnapshot:
+        """
+        Capture the engine state for a later restore().
+        
+        The token holds only flat tuples of ints plus shared references to
+        immutable Card objects, so it is far cheaper than deep-copying the
+        engine. Search bots can snapshot, play out a line and restore.
+        
+        Returns:
+            EngineSnapshot: Token for restore().
+        """
+        return EngineSnapshot(
+            self.game_state.snapshot(),
+            self.pot_manager,
+            self.pot_manager.snapshot(),
+            self.deck.snapshot() if self.deck is not None else None,
+            self.hand_log.snapshot(),
+            self._table_hash,
+            tuple(self._seat_hashes)
+        )
+    
+    def restore(self, token: EngineSnapshot) -> None:
+        """
+        Return the engine to the state captured by snapshot().
+        
+        Tokens can be restored any number of times and in any order, as
+        long as they were taken from this engine. The state hash is
+        copied back from the token rather than recomputed. With
+        track_changes or publish_views, only seats whose hash term or hole
+        cards differ are marked changed.
+        
+        Args:
+            token (EngineSnapshot): Value returned by snapshot().
+        """
+        game_state = self.game_state
+        players = game_state.players
+        watched = self._track_changes or self._publish_views
+        if watched:
+            board = game_state.community_cards
+            held = [player.hole_cards for player in players]
+        game_state.restore(token.game_state)
+        self.pot_manager = token.pot_manager
+        self.pot_manager.restore(token.pots)
+        self.ledger = self.pot_manager.ledger
+        self.betting_validator.ledger = self.ledger
+        self.game_state.ledger = self.ledger
+        if token.deck is not None:
+            self.deck.restore(token.deck)
+        self.hand_log.restore(token.hand_log)
+        
+        seat_hashes = self._seat_hashes
+        board_replaced = False
+        if watched:
+            for seat, term in enumerate(token.seat_hashes):
+                if term != seat_hashes[seat] or players[seat].hole_cards is not held[seat]:
+                    self._dirty_seats |= 1 << seat
+            # Cards dealt since the snapshot are not a replaced board
+            board_replaced = game_state.community_cards[:len(board)] != board
+        seat_hashes[:] = token.seat_hashes
+        self._table_hash = token.table_hash
+        self._record_change(board_replaced)
+    
+    def load_bytes(self, data: bytes) -> None:
+        """
+        Resume a table from GameState.to_bytes() output, e.g. a checkpoint.
+        
+        The data's seats are taken to be this engine's players (IDs in it
+        are ignored). Seats, board and betting round are restored, the
+        ledger is rebuilt from each seat's chips in the pot, and folded and
+        all-in players are marked in the pot manager, so pot layers and
+        showdowns come out as before (once the pot has been paid out,
+        only stacks and the pot total are kept). The hand log restarts
+        from the loaded table, and a deck is reshuffled without the cards
+        in play.
+        
+        Args:
+            data (bytes): Encoded table, with or without IDs.
+        
+        Raises:
+            ValueError: If data is malformed, for another number of seats,
+                or has no pot contributions (version 1, or a table
+                serialised without a ledger) while chips are in the pot.
+        """
+        game_state = self.game_state
+        players = game_state.players
+        loaded = GameState.from_bytes(
+            data, game_state.game_id, [p.player_id for p in players]
+        )
+        if loaded.ledger is None and loaded.get_total_pot():
+            raise ValueError("Data holds no pot contributions to resume from")
+        
+        game_state.restore(loaded.snapshot())
+        in_hand = [p for p in players if p.status != PlayerStatus.OUT_OF_HAND]
+        self.pot_manager.reset([p.player_id for p in in_hand or players])
+        if loaded.ledger is not None:
+            self.ledger.restore(loaded.ledger.snapshot())
+        else:
+            self.ledger.reset([p.stack for p in players])
+        for player in in_hand:
+            if player.status == PlayerStatus.FOLDED:
+                self.pot_manager.set_folded(player.player_id)
+            elif player.status == PlayerStatus.ALL_IN:
+                self.pot_manager.set_all_in(player.player_id, 0)
+        
+        self.hand_log.reset(self.ledger.starting_stacks, game_state.dealer_button)
+        if self.deck is not None:
+            in_play = list(game_state.community_cards)
+            for player in players:
+                in_play.extend(player.hole_cards)
+            self.deck.shuffle(exclude=in_play)
+        self.rehash()
+        self._record_change(board_replaced=True)
+    
+    # =========================================================================
+    # DEALING & STATE HASH
+    # =========================================================================
+    
+    def deal_hole_cards(self, player_id: str, cards: List[Card]) -> None:
+        """
+        Deal hole cards to a player, keeping state_hash current.
+        
+        Args:
+            player_id (str): Player receiving the cards.
+            cards (List[Card]): Cards dealt.
+        
+        Raises:
+            ValueError: If the player is not seated or the cards are invalid.
+        """
+        seat = self.game_state.get_seat_of(player_id)
+        if seat is None:
+            raise ValueError(f"Player {player_id} not found")
+        player = self.game_state.players[seat]
+        keys = self.zobrist_keys
+        previous = keys.hole_cards_term(seat, player.hole_cards)
+        player.deal_hole_cards(cards)
+        self._table_hash ^= previous ^ keys.hole_cards_term(seat, player.hole_cards)
+        self._dirty_seats |= 1 << seat
+        for card in cards:
+            self.hand_log.record(EventKind.DEAL, seat, card.get_index())
+        self._record_change()
+    
+    def reveal_community_card(self, card: Card) -> None:
+        """
+        Reveal a community card, keeping state_hash current.
+        
+        Args:
+            card (Card): The card to reveal.
+        
+        Raises:
+            ValueError: If card is not a Card or the board is full.
+        """
+        self._reveal(card)
+        self._record_change()
+    
+    @property
+    def state_hash(self) -> int:
+        """
+        int: 64-bit Zobrist hash of the table.
+        
+        Covers every seat's stack, bet, statuses and hole cards, the board,
+        the phase and the seat due to act. The engine updates it in O(1)
+        per changed seat as actions are applied and undone, so it can key
+        transposition tables and decision caches directly. Changes made to
+        game_state behind the engine's back need a rehash().
+        """
+        return self._table_hash ^ self.zobrist_keys.turn_term(self.game_state)
+    
+    def rehash(self) -> int:
+        """
+        Recompute state_hash from scratch (O(seats + cards)).
+        
+        Returns:
+            int: The new state_hash.
+        """
+        keys = self.zobrist_keys
+        game_state = self.game_state
+        self._seat_hashes = [
+            keys.seat_term(seat, player)
+            for seat, player in enumerate(game_state.players)
+        ]
+        table_hash = 0
+        for seat, player in enumerate(game_state.players):
+            table_hash ^= self._seat_hashes[seat]
+            table_hash ^= keys.hole_cards_term(seat, player.hole_cards)
+        for card in game_state.community_cards:
+            table_hash ^= keys.board_card_key(card)
+        self._table_hash = table_hash
+        self._dirty_seats = (1 << len(game_state.players)) - 1
+        return self.state_hash
+    
+    # =========================================================================
+    # STATE VERSIONING
+    # =========================================================================
+    
+    def get_game_state_delta(self, since_version: int) -> Dict:
+        """
+        Get what changed since a state_version a consumer already holds.
+        
+        Walks the change log back to since_version, so an unchanged table
+        costs one comparison and a small dict. Keys other than version are
+        present only if that part of the table changed:
+        
+        - "phase", "current_action_player": new values.
+        - "pot_total", "pot_change": pot now and net change.
+        - "board_from", "community_cards": keep the first board_from cards
+          held and append these. A board replaced by restore() comes with
+          board_from 0 and all of it, even when it is now empty.
+        - "players": touched seats, shaped as in get_game_state().
+        
+        If since_version has left the change log, or track_changes was off
+        at the time, the full get_game_state() is returned instead, with
+        "full": True.
+        
+        Args:
+            since_version (int): Version the consumer last saw.
+        
+        Returns:
+            Dict: Delta with "version" (the current state_version) and
+            "full" (whether this is a full state).
+        
+        Raises:
+            ValueError: If since_version is negative or in the future.
+        """
+        if not 0 <= since_version <= self.state_version:
+            raise ValueError(
+                f"since_version {since_version} out of range 0-{self.state_version}"
+            )
+        delta: Dict = {"version": self.state_version, "full": False}
+        if since_version == self.state_version:
+            return delta
+        
+        changes = self._changes
+        if not changes or changes[0].version > since_version + 1:
+            state = self.get_game_state()
+            state.update(delta, full=True)
+            return state
+        
+        seat_mask = 0
+        board_from = len(self.game_state.community_cards)
+        board_replaced = False
+        first = None
+        for change in reversed(changes):
+            if change.version <= since_version:
+                break
+            first = change
+            seat_mask |= change.seat_mask
+            board_from = min(board_from, change.board_before)
+            board_replaced |= change.board_replaced
+        
+        game_state = self.game_state
+        if game_state.current_phase != first.phase_before:
+            delta["phase"] = game_state.current_phase.value
+        if game_state.current_action_player != first.action_before:
+            delta["current_action_player"] = game_state.current_action_player
+        pot_total = self.pot_manager.get_pot_total()
+        if pot_total != first.pot_before:
+            delta["pot_total"] = pot_total
+            delta["pot_change"] = pot_total - first.pot_before
+        board = game_state.community_cards
+        if board_replaced:
+            board_from = 0
+        if board_replaced or board_from < max(len(board), first.board_before):
+            delta["board_from"] = board_from
+            delta["community_cards"] = [str(c) for c in board[board_from:]]
+        if seat_mask:
+            delta["players"] = [
+                self._describe_player(player)
+                for seat, player in enumerate(game_state.players)
+                if seat_mask >> seat & 1
+            ]
+        return delta
+    
+    @property
+    def track_changes(self) -> bool:
+        """bool: Whether changes are recorded for get_game_state_delta()."""
+        return self._track_changes
+    
+    @track_changes.setter
+    def track_changes(self, value: bool) -> None:
+        # Versions from before the switch are answered with the full state
+        self._changes.clear()
+        if value and not self._track_changes:
+            self._recorded_phase = self.game_state.current_phase
+            self._recorded_action = self.game_state.current_action_player
+            self._recorded_pot = self.pot_manager.get_pot_total()
+            self._recorded_board = len(self.game_state.community_cards)
+        self._track_changes = value
+    
+    @property
+    def publish_views(self) -> bool:
+        """bool: Whether published is kept current (see __init__)."""
+        return self._publish_views
+    
+    @publish_views.setter
+    def publish_views(self, value: bool) -> None:
+        # Views built before a gap would share seats that changed during it
+        if value and not self._publish_views:
+            self.published = None
+            self._publish(0)
+        elif not value:
+            self.published = None
+        self._publish_views = value
+    
+    def _record_change(self, board_replaced: bool = False) -> None:
+        """
+        Log a change and bump state_version, if the table changed.
+        
+        Seats are marked by _rehash_seat() (every seat change goes through
+        it); phase, action seat, pot and board are compared with the values
+        recorded last time. Without track_changes nothing is compared or
+        logged and the version is simply bumped.
+        """
+        if not self._track_changes:
+            self.state_version += 1
+            if self._publish_views:
+                self._publish(self._dirty_seats, board_replaced)
+            self._dirty_seats = 0
+            return
+        
+        game_state = self.game_state
+        phase = game_state.current_phase
+        action = game_state.current_action_player
+        pot = self.pot_manager.get_pot_total()
+        board = len(game_state.community_cards)
+        if not (
+            self._dirty_seats
+            or board_replaced
+            or phase != self._recorded_phase
+            or action != self._recorded_action
+            or pot != self._recorded_pot
+            or board != self._recorded_board
+        ):
+            return
+        
+        self.state_version += 1
+        self._changes.append(StateChange(
+            self.state_version,
+            self._dirty_seats,
+            self._recorded_phase,
+            self._recorded_action,
+            self._recorded_pot,
+            self._recorded_board,
+            board_replaced,
+        ))
+        if self._publish_views:
+            self._publish(self._dirty_seats, board_replaced)
+        self._dirty_seats = 0
+        self._recorded_phase = phase
+        self._recorded_action = action
+        self._recorded_pot = pot
+        self._recorded_board = board
+    
+    def _publish(self, seat_mask: int, board_replaced: bool = False) -> None:
+        """
+        Build the TableView for state_version and swap it into published.
+        
+        Only seats in seat_mask are copied (every seat for the first view);
+        the other SeatViews, and the board if it is unchanged, are shared
+        with the previous view. The
+        view is complete before the single assignment that publishes it.
+        """
+        game_state = self.game_state
+        players = game_state.players
+        community_cards = game_state.community_cards
+        previous = self.published
+        if previous is None:
+            # First view since publish_views was turned on
+            seat_mask = (1 << len(players)) - 1
+            seats = [None] * len(players)
+            board = tuple(community_cards)
+        else:
+            seats = list(previous.seats)
+            board = previous.community_cards
+            # The board only grows between hands unless restore() replaced it
+            if board_replaced or len(board) != len(community_cards):
+                board = tuple(community_cards)
+        while seat_mask:
+            seat = (seat_mask & -seat_mask).bit_length() - 1
+            seats[seat] = SeatView.of(seat, players[seat])
+            seat_mask &= seat_mask - 1
+        
+        self.published = TableView(
+            self.state_version,
+            game_state.game_id,
+            game_state.current_phase,
+            game_state.current_action_player,
+            game_state.dealer_button,
+            self.pot_manager.get_pot_total(),
+            board,
+            tuple(seats),
+        )
+    
     # =========================================================================
     # ACTION REQUEST & PROCESSING
     # =========================================================================
@@ -186,106 +1018,255 @@ class DealerEngine:
         self,
         player_id: str,
         action: ActionType,
-        amount: int = 0
-    ) -> None:
+        amount: int = 0,
+        trusted: Optional[bool] = None
+    ) -> bool:
         """
         Process a player's action.
         
         Validates action, updates state, and advances turn if needed.
+        If auto_advance is set and the action completes the betting round,
+        the engine also advances to the next phase.
+        
+        A trusted action skips the betting rules and only checks that the
+        player is due to act and can cover the amount; an illegal trusted
+        action leaves the hand in an undefined state. Keep full validation
+        for remote or untrusted bots.
         
         Args:
             player_id (str): Player taking action.
             action (ActionType): Action type (CHECK, FOLD, CALL, etc.).
             amount (int): Bet/raise amount (for BET, RAISE, ALL_IN).
+            trusted (Optional[bool]): Skip full validation for this action
+                (default: None, use the engine's trusted setting).
+        
+        Returns:
+            bool: True if this action completed the betting round.
         
         Raises:
-            ValueError: If action invalid or not player's turn.
+            NotPlayersTurnError: If it is not this player's turn.
+            InvalidActionError: If the action is illegal.
         """
-        # Validate action
-        try:
-            self.betting_validator.validate_action(player_id, action, amount)
-        except Exception as e:
-            logger.error(f"Invalid action by {player_id}: {e}")
-            raise
+        if self.trusted if trusted is None else trusted:
+            return self._play_action(self._trusted_actor(player_id, amount), action, amount)
+        
+        result = self.betting_validator.check_action(player_id, action, amount)
+        if result != ActionResult.OK:
+            error = self.betting_validator.error_for(result, player_id, action, amount)
+            logger.error(f"Invalid action by {player_id}: {error}")
+            raise error
+        return self._play_action(self.game_state.get_player_by_id(player_id), action, amount)
+    
+    def try_action(
+        self,
+        player_id: str,
+        action: ActionType,
+        amount: int = 0,
+        trusted: Optional[bool] = None
+    ) -> ActionResult:
+        """
+        Process a player's action if it is legal, without raising.
         
-        player = self.game_state.get_player_by_id(player_id)
+        The exception-free counterpart of process_action() for callers that
+        expect many illegal actions (random or adversarial bots): a rejected
+        action costs one check and no message formatting or logging. Use
+        BettingValidator.describe_result() before the next action for a
+        reason.
         
-        # Execute action
-        if action == ActionType.FOLD:
-            player.fold()
-            self.pot_manager.add_to_pot(player_id, 0)
-            
-        elif action == ActionType.CHECK:
-            player.round_status = RoundStatus.ACTED
-            self.pot_manager.add_to_pot(player_id, 0)
-            
-        elif action == ActionType.CALL:
-            call_amount = self._calculate_call_amount(player)
-            if call_amount > 0:
-                player.post_bet(call_amount)
-                self.pot_manager.add_to_pot(player_id, call_amount)
-            player.round_status = RoundStatus.ACTED
-            
-        elif action == ActionType.BET:
-            player.post_bet(amount)
-            self.pot_manager.add_to_pot(player_id, amount)
-            player.round_status = RoundStatus.ACTED
-            self.game_state.current_action_player = self._get_next_action_seat()
-            
-        elif action == ActionType.RAISE:
-            raise_total = self._calculate_raise_total(player, amount)
-            player.post_bet(raise_total)
-            self.pot_manager.add_to_pot(player_id, raise_total)
-            player.round_status = RoundStatus.ACTED
-            # Reset other players so they must act again after the raise
-            for p in self.game_state.get_active_players():
-                if p.player_id != player_id and not self._is_all_in(p) and not self._is_folded(p):
-                    p.round_status = RoundStatus.WAITING_FOR_ACTION
-            
-        elif action == ActionType.ALL_IN:
-            all_in_amount = player.stack
-            if all_in_amount > 0:
-                player.post_bet(all_in_amount)
-                self.pot_manager.add_to_pot(player_id, all_in_amount)
-            player.go_all_in()
-            self.pot_manager.set_all_in(player_id, 0)
+        Args:
+            player_id (str): Player taking action.
+            action (ActionType): Action type (CHECK, FOLD, CALL, etc.).
+            amount (int): Bet/raise amount (for BET, RAISE, ALL_IN).
+            trusted (Optional[bool]): Skip full validation, as for
+                process_action() (default: None, use the engine's setting).
         
-        # Advance turn
-        self.game_state.current_action_player = self._get_next_action_seat()
+        Returns:
+            ActionResult: OK if the action was applied, otherwise the reason
+            it was rejected (state unchanged).
         
-        logger.debug(
-            f"Action processed: {player_id}, action={action.value}, amount={amount}"
-        )
+        Raises:
+            NotPlayersTurnError: If a trusted action is out of turn.
+            InvalidActionError: If a trusted action exceeds the stack.
+        """
+        if self.trusted if trusted is None else trusted:
+            self._play_action(self._trusted_actor(player_id, amount), action, amount)
+            return ActionResult.OK
+        
+        result = self.betting_validator.check_action(player_id, action, amount)
+        if result == ActionResult.OK:
+            self._play_action(self.game_state.get_player_by_id(player_id), action, amount)
+        return result
     
     # =========================================================================
     # ROUND & PHASE MANAGEMENT
     # =========================================================================
     
+    def apply(
+        self,
+        action: ActionType,
+        amount: int = 0,
+        trusted: Optional[bool] = None
+    ) -> "UndoRecord":
+        """
+        Play an action for the player due to act, recording how to undo it.
+        
+        For depth-first tree walks: apply() and undo() change the engine in
+        place, and the record holds only what the action changed. apply()
+        never auto-advances the phase; call advance_round() explicitly.
+        
+        Args:
+            action (ActionType): Action type (CHECK, FOLD, CALL, etc.).
+            amount (int): Bet/raise amount (for BET, RAISE, ALL_IN).
+            trusted (Optional[bool]): Skip full validation, as for
+                process_action() (default: None, use the engine's setting).
+        
+        Returns:
+            UndoRecord: Pass to undo() to reverse the action.
+        
+        Raises:
+            ValueError: If no player is due to act.
+            InvalidActionError: If the action is illegal.
+        """
+        game_state = self.game_state
+        seat = game_state.current_action_player
+        if seat is None:
+            raise ValueError("No player is due to act")
+        
+        player = game_state.players[seat]
+        betting_round = game_state.betting_round
+        if self.trusted if trusted is None else trusted:
+            if amount > player.stack:
+                raise InvalidActionError(
+                    f"Amount {amount} exceeds {player.player_id}'s stack {player.stack}"
+                )
+        else:
+            self.betting_validator.validate_action(player.player_id, action, amount)
+        
+        stack = player.stack
+        status = player.status
+        round_status = player.round_status
+        high_bet = betting_round.high_bet
+        last_raise_size = betting_round.last_raise_size
+        aggressor_seat = betting_round.aggressor_seat
+        pending_mask = betting_round.pending_mask
+        table_hash = self._table_hash
+        others_round_status = None
+        if action == ActionType.RAISE:
+            others_round_status = tuple(p.round_status for p in game_state.players)
+            seat_hashes = tuple(self._seat_hashes)
+        else:
+            seat_hashes = self._seat_hashes[seat]
+        
+        self._execute_action(player, action, amount)
+        self._record_change()
+        
+        return UndoRecord(
+            seat,
+            stack - player.stack,
+            status,
+            round_status,
+            high_bet,
+            last_raise_size,
+            aggressor_seat,
+            pending_mask,
+            game_state.current_action_player,
+            others_round_status,
+            action == ActionType.FOLD,
+            action == ActionType.ALL_IN,
+            table_hash,
+            seat_hashes
+        )
+    
+    def undo(self, record: "UndoRecord") -> None:
+        """
+        Reverse the action that produced record.
+        
+        Records must be undone in reverse order of apply() (last in, first
+        out); the engine is then exactly as it was before the action. The
+        state hash is put back from the record, not recomputed.
+        
+        Args:
+            record (UndoRecord): Value returned by apply().
+        """
+        game_state = self.game_state
+        player = game_state.players[record.seat]
+        
+        self.hand_log.pop()
+        if record.chips:
+            self.pot_manager.pop_contribution()
+        if record.folded:
+            self.pot_manager.folded_players.discard(player.player_id)
+        if record.went_all_in:
+            self.pot_manager.all_in_amounts.pop(player.player_id, None)
+        
+        if record.others_round_status is not None:
+            for seat, (other, other_round_status) in enumerate(
+                zip(game_state.players, record.others_round_status)
+            ):
+                if other.round_status != other_round_status:
+                    other.round_status = other_round_status
+                    self._dirty_seats |= 1 << seat
+            self._seat_hashes[:] = record.seat_hashes
+        else:
+            self._seat_hashes[record.seat] = record.seat_hashes
+        game_state.revert_player_action(
+            record.seat, record.chips, record.status, record.round_status
+        )
+        self._table_hash = record.table_hash
+        self._dirty_seats |= 1 << record.seat
+        
+        betting_round = game_state.betting_round
+        betting_round.high_bet = record.high_bet
+        betting_round.last_raise_size = record.last_raise_size
+        betting_round.aggressor_seat = record.aggressor_seat
+        betting_round.pending_mask = record.pending_mask
+        game_state.current_action_player = record.seat
+        self._record_change()
+    
+    def is_round_complete(self) -> bool:
+        """
+        Check whether the current betting round is over.
+        
+        The round's pending-actor mask (see BettingRound) is cleared as
+        players act and refilled by any bet above the high bet, so this is
+        O(1). A hand with one player left also ends the round.
+        
+        Returns:
+            bool: True if nobody is left to act, or only one player remains.
+        """
+        game_state = self.game_state
+        return (
+            game_state.betting_round.pending_mask == 0
+            or game_state.count_active_players() <= 1
+        )
+    
     def advance_round(self) -> None:
         """
         Advance to the next betting round or showdown.
         
-        Clears round bets and moves to next phase.
+        Clears round bets and moves to next phase. With a deck, deals the
+        community cards of the new street (Texas Hold'em).
         
         Raises:
             ValueError: If all players haven't acted.
         """
         # Check if all active players have acted
-        for player in self.game_state.get_active_players():
+        active_players = self.game_state.active_players
+        for player in active_players:
             if player.round_status == RoundStatus.WAITING_FOR_ACTION:
                 raise ValueError("Not all players have acted")
         
         # Check if only one player remains (all others folded)
-        remaining = [p for p in self.game_state.get_active_players()
-                    if not self._is_folded(p)]
-        
-        if len(remaining) == 1:
+        if len(active_players) == 1:
             self.game_state.advance_phase(GamePhase.SHOWDOWN)
+            self.hand_log.record(EventKind.STREET, code=STREET_INDEX[GamePhase.SHOWDOWN])
+            self._record_change()
             return
         
         # Reset round state and move to next phase
-        for player in self.game_state.get_active_players():
+        for player in active_players:
             player.clear_round_data()
+            self._rehash_seat(self.game_state.get_seat_of(player.player_id))
         
         # Transition to next phase
         current = self.game_state.current_phase
@@ -298,9 +1279,18 @@ class DealerEngine:
         
         next_phase = phase_map.get(current, GamePhase.SHOWDOWN)
         self.game_state.advance_phase(next_phase)
-        
-        # Set first action player for new round
-        self.game_state.current_action_player = self._get_first_action_seat_post_flop()
+        self.hand_log.record(EventKind.STREET, code=STREET_INDEX[next_phase])
+        if self.deck is not None and self.game_type == GameType.TEXAS_HOLDEM:
+            for card in self.deck.deal(BOARD_CARDS.get(next_phase, 0)):
+                self._reveal(card)
+        self.game_state.start_betting_round()
+        
+        # Set first action player for new round (nobody if nobody is pending)
+        if self.game_state.betting_round.pending_mask:
+            self.game_state.current_action_player = self._get_first_action_seat_post_flop()
+        else:
+            self.game_state.current_action_player = None
+        self._record_change()
         
         logger.debug(f"Advanced to phase: {next_phase.value}")
     
@@ -308,46 +1298,105 @@ class DealerEngine:
     # SHOWDOWN & POT DISTRIBUTION
     # =========================================================================
     
-    def determine_winners(self) -> Dict[str, int]:
+    def determine_winners(self, runouts: Optional[List[List[Card]]] = None) -> Dict[str, int]:
         """
         Determine winners and calculate winnings per player.
         
-        Handles side pots and split pots.
+        Handles side pots and split pots. When players are all-in before
+        the river, the remaining board may be run several times: pass one
+        list of completing cards per run and every pot is divided by run.
+        
+        Args:
+            runouts (Optional[List[List[Card]]]): Cards completing the board
+                for each run (default: settle on the current board once).
         
         Returns:
             Dict[str, int]: Winnings per player_id.
+        
+        Raises:
+            ValueError: If a runout has the wrong length or repeats a card.
         """
         # Transition to showdown
         self.game_state.advance_phase(GamePhase.SHOWDOWN)
+        self._record_change()
         
-        # Calculate side pots
+        # Calculate side pots (kept for get_game_state consumers)
         self.pot_manager.calculate_side_pots()
         
         # Get remaining players (not folded)
-        remaining = [p for p in self.game_state.get_active_players()
-                    if not self._is_folded(p)]
+        remaining = self.game_state.get_active_players()
         
         if len(remaining) == 1:
             # All others folded; winner takes pot
+            self.hand_log.record(EventKind.SHOWDOWN)
             winner_id = remaining[0].player_id
             total = self.pot_manager.get_pot_total()
             return {winner_id: total}
         
-        # Multiple players: compare hands
-        main_pot = self.pot_manager.get_main_pot()
-        side_pots = self.pot_manager.get_side_pots()
-        
-        winnings = self.winner_determiner.determine_winners(
-            remaining_players=remaining,
-            main_pot=main_pot,
-            side_pots=side_pots,
-            community_cards=self.game_state.community_cards
-        )
+        # Multiple players: compare hands layer by layer
+        if runouts:
+            self._validate_runouts(runouts)
+            for runout in runouts:
+                for card in runout:
+                    self.hand_log.record(EventKind.DEAL, RUNOUT_SEAT, card.get_index())
+            self.hand_log.record(EventKind.SHOWDOWN, code=len(runouts))
+            winnings = self.winner_determiner.award_pots_multi_run(
+                remaining_players=remaining,
+                pots=self.pot_manager.build_pots(),
+                community_cards=self.game_state.community_cards,
+                runouts=runouts,
+                button_seat=self.game_state.dealer_button
+            )
+        else:
+            self.hand_log.record(EventKind.SHOWDOWN)
+            winnings = self.winner_determiner.award_pots(
+                remaining_players=remaining,
+                pots=self.pot_manager.build_pots(),
+                community_cards=self.game_state.community_cards,
+                button_seat=self.game_state.dealer_button
+            )
         
         logger.info(f"Winners determined: {winnings}")
         
         return winnings
     
+    def get_expected_winnings(
+        self,
+        board_size: Optional[int] = None,
+        max_runouts: int = DEFAULT_MAX_RUNOUTS,
+        rng: Optional[random.Random] = None
+    ) -> Dict[str, float]:
+        """
+        Get equity-weighted winnings for an all-in showdown.
+        
+        Averages the pot awards over the runouts of the board that were
+        still to come when action closed, removing the luck of the actual
+        runout. Uses the current pot layers and does not change state.
+        
+        Args:
+            board_size (Optional[int]): Community cards known when the
+                players were all-in (default: all cards dealt so far).
+            max_runouts (int): Runouts sampled for a pre-flop all-in
+                (flop and turn all-ins are enumerated exactly).
+            rng (Optional[random.Random]): Source for sampling.
+        
+        Returns:
+            Dict[str, float]: Expected winnings per player_id.
+        """
+        board = self.game_state.community_cards
+        if board_size is not None:
+            board = board[:board_size]
+        
+        return expected_winnings(
+            self.winner_determiner,
+            self.game_state.players,
+            self.pot_manager.build_pots(),
+            list(board),
+            button_seat=self.game_state.dealer_button,
+            max_runouts=max_runouts,
+            rng=rng
+        )
+    
     def distribute_pot(self, winnings: Dict[str, int]) -> None:
         """
         Distribute winnings to players.
@@ -357,10 +1406,18 @@ class DealerEngine:
         """
         self.game_state.advance_phase(GamePhase.POT_DISTRIBUTION)
         
+        street = STREET_INDEX[self.game_state.current_phase]
         for player_id, amount in winnings.items():
             player = self.game_state.get_player_by_id(player_id)
-            if player:
+            if player and amount > 0:
+                self.ledger.record(
+                    self.ledger.index_of(player_id), street, amount, LedgerEntryKind.AWARD
+                )
                 player.stack += amount
+                seat = self.game_state.get_seat_of(player_id)
+                self.hand_log.record(EventKind.AWARD, seat, amount=amount)
+                self._rehash_seat(seat)
+        self._record_change()
         
         logger.info(f"Pot distributed: {winnings}")
     
@@ -384,17 +1441,7 @@ class DealerEngine:
             "total_pot": self.pot_manager.get_pot_total(),
             "community_cards": [str(c) for c in self.game_state.community_cards],
             "dealer_button": self.game_state.dealer_button,
-            "players": [
-                {
-                    "player_id": p.player_id,
-                    "seat": p.seat_number,
-                    "stack": p.stack,
-                    "current_bet": p.current_bet,
-                    "status": p.status.value,
-                    "hole_cards": [str(c) for c in p.hole_cards],
-                }
-                for p in self.game_state.players
-            ]
+            "players": [self._describe_player(p) for p in self.game_state.players]
         }
     
     def get_player_state(self, player_id: str) -> Dict:
@@ -428,10 +1475,39 @@ class DealerEngine:
     # PRIVATE HELPERS
     # =========================================================================
     
+    def _describe_player(self, player: PlayerState) -> Dict:
+        """Describe a seat as in get_game_state()['players']."""
+        return {
+            "player_id": player.player_id,
+            "seat": player.seat_number,
+            "stack": player.stack,
+            "current_bet": player.current_bet,
+            "status": player.status.value,
+            "hole_cards": [str(c) for c in player.hole_cards],
+        }
+    
+    def _get_blind_seats(self) -> Tuple[int, int]:
+        """
+        Get the small and big blind seats for the current button.
+        
+        Blinds go to the next players in the hand after the button; heads-up,
+        the button posts the small blind and the other player the big blind.
+        
+        Returns:
+            Tuple[int, int]: (small blind seat, big blind seat).
+        """
+        game_state = self.game_state
+        button = game_state.dealer_button
+        if game_state.count_active_players() == 2 and game_state.players[button].is_active_in_hand():
+            sb_seat = button
+        else:
+            sb_seat = game_state.get_next_active_seat(button)
+        bb_seat = game_state.get_next_active_seat(sb_seat)
+        return sb_seat, bb_seat
+    
     def _post_blinds(self) -> None:
         """Post small and big blinds."""
-        sb_seat = (self.game_state.dealer_button + 1) % len(self.game_state.players)
-        bb_seat = (self.game_state.dealer_button + 2) % len(self.game_state.players)
+        sb_seat, bb_seat = self._get_blind_seats()
         
         sb_player = self.game_state.get_player_by_seat(sb_seat)
         bb_player = self.game_state.get_player_by_seat(bb_seat)
@@ -440,41 +1516,72 @@ class DealerEngine:
         sb_amount = min(self.small_blind_amount, sb_player.stack)
         bb_amount = min(self.big_blind_amount, bb_player.stack)
         
-        sb_player.post_bet(sb_amount)
-        bb_player.post_bet(bb_amount)
-        
-        self.pot_manager.add_to_pot(sb_player.player_id, sb_amount)
-        self.pot_manager.add_to_pot(bb_player.player_id, bb_amount)
+        self._commit_chips(sb_player, sb_amount, LedgerEntryKind.BLIND)
+        self._commit_chips(bb_player, bb_amount, LedgerEntryKind.BLIND)
+        for seat, amount in ((sb_seat, sb_amount), (bb_seat, bb_amount)):
+            if amount > 0:
+                self.hand_log.record(EventKind.BLIND, seat, amount=amount)
         
         if sb_player.stack == 0:
             sb_player.go_all_in()
         if bb_player.stack == 0:
             bb_player.go_all_in()
     
-    def _get_first_action_seat(self) -> int:
+    def _new_ledger(self) -> ChipLedger:
+        """Create a ledger over every seated player and their current stacks."""
+        players = self.game_state.players
+        return ChipLedger(
+            [p.player_id for p in players],
+            [p.stack for p in players]
+        )
+    
+    def _commit_chips(
+        self,
+        player: PlayerState,
+        amount: int,
+        kind: LedgerEntryKind
+    ) -> None:
+        """
+        Move chips from a player's stack into the pot.
+        
+        The single path for chips entering the pot: updates the player's
+        stack and round bet and appends the movement to the ledger.
+        """
+        if amount <= 0:
+            return
+        player.post_bet(amount)
+        self.pot_manager.add_to_pot(
+            player.player_id,
+            amount,
+            STREET_INDEX[self.game_state.current_phase],
+            kind
+        )
+    
+    def _get_first_action_seat(self) -> Optional[int]:
         """
         Get first action seat for PRE_FLOP.
         
-        In Texas Hold'em: UTG (3 seats left of dealer).
-        In 5-card draw: Same as Hold'em initially.
+        The first player able to act after the big blind: UTG at a full
+        table, the button with three players, and the button (small blind)
+        heads-up. In 5-card draw: same as Hold'em initially.
         
         Returns:
-            int: Seat number.
+            Optional[int]: Seat number, or None if nobody can act.
         """
-        num_seats = len(self.game_state.players)
-        return (self.game_state.dealer_button + 3) % num_seats
+        _, bb_seat = self._get_blind_seats()
+        return self.game_state.get_next_acting_seat(bb_seat)
     
-    def _get_first_action_seat_post_flop(self) -> int:
+    def _get_first_action_seat_post_flop(self) -> Optional[int]:
         """
         Get first action seat for FLOP, TURN, RIVER.
         
-        Small blind acts first.
+        The first player able to act after the button (the big blind
+        heads-up), skipping folded and all-in seats.
         
         Returns:
-            int: Seat number.
+            Optional[int]: Seat number, or None if nobody can act.
         """
-        num_seats = len(self.game_state.players)
-        return (self.game_state.dealer_button + 1) % num_seats
+        return self.game_state.get_next_acting_seat(self.game_state.dealer_button)
     
     def _get_next_action_seat(self) -> Optional[int]:
         """
@@ -488,50 +1595,151 @@ class DealerEngine:
         if self.game_state.current_action_player is None:
             return None
         
-        current_seat = self.game_state.current_action_player
-        num_seats = len(self.game_state.players)
+        return self.game_state.get_next_acting_seat(
+            self.game_state.current_action_player
+        )
+    
+    def _rehash_seat(self, seat: int) -> None:
+        """
+        Swap a seat's old stack/bet/status term for its current one and
+        mark the seat changed for the next _record_change().
+        """
+        term = self.zobrist_keys.seat_term(seat, self.game_state.players[seat])
+        self._table_hash ^= self._seat_hashes[seat] ^ term
+        self._seat_hashes[seat] = term
+        self._dirty_seats |= 1 << seat
+    
+    def _deal_hole_card(self, seat: int, card: Card) -> None:
+        """Add a card to a seat's hole cards, keeping state_hash and the hand log current."""
+        player = self.game_state.players[seat]
+        player.deal_hole_cards(player.hole_cards + [card])
+        self._table_hash ^= self.zobrist_keys.hole_cards_term(seat, [card])
+        self._dirty_seats |= 1 << seat
+        self.hand_log.record(EventKind.DEAL, seat, card.get_index())
+    
+    def _reveal(self, card: Card) -> None:
+        """Put a card on the board, keeping state_hash and the hand log current."""
+        self.game_state.reveal_community_card(card)
+        self._table_hash ^= self.zobrist_keys.board_card_key(card)
+        self.hand_log.record(EventKind.DEAL, BOARD_SEAT, card.get_index())
+    
+    def _calculate_call_amount(self, player: PlayerState) -> int:
+        """Calculate amount player must call."""
+        return max(0, self.game_state.betting_round.high_bet - player.current_bet)
+    
+    def _trusted_actor(self, player_id: str, amount: int) -> PlayerState:
+        """
+        Find the player due to act for a trusted action.
+        
+        Only the checks that keep chips and turn order consistent: the
+        player is the one due to act and can cover the amount.
+        
+        Raises:
+            NotPlayersTurnError: If player_id is not due to act.
+            InvalidActionError: If amount exceeds the player's stack.
+        """
+        seat = self.game_state.current_action_player
+        player = None if seat is None else self.game_state.players[seat]
+        if player is None or player.player_id != player_id:
+            raise NotPlayersTurnError(f"Player {player_id} is not the current actor")
+        if amount > player.stack:
+            raise InvalidActionError(
+                f"Amount {amount} exceeds {player_id}'s stack {player.stack}"
+            )
+        return player
+    
+    def _play_action(self, player: PlayerState, action: ActionType, amount: int) -> bool:
+        """
+        Apply a validated action, then auto-advance if that is enabled.
+        
+        Returns:
+            bool: True if the action completed the betting round.
+        """
+        self._execute_action(player, action, amount)
+        self._record_change()
         
-        for offset in range(1, num_seats):
-            next_seat = (current_seat + offset) % num_seats
-            next_player = self.game_state.get_player_by_seat(next_seat)
+        logger.debug(
+            "Action processed: %s, action=%s, amount=%s",
+            player.player_id, action.value, amount
+        )
+        
+        round_complete = self.is_round_complete()
+        if (
+            round_complete
+            and self.auto_advance
+            and self.game_state.current_phase in BETTING_PHASES
+        ):
+            self.advance_round()
+        return round_complete
+    
+    def _execute_action(
+        self,
+        player: PlayerState,
+        action: ActionType,
+        amount: int
+    ) -> None:
+        """Apply a validated action to the state and pass the turn on."""
+        stack = player.stack
+        if action == ActionType.FOLD:
+            player.fold()
+            self.pot_manager.set_folded(player.player_id)
+            
+        elif action == ActionType.CHECK:
+            player.round_status = RoundStatus.ACTED
             
-            # Skip if not active in hand
-            if not next_player.is_active_in_hand():
-                continue
+        elif action == ActionType.CALL:
+            call_amount = self._calculate_call_amount(player)
+            self._commit_chips(player, call_amount, LedgerEntryKind.BET)
+            player.round_status = RoundStatus.ACTED
             
-            # Skip if already all-in
-            if self._is_all_in(next_player):
-                continue
+        elif action == ActionType.BET:
+            self._commit_chips(player, amount, LedgerEntryKind.BET)
+            player.round_status = RoundStatus.ACTED
             
-            # Skip if folded
-            if self._is_folded(next_player):
-                continue
+        elif action == ActionType.RAISE:
+            # amount is the chips added (call plus raise increment), as validated
+            self._commit_chips(player, amount, LedgerEntryKind.BET)
+            player.round_status = RoundStatus.ACTED
+            # Reset other players so they must act again after the raise
+            for p in self.game_state.active_players:
+                if p is not player and p.can_act():
+                    p.round_status = RoundStatus.WAITING_FOR_ACTION
+                    self._rehash_seat(self.game_state.get_seat_of(p.player_id))
             
-            return next_seat
+        elif action == ActionType.ALL_IN:
+            self._commit_chips(player, player.stack, LedgerEntryKind.BET)
+            player.go_all_in()
+            self.pot_manager.set_all_in(player.player_id, 0)
         
-        # No more players can act
-        return None
-    
-    def _calculate_call_amount(self, player: PlayerState) -> int:
-        """Calculate amount player must call."""
-        max_bet = max(
-            (p.current_bet for p in self.game_state.get_active_players()),
-            default=0
-        )
-        return max(0, max_bet - player.current_bet)
-    
-    def _calculate_raise_total(self, player: PlayerState, raise_amount: int) -> int:
-        """Calculate total amount player must bet to raise."""
-        call_amount = self._calculate_call_amount(player)
-        return call_amount + raise_amount
-    
-    def _is_folded(self, player: PlayerState) -> bool:
-        """Check if player has folded."""
-        return player.status == PlayerStatus.FOLDED
+        seat = self.game_state.get_seat_of(player.player_id)
+        self.hand_log.record(EventKind.ACTION, seat, ACTION_CODES[action], stack - player.stack)
+        self._rehash_seat(seat)
+        
+        # Advance turn
+        self.game_state.current_action_player = self._get_next_action_seat()
     
-    def _is_all_in(self, player: PlayerState) -> bool:
-        """Check if player is all-in."""
-        return player.status == PlayerStatus.ALL_IN
+    def _validate_runouts(self, runouts: List[List[Card]]) -> None:
+        """
+        Check that each runout completes the board with unseen cards.
+        
+        Raises:
+            ValueError: If a runout has the wrong length or a card is
+                already on the board, in a hand, or in another runout.
+        """
+        missing = 5 - len(self.game_state.community_cards)
+        seen = {card.get_index() for card in self.game_state.community_cards}
+        for player in self.game_state.players:
+            seen.update(card.get_index() for card in player.hole_cards)
+        
+        for runout in runouts:
+            if len(runout) != missing:
+                raise ValueError(
+                    f"Each runout must have {missing} cards, got {len(runout)}"
+                )
+            for card in runout:
+                if card.get_index() in seen:
+                    raise ValueError(f"Card {card!r} dealt twice across runouts")
+                seen.add(card.get_index())
     
     def _get_action_state_snapshot(self, player: PlayerState) -> Dict:
         """
@@ -543,7 +1751,7 @@ class DealerEngine:
         Returns:
             Dict: Relevant game information for action decision.
         """
-        active_players = self.game_state.get_active_players()
+        active_players = self.game_state.active_players
         
         return {
             "player_id": player.player_id,
@@ -553,6 +1761,8 @@ class DealerEngine:
             "your_bet_this_round": player.current_bet,
             "community_cards": [str(c) for c in self.game_state.community_cards],
             "current_bet_to_call": self._calculate_call_amount(player),
+            "min_raise_increment": self.betting_validator.get_min_raise_increment(),
+            "legal_actions": self.betting_validator.legal_actions(player.player_id),
             "pot_total": self.pot_manager.get_pot_total(),
             "active_players": [
                 {
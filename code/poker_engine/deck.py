@@ -0,0 +1,111 @@
+"""Shuffled 52-card deck for the dealer engine to deal from."""
+
+import random
+from typing import Iterable, List, Optional, Tuple
+
+from poker_engine.card import Card
+
+# Every card in get_index() order, shared by all decks
+FULL_DECK: Tuple[Card, ...] = tuple(Card.from_index(index) for index in range(52))
+
+
+class Deck:
+    """
+    A 52-card deck dealt from the top.
+
+    shuffle() lays out a new order of the shared Card objects and dealing
+    only moves a position forward, so one deck serves hand after hand and
+    its state is two values (see snapshot()).
+
+    Attributes:
+        rng (random.Random): Source of shuffles.
+    """
+
+    __slots__ = ("rng", "_cards", "_position")
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialise a shuffled deck.
+
+        Args:
+            rng (Optional[random.Random]): Source of shuffles; pass a seeded
+                generator for repeatable deals (default: the random
+                module's shared generator).
+        """
+        self.rng = rng if rng is not None else random
+        self._cards: List[Card] = []
+        self._position = 0
+        self.shuffle()
+
+    def shuffle(self, exclude: Iterable[Card] = ()) -> None:
+        """
+        Gather every card back and shuffle them into a new order.
+
+        Args:
+            exclude (Iterable[Card]): Cards to leave out, e.g. those already
+                in play when a hand is resumed (default: none).
+        """
+        cards = list(FULL_DECK)
+        if exclude:
+            dead = {card.get_index() for card in exclude}
+            cards = [card for card in cards if card.get_index() not in dead]
+        self.rng.shuffle(cards)
+        # A new list rather than shuffling in place, so snapshots keep their order
+        self._cards = cards
+        self._position = 0
+
+    def deal(self, count: int = 1) -> List[Card]:
+        """
+        Deal cards from the top of the deck.
+
+        Args:
+            count (int): Number of cards (default: 1).
+
+        Returns:
+            List[Card]: The cards, in the order dealt.
+
+        Raises:
+            ValueError: If fewer than count cards are left.
+        """
+        start = self._position
+        end = start + count
+        if end > len(self._cards):
+            raise ValueError(f"Cannot deal {count} cards, {self.remaining} left")
+        self._position = end
+        return self._cards[start:end]
+
+    @property
+    def remaining(self) -> int:
+        """int: Cards left to deal."""
+        return len(self._cards) - self._position
+
+    @property
+    def dealt(self) -> List[Card]:
+        """List[Card]: Cards dealt since the last shuffle, in order."""
+        return self._cards[:self._position]
+
+    def snapshot(self) -> Tuple:
+        """
+        Capture the deck's order and position.
+
+        Returns:
+            Tuple: Opaque token for restore().
+        """
+        return (self._cards, self._position)
+
+    def restore(self, token: Tuple) -> None:
+        """
+        Return the deck to a snapshot() of itself.
+
+        Args:
+            token (Tuple): Value returned by snapshot().
+        """
+        self._cards, self._position = token
+
+    def __len__(self) -> int:
+        """Return the number of cards left to deal."""
+        return self.remaining
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"Deck(remaining={self.remaining})"
@@ -0,0 +1,91 @@
+"""All-in equity: expected pot winnings over the remaining board runouts."""
+
+import random
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Optional
+
+from poker_engine.card import Card
+from poker_engine.deck import FULL_DECK
+from poker_engine.player_state import PlayerState
+from poker_engine.pot_manager import PotStructure
+from poker_engine.winner_determiner import WinnerDeterminer
+
+# Runouts sampled for a pre-flop all-in; later streets are enumerated exactly
+DEFAULT_MAX_RUNOUTS = 200
+
+BOARD_SIZE = 5
+
+# Cards still to come up to which every runout is enumerated (flop and turn)
+MAX_EXACT_MISSING = 2
+
+# Default source for sampling, kept apart from the random module's shared
+# generator so equity never shifts a seeded simulation's deals
+_SAMPLING_RNG = random.Random()
+
+
+def expected_winnings(
+    winner_determiner: WinnerDeterminer,
+    players: List[PlayerState],
+    pots: PotStructure,
+    board: List[Card],
+    button_seat: Optional[int] = None,
+    max_runouts: int = DEFAULT_MAX_RUNOUTS,
+    rng: Optional[random.Random] = None,
+) -> Dict[str, float]:
+    """
+    Average each player's pot winnings over every possible rest of the board.
+
+    Cards held by any player (folded or not) and the known board are
+    removed from the deck. With a flop or turn down every runout is
+    enumerated (at most 1,081 boards), giving the exact expectation. For
+    a pre-flop all-in, exact enumeration is too slow for the pure-Python
+    evaluator, so max_runouts runouts are sampled uniformly (an unbiased
+    estimate).
+
+    Args:
+        winner_determiner (WinnerDeterminer): Resolver used for each runout.
+        players (List[PlayerState]): Players in the hand (folded included).
+        pots (PotStructure): Final pot layers for the hand.
+        board (List[Card]): Community cards known when action closed.
+        button_seat (Optional[int]): Dealer seat, for odd-chip order.
+        max_runouts (int): Runouts sampled for a pre-flop all-in.
+        rng (Optional[random.Random]): Source for sampling (default: a
+            generator private to this module, not the random module's).
+
+    Returns:
+        Dict[str, float]: Expected winnings per player_id.
+
+    Raises:
+        ValueError: If max_runouts < 1.
+    """
+    if max_runouts < 1:
+        raise ValueError(f"max_runouts must be positive, got {max_runouts}")
+
+    missing = BOARD_SIZE - len(board)
+    if missing <= 0:
+        winnings = winner_determiner.award_pots(players, pots, board, button_seat)
+        return {player_id: float(amount) for player_id, amount in winnings.items()}
+
+    dead = {card.get_index() for card in board}
+    for player in players:
+        dead.update(card.get_index() for card in player.hole_cards)
+    remaining = [card for card in FULL_DECK if card.get_index() not in dead]
+
+    if missing <= MAX_EXACT_MISSING:
+        runouts = combinations(remaining, missing)
+        count = comb(len(remaining), missing)
+    else:
+        rng = rng or _SAMPLING_RNG
+        runouts = (rng.sample(remaining, missing) for _ in range(max_runouts))
+        count = max_runouts
+
+    totals = {player.player_id: 0 for player in players}
+    for runout in runouts:
+        winnings = winner_determiner.award_pots(
+            players, pots, board + list(runout), button_seat
+        )
+        for player_id, amount in winnings.items():
+            totals[player_id] += amount
+
+    return {player_id: amount / count for player_id, amount in totals.items()}
@@ -0,0 +1,337 @@
+"""Bounded cache of hand strengths keyed on canonical card sets."""
+
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from poker_engine.card import Card
+
+# Approximate in-process footprint of one cached entry (key int, float value
+# and container overhead). Used to translate a byte budget into an entry cap.
+ENTRY_SIZE_BYTES = 128
+
+LRU = "lru"
+CLOCK = "clock"
+
+_RANK_MASK = (1 << 13) - 1
+
+
+def card_mask(cards: Iterable[Card]) -> int:
+    """
+    Build the 52-bit mask of a set of cards.
+
+    Args:
+        cards (Iterable[Card]): Cards to encode.
+
+    Returns:
+        int: Mask with bit ``card.get_index()`` set for every card.
+    """
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.get_index()
+    return mask
+
+
+def canonical_key(mask: int) -> int:
+    """
+    Canonicalise a card mask under suit isomorphism.
+
+    Hand strength does not depend on which suit is which, only on the rank
+    pattern within each suit. The four 13-bit per-suit rank masks are sorted
+    so that every suit permutation of a hand maps to the same key.
+
+    Args:
+        mask (int): 52-bit card mask (see card_mask).
+
+    Returns:
+        int: 52-bit canonical key.
+    """
+    suits = sorted(
+        ((mask >> (13 * i)) & _RANK_MASK for i in range(4)),
+        reverse=True,
+    )
+    return (suits[0] << 39) | (suits[1] << 26) | (suits[2] << 13) | suits[3]
+
+
+class SharedEvaluationTable:
+    """
+    Fixed-size strength table in a memory-mapped file.
+
+    Every worker that opens the same path sees the same table, so results
+    computed by one process are reused by the others. Slots are direct-mapped
+    by key; a colliding insert overwrites the previous entry. Each slot stores
+    a check word derived from key and value, so a slot that is being written
+    concurrently by another process reads as a miss rather than a wrong value.
+
+    Attributes:
+        path (str): Backing file.
+        num_slots (int): Number of entries the table can hold.
+    """
+
+    _SLOT = struct.Struct("<QdQ")
+    _CHECK_SALT = 0x9E3779B97F4A7C15
+
+    def __init__(self, path: str, num_slots: int = 1 << 16):
+        """
+        Open (or create) a shared table.
+
+        Args:
+            path (str): File to map. Created and zero-filled if missing or
+                smaller than the requested size.
+            num_slots (int): Number of slots (must be positive).
+
+        Raises:
+            ValueError: If num_slots <= 0.
+        """
+        if num_slots <= 0:
+            raise ValueError(f"num_slots must be positive, got {num_slots}")
+
+        self.path = path
+        self.num_slots = num_slots
+        size = num_slots * self._SLOT.size
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+    def _offset(self, key: int) -> int:
+        """Return the byte offset of the slot for key."""
+        slot = ((key * self._CHECK_SALT) & 0xFFFFFFFFFFFFFFFF) % self.num_slots
+        return slot * self._SLOT.size
+
+    def _check(self, key: int, value: float) -> int:
+        """Return the integrity word stored alongside key/value."""
+        value_bits = struct.unpack("<Q", struct.pack("<d", value))[0]
+        return key ^ value_bits ^ self._CHECK_SALT
+
+    def get(self, key: int) -> Optional[float]:
+        """
+        Look up a strength.
+
+        Args:
+            key (int): Canonical key.
+
+        Returns:
+            Optional[float]: Stored strength, or None if absent or torn.
+        """
+        stored_key, value, check = self._SLOT.unpack_from(self._map, self._offset(key))
+        if stored_key != key or check != self._check(key, value):
+            return None
+        return value
+
+    def put(self, key: int, value: float) -> None:
+        """
+        Store a strength, overwriting whatever occupied the slot.
+
+        Args:
+            key (int): Canonical key.
+            value (float): Hand strength.
+        """
+        self._SLOT.pack_into(
+            self._map, self._offset(key), key, value, self._check(key, value)
+        )
+
+    def close(self) -> None:
+        """Unmap the backing file."""
+        self._map.close()
+
+
+class EvaluationCache:
+    """
+    Size-bounded cache of best-hand strengths.
+
+    Sits in front of the 5-of-N hand search in WinnerDeterminer. Keys are
+    canonical 52-bit card masks, so suit-isomorphic hands share an entry.
+    Eviction is LRU (exact recency order) or CLOCK (second-chance ring,
+    cheaper on hits). An optional SharedEvaluationTable acts as a second
+    level shared between worker processes.
+
+    Attributes:
+        max_entries (int): Maximum in-process entries.
+        policy (str): LRU or CLOCK.
+        shared (Optional[SharedEvaluationTable]): Cross-process backing.
+        hits (int): Lookups answered in-process.
+        shared_hits (int): Lookups answered by the shared table.
+        misses (int): Lookups that required evaluation.
+        evictions (int): Entries dropped to respect the cap.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        policy: str = LRU,
+        max_bytes: Optional[int] = None,
+        shared: Optional[SharedEvaluationTable] = None,
+    ):
+        """
+        Initialise the cache.
+
+        Args:
+            max_entries (Optional[int]): Entry cap (default: 100,000).
+            policy (str): LRU or CLOCK (default: LRU).
+            max_bytes (Optional[int]): Memory cap; converted to an entry cap
+                using ENTRY_SIZE_BYTES. The tighter of the two caps applies.
+            shared (Optional[SharedEvaluationTable]): Shared backing table.
+
+        Raises:
+            ValueError: If policy is unknown or the resulting cap is < 1.
+        """
+        if policy not in (LRU, CLOCK):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+
+        caps = [max_entries if max_entries is not None else 100_000]
+        if max_bytes is not None:
+            caps.append(max_bytes // ENTRY_SIZE_BYTES)
+        self.max_entries = min(caps)
+        if self.max_entries < 1:
+            raise ValueError(f"Cache must hold at least one entry, got {self.max_entries}")
+
+        self.policy = policy
+        self.shared = shared
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # LRU storage
+        self._lru: "OrderedDict[int, float]" = OrderedDict()
+
+        # CLOCK storage: parallel slot arrays plus key -> slot index
+        self._clock_slots: Dict[int, int] = {}
+        self._clock_keys: List[int] = []
+        self._clock_values: List[float] = []
+        self._clock_ref: List[bool] = []
+        self._clock_hand = 0
+
+    def get(self, key: int) -> Optional[float]:
+        """
+        Look up a strength by canonical key.
+
+        Args:
+            key (int): Canonical key (see canonical_key).
+
+        Returns:
+            Optional[float]: Cached strength, or None on a miss.
+        """
+        value = self._get_local(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        if self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self.shared_hits += 1
+                self._put_local(key, value)
+                return value
+
+        self.misses += 1
+        return None
+
+    def put(self, key: int, value: float) -> None:
+        """
+        Store a strength.
+
+        Args:
+            key (int): Canonical key.
+            value (float): Hand strength.
+        """
+        self._put_local(key, value)
+        if self.shared is not None:
+            self.shared.put(key, value)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get hit/miss counters.
+
+        Returns:
+            Dict: 'hits', 'shared_hits', 'misses', 'evictions', 'entries'
+            and 'hit_rate' (fraction of lookups not needing evaluation).
+        """
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "hit_rate": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all in-process entries (the shared table is untouched)."""
+        self._lru.clear()
+        self._clock_slots.clear()
+        self._clock_keys.clear()
+        self._clock_values.clear()
+        self._clock_ref.clear()
+        self._clock_hand = 0
+
+    def __len__(self) -> int:
+        """Return the number of in-process entries."""
+        if self.policy == LRU:
+            return len(self._lru)
+        return len(self._clock_slots)
+
+    def _get_local(self, key: int) -> Optional[float]:
+        """Look up key in process-local storage, updating recency."""
+        if self.policy == LRU:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+            return value
+
+        slot = self._clock_slots.get(key)
+        if slot is None:
+            return None
+        self._clock_ref[slot] = True
+        return self._clock_values[slot]
+
+    def _put_local(self, key: int, value: float) -> None:
+        """Insert into process-local storage, evicting if at capacity."""
+        if self.policy == LRU:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            if len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+                self.evictions += 1
+            return
+
+        slot = self._clock_slots.get(key)
+        if slot is not None:
+            self._clock_values[slot] = value
+            self._clock_ref[slot] = True
+            return
+
+        if len(self._clock_keys) < self.max_entries:
+            self._clock_slots[key] = len(self._clock_keys)
+            self._clock_keys.append(key)
+            self._clock_values.append(value)
+            self._clock_ref.append(False)
+            return
+
+        # Sweep the hand, giving referenced entries a second chance
+        while self._clock_ref[self._clock_hand]:
+            self._clock_ref[self._clock_hand] = False
+            self._clock_hand = (self._clock_hand + 1) % self.max_entries
+
+        slot = self._clock_hand
+        del self._clock_slots[self._clock_keys[slot]]
+        self._clock_slots[key] = slot
+        self._clock_keys[slot] = key
+        self._clock_values[slot] = value
+        self._clock_hand = (slot + 1) % self.max_entries
+        self.evictions += 1
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"EvaluationCache(policy={self.policy}, entries={len(self)}, "
+            f"max_entries={self.max_entries}, hits={self.hits}, misses={self.misses})"
+        )
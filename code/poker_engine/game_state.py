@@ -1,9 +1,12 @@
 """Game state representation for the dealer engine."""
 
+import struct
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from poker_engine.card import Card
-from poker_engine.player_state import PlayerState, PlayerStatus
+from poker_engine.chip_ledger import ChipLedger, LedgerEntryKind
+from poker_engine.player_state import PlayerState, PlayerStatus, RoundStatus
+from poker_engine.seat_ring import SeatRing
 
 
 class GamePhase(Enum):
@@ -40,6 +43,54 @@ class GamePhase(Enum):
     """Hand finished, preparing for next hand."""
 
 
+# Phases are stored on GameState as their index into this tuple
+_PHASES = tuple(GamePhase)
+_PHASE_CODES = {phase: code for code, phase in enumerate(_PHASES)}
+
+# Binary layout for GameState.to_bytes() (little-endian, fixed width).
+# Header: version, flags, seats, phase, button, action seat, aggressor seat,
+# pending mask, board count, board card indices, then small blind, big
+# blind, main pot, high bet, last raise size and the side pot count.
+# Each seat: stack, current bet, net chips put in the pot this hand (less
+# any paid out to the seat), status, round status, hole card count and
+# hole card indices. Each side pot: amount and eligible-seat mask.
+# Version 1 seats had no pot contribution.
+_WIRE_VERSION = 2
+_WIRE_HAS_IDS = 0x01
+_NO_SEAT = 0xFF
+_NO_CARD = 0xFF
+_MAX_WIRE_CARDS = 5
+_HEADER = struct.Struct("<9B5s5IB")
+_SEAT = struct.Struct("<2Ii3B5s")
+_SEAT_V1 = struct.Struct("<2I3B5s")
+_SIDE_POT = struct.Struct("<IB")
+
+
+def _pack_cards(cards: List[Card]) -> bytes:
+    """Encode up to five cards as index bytes padded with _NO_CARD."""
+    packed = bytes(card.get_index() for card in cards)
+    return packed + bytes([_NO_CARD]) * (_MAX_WIRE_CARDS - len(packed))
+
+
+def _unpack_cards(packed: bytes, count: int) -> List[Card]:
+    """Decode the first count index bytes written by _pack_cards."""
+    return [Card.from_index(index) for index in packed[:count]]
+
+
+def _net_contribution(ledger: ChipLedger, player_id: str) -> int:
+    """Chips a player has put in the pot less those paid out to them."""
+    index = ledger.index_of(player_id)
+    return ledger.contributions[index] - ledger.awards[index]
+
+
+def _pack_id(value: str) -> bytes:
+    """Encode an ID as a length byte followed by UTF-8."""
+    encoded = value.encode("utf-8")
+    if len(encoded) > 255:
+        raise ValueError(f"ID too long to serialise: {value[:32]}...")
+    return bytes([len(encoded)]) + encoded
+
+
 class SidePot:
     """
     Represents a side pot in the game.
@@ -52,6 +103,8 @@ class SidePot:
         eligible_players (List[str]): Player IDs who can win this pot.
     """
     
+    __slots__ = ("amount", "eligible_players")
+    
     def __init__(self, amount: int, eligible_players: List[str]):
         """
         Initialise a side pot.
@@ -76,6 +129,53 @@ class SidePot:
         return f"SidePot(amount={self.amount}, players={len(self.eligible_players)})"
 
 
+class BettingRound:
+    """
+    Running aggregates for the current betting round.
+    
+    Maintained by GameState as players bet and change status, so validation
+    and snapshots read them instead of scanning the table.
+    
+    Attributes:
+        high_bet (int): Highest current_bet this round (the amount to match).
+        last_raise_size (int): Size of the last full bet or raise; the
+            minimum raise increment (starts at the big blind).
+        aggressor_seat (Optional[int]): Seat of the last full bet or raise,
+            or None if nobody has bet or raised this round.
+        pending_mask (int): Bit per seat for players who can act and still
+            have to respond this round.
+    """
+    
+    __slots__ = ("high_bet", "last_raise_size", "aggressor_seat", "pending_mask")
+    
+    def __init__(self, high_bet: int, last_raise_size: int, pending_mask: int):
+        """
+        Initialise aggregates for a new round.
+        
+        Args:
+            high_bet (int): Bet to match at the start of the round.
+            last_raise_size (int): Minimum raise increment (big blind).
+            pending_mask (int): Seats that must act this round.
+        """
+        self.high_bet = high_bet
+        self.last_raise_size = last_raise_size
+        self.aggressor_seat: Optional[int] = None
+        self.pending_mask = pending_mask
+    
+    @property
+    def to_act(self) -> int:
+        """int: Number of players still to act this round."""
+        return self.pending_mask.bit_count()
+    
+    def __repr__(self) -> str:
+        """Return string representation of the round aggregates."""
+        return (
+            f"BettingRound(high_bet={self.high_bet}, "
+            f"last_raise={self.last_raise_size}, "
+            f"aggressor={self.aggressor_seat}, to_act={self.to_act})"
+        )
+
+
 class GameState:
     """
     Represents the state of the entire game.
@@ -83,7 +183,13 @@ class GameState:
     This class tracks all information about an active poker game: which players
     are seated, what phase the hand is in, the pot(s), community cards, and
     whose turn it is to act. It is updated by the dealer engine as the hand
-    progresses.
+    progresses. Instances are slotted; the phase is held as a small-int code
+    behind the current_phase property.
+    
+    Lookups used on every action are O(1): an id -> seat index, two seat
+    rings (players in the hand, and players still able to act; see SeatRing)
+    and the BettingRound aggregates. Each seated PlayerState notifies its GameState
+    when it bets or its status changes, so these stay current.
     
     Attributes:
         game_id (str): Unique identifier for this game.
@@ -96,8 +202,34 @@ class GameState:
         dealer_button (int): Seat number of the dealer.
         small_blind_amount (int): Small blind bet amount.
         big_blind_amount (int): Big blind bet amount.
+        active_mask (int): Bit per seat for players ACTIVE or ALL_IN.
+        acting_mask (int): Bit per seat for players still able to act (ACTIVE).
+        betting_round (BettingRound): Aggregates for the current betting round.
+        ledger (Optional[ChipLedger]): The hand's chip ledger, over the
+            players in seat order, when one is kept (the dealer engine
+            attaches its own). The pot and each seat's chips in it are
+            read from it.
     """
     
+    __slots__ = (
+        "betting_round",
+        "ledger",
+        "_seat_by_id",
+        "_active_ring",
+        "_acting_ring",
+        "_active_view",
+        "game_id",
+        "players",
+        "_phase",
+        "current_action_player",
+        "main_pot",
+        "side_pots",
+        "community_cards",
+        "dealer_button",
+        "small_blind_amount",
+        "big_blind_amount",
+    )
+    
     def __init__(
         self,
         game_id: str,
@@ -140,7 +272,7 @@ class GameState:
         
         self.game_id = game_id
         self.players = players
-        self.current_phase = GamePhase.WAITING_FOR_PLAYERS
+        self._phase = _PHASE_CODES[GamePhase.WAITING_FOR_PLAYERS]
         self.current_action_player: Optional[int] = None
         self.main_pot = 0
         self.side_pots: List[SidePot] = []
@@ -148,6 +280,27 @@ class GameState:
         self.dealer_button = dealer_button
         self.small_blind_amount = small_blind_amount
         self.big_blind_amount = big_blind_amount
+        self.ledger: Optional[ChipLedger] = None
+        
+        self._seat_by_id: Dict[str, int] = {}
+        self._active_ring = SeatRing(len(players))
+        self._acting_ring = SeatRing(len(players))
+        self._active_view: Optional[Tuple[PlayerState, ...]] = None
+        self.betting_round = BettingRound(0, big_blind_amount, 0)
+        for seat, player in enumerate(players):
+            self._seat_by_id[player.player_id] = seat
+            player._table = self
+            self._on_status_change(player)
+        self.betting_round.pending_mask = self._acting_ring.mask
+    
+    @property
+    def current_phase(self) -> GamePhase:
+        """GamePhase: Current phase of the hand."""
+        return _PHASES[self._phase]
+    
+    @current_phase.setter
+    def current_phase(self, value: GamePhase) -> None:
+        self.advance_phase(value)
     
     def add_to_main_pot(self, amount: int) -> None:
         """
@@ -184,8 +337,11 @@ class GameState:
         Calculate the total pot across main and side pots.
         
         Returns:
-            int: Sum of main_pot and all side_pots.
+            int: The ledger's pot if one is attached, else the sum of
+            main_pot and all side_pots.
         """
+        if self.ledger is not None:
+            return self.ledger.pot_total
         return self.main_pot + sum(pot.amount for pot in self.side_pots)
     
     def advance_phase(self, new_phase: GamePhase) -> None:
@@ -198,9 +354,10 @@ class GameState:
         Raises:
             ValueError: If new_phase is not a valid GamePhase.
         """
-        if not isinstance(new_phase, GamePhase):
+        code = _PHASE_CODES.get(new_phase)
+        if code is None:
             raise ValueError(f"Invalid phase: {new_phase}")
-        self.current_phase = new_phase
+        self._phase = code
     
     def reveal_community_card(self, card: Card) -> None:
         """
@@ -220,6 +377,33 @@ class GameState:
             )
         self.community_cards.append(card)
     
+    @property
+    def active_mask(self) -> int:
+        """int: Bit per seat for players with status ACTIVE or ALL_IN."""
+        return self._active_ring.mask
+    
+    @property
+    def acting_mask(self) -> int:
+        """int: Bit per seat for players with status ACTIVE."""
+        return self._acting_ring.mask
+    
+    @property
+    def active_players(self) -> Tuple[PlayerState, ...]:
+        """
+        Tuple[PlayerState, ...]: Players ACTIVE or ALL_IN, in seat order.
+        
+        Cached until a player's status changes, so hot paths can iterate
+        it repeatedly without rebuilding a list.
+        """
+        view = self._active_view
+        if view is None:
+            view = tuple(
+                player for seat, player in enumerate(self.players)
+                if self._active_ring.mask >> seat & 1
+            )
+            self._active_view = view
+        return view
+    
     def get_active_players(self) -> List[PlayerState]:
         """
         Get all players who are still active in the hand.
@@ -227,7 +411,25 @@ class GameState:
         Returns:
             List[PlayerState]: Players with status ACTIVE or ALL_IN.
         """
-        return [p for p in self.players if p.is_active_in_hand()]
+        return list(self.active_players)
+    
+    def count_active_players(self) -> int:
+        """
+        Count players still in the hand.
+        
+        Returns:
+            int: Number of players with status ACTIVE or ALL_IN.
+        """
+        return self._active_ring.mask.bit_count()
+    
+    def count_acting_players(self) -> int:
+        """
+        Count players still able to act.
+        
+        Returns:
+            int: Number of players with status ACTIVE.
+        """
+        return self._acting_ring.mask.bit_count()
     
     def get_player_by_id(self, player_id: str) -> Optional[PlayerState]:
         """
@@ -239,10 +441,22 @@ class GameState:
         Returns:
             Optional[PlayerState]: The player, or None if not found.
         """
-        for player in self.players:
-            if player.player_id == player_id:
-                return player
-        return None
+        seat = self._seat_by_id.get(player_id)
+        if seat is None:
+            return None
+        return self.players[seat]
+    
+    def get_seat_of(self, player_id: str) -> Optional[int]:
+        """
+        Find a player's seat by their ID.
+        
+        Args:
+            player_id (str): The player's unique identifier.
+        
+        Returns:
+            Optional[int]: Seat index, or None if not seated.
+        """
+        return self._seat_by_id.get(player_id)
     
     def get_player_by_seat(self, seat_number: int) -> Optional[PlayerState]:
         """
@@ -271,35 +485,427 @@ class GameState:
         Returns:
             Optional[int]: Next active seat, or None if no active players remain.
         """
-        num_seats = len(self.players)
-        for offset in range(1, num_seats):
-            seat = (from_seat + offset) % num_seats
-            player = self.players[seat]
+        return self._active_ring.next_after(from_seat)
+    
+    def get_next_acting_seat(self, from_seat: int) -> Optional[int]:
+        """
+        Find the next seat, clockwise, whose player can still act.
+        
+        Like get_next_active_seat but also skips all-in players.
+        
+        Args:
+            from_seat (int): Starting seat (searches from next seat onwards).
+        
+        Returns:
+            Optional[int]: Next ACTIVE seat, or None if nobody can act.
+        """
+        return self._acting_ring.next_after(from_seat)
+    
+    def _on_status_change(self, player: PlayerState) -> None:
+        """Update the seat rings after a seated player's status changes."""
+        seat = self._seat_by_id[player.player_id]
+        if player.is_active_in_hand():
+            self._active_ring.insert(seat)
+        else:
+            self._active_ring.remove(seat)
+        if player.can_act():
+            self._acting_ring.insert(seat)
+        else:
+            self._acting_ring.remove(seat)
+        self._active_view = None
+        self.betting_round.pending_mask &= self._acting_ring.mask
+    
+    def _on_bet(self, player: PlayerState, previous_bet: int) -> None:
+        """
+        Update round aggregates after a seated player's current_bet changes.
+        
+        A bet above the high bet re-opens action for everyone else who can
+        act; it counts as a full raise (setting the minimum increment and
+        the aggressor) only if it raises by at least the last raise size.
+        A bet that grows without exceeding the high bet is a call. Lowering
+        the top bet (clearing round data) rescans for the new high bet.
+        """
+        betting_round = self.betting_round
+        current_bet = player.current_bet
+        if current_bet < previous_bet:
+            if previous_bet == betting_round.high_bet:
+                betting_round.high_bet = max(
+                    (p.current_bet for p in self.active_players), default=0
+                )
+            return
+        
+        seat = self._seat_by_id[player.player_id]
+        bit = 1 << seat
+        increment = current_bet - betting_round.high_bet
+        if increment > 0:
+            if increment >= betting_round.last_raise_size:
+                betting_round.last_raise_size = increment
+                betting_round.aggressor_seat = seat
+            betting_round.high_bet = current_bet
+            betting_round.pending_mask = self._acting_ring.mask & ~bit
+        else:
+            betting_round.pending_mask &= ~bit
+    
+    def _on_round_status_change(self, player: PlayerState) -> None:
+        """Update the pending mask after a seated player's round status changes."""
+        bit = 1 << self._seat_by_id[player.player_id]
+        round_status = player.round_status
+        if round_status == RoundStatus.ACTED:
+            self.betting_round.pending_mask &= ~bit
+        elif round_status == RoundStatus.WAITING_FOR_ACTION:
+            self.betting_round.pending_mask |= bit & self._acting_ring.mask
+    
+    def start_betting_round(self) -> None:
+        """
+        Reset round aggregates at the start of a betting round.
+        
+        Every player able to act becomes pending; the bet to match is the
+        highest current_bet still in the hand (the big blind pre-flop, zero
+        on later streets once round data is cleared) and the minimum raise
+        returns to the big blind. A lone player able to act who already
+        matches the bet has nobody to bet against, so is not pending.
+        """
+        high_bet = 0
+        for player in self.active_players:
+            if player.current_bet > high_bet:
+                high_bet = player.current_bet
+        pending_mask = self._acting_ring.mask
+        if pending_mask.bit_count() == 1:
+            lone_player = self.players[pending_mask.bit_length() - 1]
+            if lone_player.current_bet >= high_bet:
+                pending_mask = 0
+        self.betting_round = BettingRound(
+            high_bet, self.big_blind_amount, pending_mask
+        )
+    
+    def snapshot(self) -> Tuple:
+        """
+        Capture the table as a flat tuple of immutable values.
+        
+        Returns:
+            Tuple: Opaque token for restore().
+        """
+        betting_round = self.betting_round
+        return (
+            tuple(player.snapshot() for player in self.players),
+            self._phase,
+            self.current_action_player,
+            self.dealer_button,
+            self.main_pot,
+            tuple(self.side_pots),
+            tuple(self.community_cards),
+            betting_round.high_bet,
+            betting_round.last_raise_size,
+            betting_round.aggressor_seat,
+            betting_round.pending_mask,
+        )
+    
+    def restore(self, token: Tuple) -> None:
+        """
+        Return the table to a snapshot() of itself.
+        
+        Players are restored in place and the seat rings and active view
+        are rebuilt once from their statuses, if they changed.
+        
+        Args:
+            token (Tuple): Value returned by snapshot().
+        """
+        (
+            player_tokens, self._phase, self.current_action_player,
+            self.dealer_button, self.main_pot, side_pots, community_cards,
+            high_bet, last_raise_size, aggressor_seat, pending_mask,
+        ) = token
+        self.side_pots = list(side_pots)
+        self.community_cards = list(community_cards)
+        
+        active_mask = 0
+        acting_mask = 0
+        for seat, (player, player_token) in enumerate(zip(self.players, player_tokens)):
+            player.restore(player_token)
             if player.is_active_in_hand():
-                return seat
-        return None
+                active_mask |= 1 << seat
+            if player.can_act():
+                acting_mask |= 1 << seat
+        # Links are consistent with the mask, so an unchanged ring is reused
+        if active_mask != self._active_ring.mask:
+            self._active_ring.reset(active_mask)
+            self._active_view = None
+        if acting_mask != self._acting_ring.mask:
+            self._acting_ring.reset(acting_mask)
+        
+        betting_round = self.betting_round
+        betting_round.high_bet = high_bet
+        betting_round.last_raise_size = last_raise_size
+        betting_round.aggressor_seat = aggressor_seat
+        betting_round.pending_mask = pending_mask
     
-    def reset_for_new_hand(self) -> None:
+    def to_bytes(self, include_ids: bool = True) -> bytes:
+        """
+        Serialise the table to a compact, versioned binary form.
+        
+        Every field is fixed width (see the layout above _HEADER), so an
+        8-max table encodes to 195 bytes, plus five per side pot and the
+        IDs. Cards are stored as deck indices and side pots as
+        eligible-seat masks. With a ledger attached, each seat's chips in
+        the pot are stored too, so a hand in progress can be resumed (see
+        DealerEngine.load_bytes()).
+        
+        Args:
+            include_ids (bool): Append the game and player IDs (default:
+                True). Without them the caller must supply the IDs to
+                from_bytes(), e.g. when they are stored once per table.
+        
+        Returns:
+            bytes: Encoded table state.
+        
+        Raises:
+            ValueError: If the hand holds more than five cards per seat, a
+                chip amount does not fit in 32 bits, or an ID exceeds 255
+                bytes of UTF-8.
+        """
+        betting_round = self.betting_round
+        action_seat = self.current_action_player
+        aggressor_seat = betting_round.aggressor_seat
+        ledger = self.ledger
+        try:
+            parts = [_HEADER.pack(
+                _WIRE_VERSION,
+                _WIRE_HAS_IDS if include_ids else 0,
+                len(self.players),
+                self._phase,
+                self.dealer_button,
+                _NO_SEAT if action_seat is None else action_seat,
+                _NO_SEAT if aggressor_seat is None else aggressor_seat,
+                betting_round.pending_mask,
+                len(self.community_cards),
+                _pack_cards(self.community_cards),
+                self.small_blind_amount,
+                self.big_blind_amount,
+                self.main_pot,
+                betting_round.high_bet,
+                betting_round.last_raise_size,
+                len(self.side_pots),
+            )]
+            for player in self.players:
+                if len(player.hole_cards) > _MAX_WIRE_CARDS:
+                    raise ValueError(
+                        f"Cannot serialise {len(player.hole_cards)} hole cards "
+                        f"for {player.player_id}"
+                    )
+                parts.append(_SEAT.pack(
+                    player.stack,
+                    player._current_bet,
+                    0 if ledger is None else _net_contribution(ledger, player.player_id),
+                    player._status,
+                    player._round_status,
+                    len(player.hole_cards),
+                    _pack_cards(player.hole_cards),
+                ))
+            for side_pot in self.side_pots:
+                eligible_mask = 0
+                for player_id in side_pot.eligible_players:
+                    eligible_mask |= 1 << self._seat_by_id[player_id]
+                parts.append(_SIDE_POT.pack(side_pot.amount, eligible_mask))
+        except struct.error as e:
+            raise ValueError(f"Cannot serialise game state: {e}") from e
+        
+        if include_ids:
+            parts.append(_pack_id(self.game_id))
+            parts.extend(_pack_id(player.player_id) for player in self.players)
+        return b"".join(parts)
+    
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        game_id: Optional[str] = None,
+        player_ids: Optional[List[str]] = None,
+    ) -> "GameState":
+        """
+        Rebuild a table from to_bytes() output.
+        
+        Args:
+            data (bytes): Encoded table state.
+            game_id (Optional[str]): Game ID, overriding any in data.
+            player_ids (Optional[List[str]]): Player IDs in seat order,
+                overriding any in data.
+        
+        Version 1 data (written without pot contributions) is still read.
+        
+        Returns:
+            GameState: New table with new PlayerStates, equal to the one
+            that was serialised. If it was serialised with a ledger, a new
+            ledger holds each seat's chips in the pot (one entry per seat;
+            the street and blind of each chip are not kept), so the pot and
+            every starting stack come back too.
+        
+        Raises:
+            ValueError: If data has an unsupported version or is malformed,
+                or IDs are neither in data nor supplied.
+        """
+        data = memoryview(data)
+        try:
+            (
+                version, flags, num_players, phase, button, action_seat,
+                aggressor_seat, pending_mask, board_count, board,
+                small_blind, big_blind, main_pot, high_bet, last_raise_size,
+                side_pot_count,
+            ) = _HEADER.unpack_from(data, 0)
+            if version not in (1, _WIRE_VERSION):
+                raise ValueError(f"Unsupported game state version: {version}")
+            if phase >= len(_PHASES):
+                raise ValueError(f"Invalid phase code: {phase}")
+            offset = _HEADER.size
+            
+            seat_tokens = []
+            contributions = []
+            for _ in range(num_players):
+                if version == 1:
+                    stack, bet, status, round_status, card_count, cards = (
+                        _SEAT_V1.unpack_from(data, offset)
+                    )
+                    offset += _SEAT_V1.size
+                else:
+                    stack, bet, contributed, status, round_status, card_count, cards = (
+                        _SEAT.unpack_from(data, offset)
+                    )
+                    contributions.append(contributed)
+                    offset += _SEAT.size
+                if status >= len(PlayerStatus) or round_status >= len(RoundStatus):
+                    raise ValueError(f"Invalid status codes at offset {offset}")
+                seat_tokens.append((
+                    stack, bet, status, round_status,
+                    _unpack_cards(cards, card_count),
+                ))
+            
+            side_pot_masks = []
+            for _ in range(side_pot_count):
+                side_pot_masks.append(_SIDE_POT.unpack_from(data, offset))
+                offset += _SIDE_POT.size
+            
+            stored_ids = []
+            if flags & _WIRE_HAS_IDS:
+                for _ in range(num_players + 1):
+                    length = data[offset]
+                    stored_ids.append(
+                        bytes(data[offset + 1:offset + 1 + length]).decode("utf-8")
+                    )
+                    offset += 1 + length
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Malformed game state data: {e}") from e
+        
+        if game_id is None:
+            if not stored_ids:
+                raise ValueError("game_id required: data was written without IDs")
+            game_id = stored_ids[0]
+        if player_ids is None:
+            if not stored_ids:
+                raise ValueError("player_ids required: data was written without IDs")
+            player_ids = stored_ids[1:]
+        if len(player_ids) != num_players:
+            raise ValueError(
+                f"Expected {num_players} player IDs, got {len(player_ids)}"
+            )
+        
+        # Seat with a placeholder stack, then restore the encoded fields
+        players = [
+            PlayerState(player_id, seat, 1)
+            for seat, player_id in enumerate(player_ids)
+        ]
+        game_state = cls(game_id, players, small_blind, big_blind, button)
+        side_pots = tuple(
+            SidePot(amount, [
+                player_id for seat, player_id in enumerate(player_ids)
+                if eligible_mask >> seat & 1
+            ])
+            for amount, eligible_mask in side_pot_masks
+        )
+        game_state.restore((
+            tuple(seat_tokens),
+            phase,
+            None if action_seat == _NO_SEAT else action_seat,
+            button,
+            main_pot,
+            side_pots,
+            tuple(_unpack_cards(board, board_count)),
+            high_bet,
+            last_raise_size,
+            None if aggressor_seat == _NO_SEAT else aggressor_seat,
+            pending_mask,
+        ))
+        if any(contributions):
+            ledger = ChipLedger(
+                player_ids,
+                [token[0] + chips for token, chips in zip(seat_tokens, contributions)]
+            )
+            # Chips in before chips out, so no award exceeds the pot
+            for seat, chips in enumerate(contributions):
+                if chips > 0:
+                    ledger.record(seat, 0, chips, LedgerEntryKind.BET)
+            for seat, chips in enumerate(contributions):
+                if chips < 0:
+                    ledger.record(seat, 4, -chips, LedgerEntryKind.AWARD)
+            game_state.ledger = ledger
+        return game_state
+    
+    def revert_player_action(
+        self,
+        seat: int,
+        chips: int,
+        status: PlayerStatus,
+        round_status: RoundStatus,
+    ) -> None:
+        """
+        Undo one player's action and resynchronise the seat rings.
+        
+        The caller restores the betting-round aggregates afterwards.
+        
+        Args:
+            seat (int): Seat that acted.
+            chips (int): Chips the action moved into the pot.
+            status (PlayerStatus): Status before the action.
+            round_status (RoundStatus): Round status before the action.
+        """
+        player = self.players[seat]
+        changed = player.status != status
+        player.revert_action(chips, status, round_status)
+        if changed:
+            self._on_status_change(player)
+    
+    def reset_for_new_hand(self, button: Optional[int] = None) -> None:
         """
         Reset game state for a new hand.
         
         Clears pots, community cards, and resets player states.
         Advances to BLINDS_POSTED phase.
-        Moves dealer button to next seat.
+        Moves dealer button to the next seat with a player in the hand,
+        so it passes over players who are out of chips.
+        
+        Args:
+            button (Optional[int]): Seat to put the button on instead
+                (default: move it on).
         """
         # Reset all players
         for player in self.players:
             player.reset_for_new_hand()
         
+        self.start_betting_round()
+        
         # Reset game pots and cards
         self.main_pot = 0
         self.side_pots = []
         self.community_cards = []
         
         # Advance phase and move button
-        self.current_phase = GamePhase.BLINDS_POSTED
+        self._phase = _PHASE_CODES[GamePhase.BLINDS_POSTED]
         self.current_action_player = None
-        self.dealer_button = (self.dealer_button + 1) % len(self.players)
+        if button is not None:
+            self.dealer_button = button
+            return
+        next_button = self._active_ring.next_after(self.dealer_button)
+        if next_button is None:
+            next_button = (self.dealer_button + 1) % len(self.players)
+        self.dealer_button = next_button
     
     def __repr__(self) -> str:
         """Return string representation of game state."""
@@ -1,7 +1,21 @@
 """Hand evaluation logic for poker hands."""
 
+from itertools import combinations
+
 from poker_engine.card import Card
 
+# Rank values of A-2-3-4-5, highest first
+_WHEEL = [12, 3, 2, 1, 0]
+
+# Weight of each card, highest first, in a hand's strength
+_KICKER_WEIGHTS = tuple(10 ** (2 - i) for i in range(5))
+
+# One prime per rank value: a product of five identifies their ranks
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# strength() by rank product (negated for flushes), filled as hands are seen
+_STRENGTH_BY_KEY = {}
+
 
 class HandEvaluator:
     """Evaluates and ranks poker hands."""
@@ -147,6 +161,143 @@ class HandEvaluator:
             'strength': self._calculate_strength(self.HIGH_CARD, cards)
         }
     
+    def strength(self, cards):
+        """
+        Get the strength of a 5-card hand without the rest of evaluate().
+        
+        Returns exactly evaluate(cards)['strength'], but classifies the hand
+        from its sorted rank values in one pass and builds no kicker lists
+        or result dict. Showdowns compare 21 combinations per player, so
+        this is the evaluator's hot path.
+        
+        Args:
+            cards (list): List of 5 Card objects
+        
+        Returns:
+            float: Strength for comparison, as in evaluate().
+        
+        Raises:
+            ValueError: If not exactly 5 cards provided
+        """
+        if len(cards) != 5:
+            raise ValueError(f"Expected 5 cards, got {len(cards)}")
+        
+        rank_values = Card.RANK_VALUES
+        values = sorted([rank_values[c.rank] for c in cards], reverse=True)
+        suit = cards[0].suit
+        flush = all(c.suit == suit for c in cards)
+        distinct = len(set(values))
+        
+        if distinct == 5:
+            straight = values[0] - values[4] == 4 or values == _WHEEL
+            if flush and straight:
+                hand_rank = self.ROYAL_FLUSH if values[4] == 8 else self.STRAIGHT_FLUSH
+            elif flush:
+                hand_rank = self.FLUSH
+            elif straight:
+                hand_rank = self.STRAIGHT
+            else:
+                hand_rank = self.HIGH_CARD
+        elif distinct == 2:
+            # Four of a kind leaves one odd card at an end
+            if values[0] == values[3] or values[1] == values[4]:
+                hand_rank = self.FOUR_OF_A_KIND
+            else:
+                hand_rank = self.FULL_HOUSE
+        elif flush:
+            # Only reachable with repeated cards, as in evaluate()
+            hand_rank = self.FLUSH
+        elif distinct == 3:
+            if values[0] == values[2] or values[1] == values[3] or values[2] == values[4]:
+                hand_rank = self.THREE_OF_A_KIND
+            else:
+                hand_rank = self.TWO_PAIR
+        elif distinct == 4:
+            hand_rank = self.ONE_PAIR
+        else:
+            # Five of one rank (repeated cards): evaluate() finds no pattern
+            hand_rank = self.HIGH_CARD
+        
+        # Same terms, added in the same order, as _calculate_strength()
+        strength = hand_rank * 100000
+        for value, weight in zip(values, _KICKER_WEIGHTS):
+            strength += value * weight
+        return strength
+    
+    def best_strength(self, cards):
+        """
+        Get the strength of the best 5-card hand among 5 or more cards.
+        
+        Equal to the largest strength() over every 5-card combination. A
+        combination's strength depends only on its ranks and on whether it
+        is a flush, so each is keyed by the product of its rank primes and
+        looked up in a table shared by all evaluators; only combinations
+        never seen before are classified.
+        
+        Args:
+            cards (list): 5 or more Card objects (7 in Texas Hold'em)
+        
+        Returns:
+            float: Best strength, as compared by evaluate().
+        
+        Raises:
+            ValueError: If fewer than 5 cards provided
+        """
+        if len(cards) < 5:
+            raise ValueError(f"Expected at least 5 cards, got {len(cards)}")
+        return self._best_keyed_strength(cards, 0, -1)
+    
+    def extend_best_strength(self, known_cards, known_best, new_cards):
+        """
+        Get best_strength() of known_cards plus new_cards, given known_cards' own.
+        
+        Only the combinations using at least one new card are looked up,
+        so a board run several times costs each run just its own cards.
+        
+        Args:
+            known_cards (list): Cards already evaluated.
+            known_best (float): best_strength(known_cards), or -1 if there
+                are fewer than 5 known cards.
+            new_cards (list): Cards added.
+        
+        Returns:
+            float: Best strength over all the cards.
+        
+        Raises:
+            ValueError: If fewer than 5 cards in total
+        """
+        cards = list(known_cards) + list(new_cards)
+        if len(cards) < 5:
+            raise ValueError(f"Expected at least 5 cards, got {len(cards)}")
+        return self._best_keyed_strength(cards, len(known_cards), known_best)
+    
+    def _best_keyed_strength(self, cards, first_new, best):
+        """
+        Best strength of the combinations using a card at index first_new
+        or later, or best if none beats it (see best_strength()).
+        """
+        rank_values = Card.RANK_VALUES
+        primes = [_RANK_PRIMES[rank_values[c.rank]] for c in cards]
+        suits = [c.suit for c in cards]
+        table = _STRENGTH_BY_KEY
+        # Suits only matter if five cards share one
+        flush_possible = max(map(suits.count, set(suits))) >= 5
+        
+        for combo in combinations(range(len(cards)), 5):
+            a, b, c, d, e = combo
+            # Combinations are sorted, so e < first_new means all known cards
+            if e < first_new:
+                continue
+            key = primes[a] * primes[b] * primes[c] * primes[d] * primes[e]
+            if flush_possible and suits[a] == suits[b] == suits[c] == suits[d] == suits[e]:
+                key = -key
+            strength = table.get(key)
+            if strength is None:
+                strength = table[key] = self.strength([cards[i] for i in combo])
+            if strength > best:
+                best = strength
+        return best
+    
     def compare_hands(self, hand1, hand2):
         """
         Compare two 5-card hands.
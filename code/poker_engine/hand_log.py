@@ -0,0 +1,271 @@
+"""Append-only log of every state change in a hand, for history and replay."""
+
+from array import array
+from enum import IntEnum
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from poker_engine.betting_validator import ActionType
+
+# Action codes stored in ACTION events
+ACTIONS = tuple(ActionType)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# Seat of a DEAL event for a board card, and for a card of a runout
+BOARD_SEAT = -1
+RUNOUT_SEAT = -2
+
+
+class EventKind(IntEnum):
+    """Kind of hand event."""
+
+    DEAL = 0
+    """A card dealt: code is its get_index(); seat is the player, or
+    BOARD_SEAT / RUNOUT_SEAT."""
+
+    BLIND = 1
+    """A forced bet: amount is the chips posted."""
+
+    ACTION = 2
+    """A player's action: code is its ActionType code (see ACTIONS) and
+    amount the chips it moved into the pot."""
+
+    STREET = 3
+    """Betting moved on: code is the new street (1 = flop ... 4 = showdown)."""
+
+    SHOWDOWN = 4
+    """Hands compared: code is the number of runouts (0 = the board once)."""
+
+    AWARD = 5
+    """Pot chips paid out: amount is the chips won."""
+
+
+class HandEvent(NamedTuple):
+    """
+    One decoded hand event (see HandLog).
+
+    Attributes:
+        kind (EventKind): What happened.
+        seat (int): Seat involved (-1 if none, or a DEAL to the board).
+        code (int): Card, action or street code, by kind.
+        amount (int): Chips moved (0 if none).
+    """
+
+    kind: EventKind
+    seat: int
+    code: int
+    amount: int
+
+
+class HandLog:
+    """
+    Array-backed log of the events of one hand.
+
+    Each event is (kind, seat, code, amount), stored in parallel typed
+    arrays, so appending is a few array writes and a hand of events takes
+    tens of bytes per event rather than an object each. With the players,
+    starting stacks and button it holds everything needed to play the hand
+    again (see DealerEngine.replay).
+
+    Attributes:
+        player_ids (List[str]): Player in each seat.
+        starting_stacks (List[int]): Stack in each seat when the hand began.
+        button (int): Dealer button seat.
+    """
+
+    def __init__(
+        self,
+        player_ids: List[str],
+        starting_stacks: Optional[List[int]] = None,
+        button: int = 0,
+    ):
+        """
+        Initialise an empty log.
+
+        Args:
+            player_ids (List[str]): Players in seat order.
+            starting_stacks (Optional[List[int]]): Stacks at hand start
+                (default: zeros).
+            button (int): Dealer button seat (default: 0).
+
+        Raises:
+            ValueError: If starting_stacks length differs from player_ids.
+        """
+        self.player_ids = list(player_ids)
+        self.starting_stacks: List[int] = []
+        self.button = 0
+
+        self._kinds = array("B")
+        self._seats = array("b")
+        self._codes = array("B")
+        self._amounts = array("q")
+        self.reset(starting_stacks, button)
+
+    def reset(self, starting_stacks: Optional[List[int]] = None, button: int = 0) -> None:
+        """
+        Empty the log for a new hand between the same players.
+
+        The typed arrays are cleared in place, so a table reuses one log
+        for every hand.
+
+        Args:
+            starting_stacks (Optional[List[int]]): Stacks at hand start
+                (default: zeros).
+            button (int): Dealer button seat (default: 0).
+
+        Raises:
+            ValueError: If starting_stacks length differs from player_ids.
+        """
+        count = len(self.player_ids)
+        if starting_stacks is not None and len(starting_stacks) != count:
+            raise ValueError(
+                f"Expected {count} starting stacks, got {len(starting_stacks)}"
+            )
+        # Replaced, not updated in place: snapshot() tokens share the list
+        self.starting_stacks = (
+            list(starting_stacks) if starting_stacks is not None else [0] * count
+        )
+        self.button = button
+        del self._kinds[:]
+        del self._seats[:]
+        del self._codes[:]
+        del self._amounts[:]
+
+    def record(self, kind: EventKind, seat: int = -1, code: int = 0, amount: int = 0) -> None:
+        """
+        Append an event.
+
+        Args:
+            kind (EventKind): What happened.
+            seat (int): Seat involved (default: -1, none).
+            code (int): Card, action or street code, by kind (default: 0).
+            amount (int): Chips moved (default: 0).
+        """
+        self._kinds.append(kind)
+        self._seats.append(seat)
+        self._codes.append(code)
+        self._amounts.append(amount)
+
+    def pop(self) -> None:
+        """
+        Remove the most recent event.
+
+        Raises:
+            IndexError: If the log is empty.
+        """
+        self._kinds.pop()
+        self._seats.pop()
+        self._codes.pop()
+        self._amounts.pop()
+
+    def awards(self) -> Dict[str, int]:
+        """
+        Get the chips paid out by AWARD events.
+
+        Returns:
+            Dict[str, int]: Chips won per player_id, for players paid.
+        """
+        awards: Dict[str, int] = {}
+        for i, kind in enumerate(self._kinds):
+            if kind == EventKind.AWARD:
+                player_id = self.player_ids[self._seats[i]]
+                awards[player_id] = awards.get(player_id, 0) + self._amounts[i]
+        return awards
+
+    def copy(self) -> "HandLog":
+        """
+        Copy the log, e.g. to keep a hand after the table resets it.
+
+        Returns:
+            HandLog: Independent log with the same events.
+        """
+        log = HandLog(self.player_ids, self.starting_stacks, self.button)
+        log.restore(self.snapshot())
+        return log
+
+    def snapshot(self) -> Tuple:
+        """
+        Capture the events and header.
+
+        Returns:
+            Tuple: Opaque token for restore(); the typed arrays are copied
+            with a single buffer copy each.
+        """
+        return (
+            self._kinds[:],
+            self._seats[:],
+            self._codes[:],
+            self._amounts[:],
+            self.starting_stacks,
+            self.button,
+        )
+
+    def restore(self, token: Tuple) -> None:
+        """
+        Return the log to a snapshot() of itself.
+
+        Args:
+            token (Tuple): Value returned by snapshot().
+        """
+        kinds, seats, codes, amounts, self.starting_stacks, self.button = token
+        self._kinds[:] = kinds
+        self._seats[:] = seats
+        self._codes[:] = codes
+        self._amounts[:] = amounts
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self._kinds)
+
+    def __getitem__(self, index: int) -> HandEvent:
+        """Return the event at index, decoded."""
+        return HandEvent(
+            EventKind(self._kinds[index]),
+            self._seats[index],
+            self._codes[index],
+            self._amounts[index],
+        )
+
+    def __iter__(self) -> Iterator[HandEvent]:
+        """Iterate over the events in order, decoded."""
+        for kind, seat, code, amount in zip(
+            self._kinds, self._seats, self._codes, self._amounts
+        ):
+            yield HandEvent(EventKind(kind), seat, code, amount)
+
+    def to_dict(self) -> Dict:
+        """
+        Serialise the log for a hand history.
+
+        Returns:
+            Dict: 'player_ids', 'starting_stacks', 'button' and 'events',
+            where each event is [kind, seat, code, amount].
+        """
+        return {
+            "player_ids": list(self.player_ids),
+            "starting_stacks": list(self.starting_stacks),
+            "button": self.button,
+            "events": [
+                [self._kinds[i], self._seats[i], self._codes[i], self._amounts[i]]
+                for i in range(len(self._kinds))
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "HandLog":
+        """
+        Rebuild a log from to_dict() output.
+
+        Args:
+            data (Dict): Serialised log.
+
+        Returns:
+            HandLog: Equivalent log.
+        """
+        log = cls(data["player_ids"], data["starting_stacks"], data["button"])
+        for kind, seat, code, amount in data["events"]:
+            log.record(EventKind(kind), seat, code, amount)
+        return log
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"HandLog(events={len(self)}, button={self.button})"
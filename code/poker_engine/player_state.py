@@ -1,7 +1,7 @@
 """Player state representation for the dealer engine."""
 
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from poker_engine.card import Card
 
 
@@ -34,12 +34,27 @@ class RoundStatus(Enum):
     """Player is folded or all-in; no further action this round."""
 
 
+# Statuses are stored as small-int codes (index into these tuples) so that
+# slotted PlayerState instances hold no per-object enum references.
+_PLAYER_STATUSES = tuple(PlayerStatus)
+_PLAYER_STATUS_CODES = {status: code for code, status in enumerate(_PLAYER_STATUSES)}
+_ROUND_STATUSES = tuple(RoundStatus)
+_ROUND_STATUS_CODES = {status: code for code, status in enumerate(_ROUND_STATUSES)}
+
+_ACTIVE = _PLAYER_STATUS_CODES[PlayerStatus.ACTIVE]
+_FOLDED = _PLAYER_STATUS_CODES[PlayerStatus.FOLDED]
+_ALL_IN = _PLAYER_STATUS_CODES[PlayerStatus.ALL_IN]
+_OUT_OF_HAND = _PLAYER_STATUS_CODES[PlayerStatus.OUT_OF_HAND]
+
+
 class PlayerState:
     """
     Represents the state of a single player in the game.
     
     This class tracks all information about a player: their stack, cards, position,
     and current status. It is updated by the dealer engine as the hand progresses.
+    Instances are slotted and keep both statuses as small-int codes; the
+    status and round_status properties translate to and from the enums.
     
     Attributes:
         player_id (str): Unique identifier for the player/bot.
@@ -51,6 +66,17 @@ class PlayerState:
         round_status (RoundStatus): Status within current betting round.
     """
     
+    __slots__ = (
+        "player_id",
+        "seat_number",
+        "stack",
+        "_current_bet",
+        "hole_cards",
+        "_status",
+        "_round_status",
+        "_table",
+    )
+    
     def __init__(
         self,
         player_id: str,
@@ -76,10 +102,58 @@ class PlayerState:
         self.player_id = player_id
         self.seat_number = seat_number
         self.stack = starting_stack
-        self.current_bet = 0
+        self._current_bet = 0
         self.hole_cards: List[Card] = []
-        self.status = PlayerStatus.ACTIVE
-        self.round_status = RoundStatus.SITTING_OUT
+        self._status = _ACTIVE
+        self._round_status = _ROUND_STATUS_CODES[RoundStatus.SITTING_OUT]
+        # GameState seating this player, notified when status changes
+        self._table = None
+    
+    @property
+    def current_bet(self) -> int:
+        """int: Chips bet in the current round."""
+        return self._current_bet
+    
+    @current_bet.setter
+    def current_bet(self, value: int) -> None:
+        previous = self._current_bet
+        self._current_bet = value
+        if value != previous and self._table is not None:
+            self._table._on_bet(self, previous)
+    
+    @property
+    def status(self) -> PlayerStatus:
+        """PlayerStatus: Current status in the hand."""
+        return _PLAYER_STATUSES[self._status]
+    
+    @status.setter
+    def status(self, value: PlayerStatus) -> None:
+        code = _PLAYER_STATUS_CODES.get(value)
+        if code is None:
+            raise ValueError(f"Invalid player status: {value}")
+        self._set_status(code)
+    
+    @property
+    def round_status(self) -> RoundStatus:
+        """RoundStatus: Status within the current betting round."""
+        return _ROUND_STATUSES[self._round_status]
+    
+    @round_status.setter
+    def round_status(self, value: RoundStatus) -> None:
+        code = _ROUND_STATUS_CODES.get(value)
+        if code is None:
+            raise ValueError(f"Invalid round status: {value}")
+        self._round_status = code
+        if self._table is not None:
+            self._table._on_round_status_change(self)
+    
+    def _set_status(self, code: int) -> None:
+        """Store a status code and tell the owning table, if any."""
+        if code == self._status:
+            return
+        self._status = code
+        if self._table is not None:
+            self._table._on_status_change(self)
     
     def post_bet(self, amount: int) -> None:
         """
@@ -111,7 +185,7 @@ class PlayerState:
         The player forfeits all bets in the current pot.
         They cannot win the pot and cannot act further.
         """
-        self.status = PlayerStatus.FOLDED
+        self._set_status(_FOLDED)
         self.round_status = RoundStatus.SITTING_OUT
     
     def go_all_in(self) -> None:
@@ -121,7 +195,7 @@ class PlayerState:
         All remaining chips have been bet.
         The player cannot act further but may still win the pot.
         """
-        self.status = PlayerStatus.ALL_IN
+        self._set_status(_ALL_IN)
         self.round_status = RoundStatus.SITTING_OUT
     
     def deal_hole_cards(self, cards: List[Card]) -> None:
@@ -160,7 +234,16 @@ class PlayerState:
         Returns:
             bool: True if status is ACTIVE or ALL_IN, False otherwise.
         """
-        return self.status in [PlayerStatus.ACTIVE, PlayerStatus.ALL_IN]
+        return self._status == _ACTIVE or self._status == _ALL_IN
+    
+    def can_act(self) -> bool:
+        """
+        Check if the player may still take betting actions this hand.
+        
+        Returns:
+            bool: True if status is ACTIVE (not folded, all-in or out).
+        """
+        return self._status == _ACTIVE
     
     def reset_for_new_hand(self) -> None:
         """
@@ -168,12 +251,69 @@ class PlayerState:
         
         Restores ACTIVE status, clears round data, resets bets, and
         clears hole cards. Does NOT reset stack (chips are preserved).
+        A player with no chips left is OUT_OF_HAND.
         """
         if self.stack > 0:
-            self.status = PlayerStatus.ACTIVE
+            self._set_status(_ACTIVE)
+        else:
+            self._set_status(_OUT_OF_HAND)
         self.clear_round_data()
         self.hole_cards = []
     
+    def snapshot(self) -> Tuple:
+        """
+        Capture the mutable fields as a flat tuple.
+        
+        Hole cards are shared, not copied: the list is only ever replaced,
+        never modified in place.
+        
+        Returns:
+            Tuple: (stack, current_bet, status code, round status code,
+            hole_cards).
+        """
+        return (
+            self.stack, self._current_bet, self._status,
+            self._round_status, self.hole_cards,
+        )
+    
+    def restore(self, token: Tuple) -> None:
+        """
+        Return to a snapshot() of this player.
+        
+        Writes the fields directly without notifying the table; the owning
+        GameState resynchronises its indexes after restoring every player.
+        
+        Args:
+            token (Tuple): Value returned by snapshot().
+        """
+        (
+            self.stack, self._current_bet, self._status,
+            self._round_status, self.hole_cards,
+        ) = token
+    
+    def revert_action(
+        self,
+        chips: int,
+        status: PlayerStatus,
+        round_status: RoundStatus,
+    ) -> None:
+        """
+        Undo an action: return chips from the round bet to the stack and
+        restore both statuses.
+        
+        Like restore(), this does not notify the table; the owning GameState
+        resynchronises (see GameState.revert_player_action).
+        
+        Args:
+            chips (int): Chips the action moved into the pot.
+            status (PlayerStatus): Status before the action.
+            round_status (RoundStatus): Round status before the action.
+        """
+        self.stack += chips
+        self._current_bet -= chips
+        self._status = _PLAYER_STATUS_CODES[status]
+        self._round_status = _ROUND_STATUS_CODES[round_status]
+    
     def __repr__(self) -> str:
         """Return string representation of player state."""
         return (
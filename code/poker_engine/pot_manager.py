@@ -1,11 +1,61 @@
 """Pot management for the dealer engine."""
 
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional, Set, Tuple
 import logging
 
+from poker_engine.chip_ledger import ChipLedger, LedgerEntryKind
+
 logger = logging.getLogger(__name__)
 
 
+class PotLayer(NamedTuple):
+    """
+    One main or side pot produced by PotManager.build_pots().
+    
+    Attributes:
+        amount (int): Chips in this layer, including dead money from folds.
+        eligible_mask (int): Bit i set if player_ids[i] of the owning
+            PotStructure may win this layer.
+    """
+    
+    amount: int
+    eligible_mask: int
+
+
+class PotStructure(NamedTuple):
+    """
+    Immutable result of layering a hand's contributions into pots.
+    
+    Layers are ordered from the main pot (widest eligibility) to the last
+    side pot. Amounts sum exactly to the chips contributed; nothing is
+    double-counted and no adjustment is needed before awarding.
+    
+    Attributes:
+        player_ids (Tuple[str, ...]): Player for each eligibility bit.
+        pots (Tuple[PotLayer, ...]): Main pot followed by side pots.
+        total (int): Sum of all layer amounts.
+    """
+    
+    player_ids: Tuple[str, ...]
+    pots: Tuple[PotLayer, ...]
+    total: int
+    
+    def eligible_players(self, pot: PotLayer) -> List[str]:
+        """
+        Expand a layer's eligibility mask into player IDs.
+        
+        Args:
+            pot (PotLayer): A layer from this structure.
+        
+        Returns:
+            List[str]: Eligible player IDs in seat-list order.
+        """
+        return [
+            player_id for i, player_id in enumerate(self.player_ids)
+            if pot.eligible_mask >> i & 1
+        ]
+
+
 class Pot:
     """
     Represents a single pot in the game.
@@ -19,6 +69,8 @@ class Pot:
         eligible_players (List[str]): Player IDs who contributed and can win.
     """
     
+    __slots__ = ("amount", "eligible_players")
+    
     def __init__(self, amount: int, eligible_players: List[str]):
         """
         Initialise a pot.
@@ -65,58 +117,132 @@ class PotManager:
     Manages main pot and side pots during a hand.
     
     Tracks player contributions and creates side pots when players go all-in.
+    Contributions are read from a ChipLedger, which is shared with the
+    dealer engine so that every chip movement is recorded in one place.
     
     Attributes:
+        ledger (ChipLedger): Record of chip movements this hand.
         main_pot (Pot): Main pot accessible to all active players.
         side_pots (List[Pot]): Side pots for all-in scenarios.
         player_contributions (Dict[str, int]): Total chips each player has contributed.
         all_in_amounts (Dict[str, int]): Stack size when each player went all-in.
+        folded_players (Set[str]): Players whose contributions are dead money.
     """
     
-    def __init__(self, active_player_ids: List[str]):
+    def __init__(
+        self,
+        active_player_ids: List[str],
+        ledger: Optional[ChipLedger] = None
+    ):
         """
         Initialise the pot manager for a hand.
         
         Args:
             active_player_ids (List[str]): IDs of all active players at start of hand.
+            ledger (Optional[ChipLedger]): Hand ledger to record into
+                (default: a private ledger over active_player_ids).
         
         Raises:
-            ValueError: If active_player_ids is empty.
+            ValueError: If active_player_ids is empty or a player is
+                missing from the ledger.
         """
         if not active_player_ids:
             raise ValueError("Must have at least one active player")
         
-        self.main_pot = Pot(0, active_player_ids.copy())
+        self.ledger = ledger if ledger is not None else ChipLedger(active_player_ids)
+        self.all_in_amounts: Dict[str, int] = {}
+        self.folded_players: Set[str] = set()
+        self.reset(active_player_ids)
+    
+    def reset(self, active_player_ids: List[str]) -> None:
+        """
+        Clear the pots for a new hand, keeping the same ledger.
+        
+        The caller resets the ledger itself (the dealer engine does so
+        with the hand's starting stacks).
+        
+        Args:
+            active_player_ids (List[str]): IDs of all active players at start of hand.
+        
+        Raises:
+            ValueError: If active_player_ids is empty or a player is
+                missing from the ledger.
+        """
+        if not active_player_ids:
+            raise ValueError("Must have at least one active player")
+        
+        # Replaced, not updated in place: snapshot() tokens share the dict
+        self._ledger_index: Dict[str, int] = {
+            player_id: self.ledger.index_of(player_id)
+            for player_id in active_player_ids
+        }
+        # Layered view, filled in by calculate_side_pots()
+        self._main_pot: Optional[Pot] = None
         self.side_pots: List[Pot] = []
-        self.player_contributions: Dict[str, int] = {
-            player_id: 0 for player_id in active_player_ids
+        self.all_in_amounts.clear()
+        self.folded_players.clear()
+    
+    @property
+    def main_pot(self) -> Pot:
+        """Main pot: the first layer once calculated, else every chip in."""
+        if self._main_pot is not None:
+            return self._main_pot
+        return Pot(self.ledger.pot_total, list(self._ledger_index))
+    
+    @property
+    def player_contributions(self) -> Dict[str, int]:
+        """Total chips each player has contributed this hand."""
+        contributions = self.ledger.contributions
+        return {
+            player_id: contributions[index]
+            for player_id, index in self._ledger_index.items()
         }
-        self.all_in_amounts: Dict[str, int] = {}
     
-    def add_to_pot(self, player_id: str, amount: int) -> None:
+    def add_to_pot(
+        self,
+        player_id: str,
+        amount: int,
+        street: int = 0,
+        kind: LedgerEntryKind = LedgerEntryKind.BET
+    ) -> None:
         """
-        Add chips to the appropriate pot from a player.
+        Add chips to the pot from a player.
         
-        Chips go to the main pot first. When a player is all-in, chips beyond
-        their all-in amount create side pots.
+        The movement is appended to the ledger; layering into main and
+        side pots happens in build_pots().
         
         Args:
             player_id (str): ID of player adding chips.
             amount (int): Chips to add.
+            street (int): Betting round index for the ledger entry.
+            kind (LedgerEntryKind): BLIND or BET.
         
         Raises:
             ValueError: If amount < 0 or player_id not in game.
         """
         if amount < 0:
             raise ValueError(f"Cannot add negative chips: {amount}")
-        if player_id not in self.player_contributions:
+        if player_id not in self._ledger_index:
             raise ValueError(f"Player {player_id} not in this game")
         
-        # Track total contribution
-        self.player_contributions[player_id] += amount
+        if amount > 0:
+            self.ledger.record(self._ledger_index[player_id], street, amount, kind)
+            # Any previously calculated layers are now stale
+            self._main_pot = None
+            self.side_pots = []
+    
+    def pop_contribution(self) -> None:
+        """
+        Remove the most recent add_to_pot() from the ledger.
+        
+        Used to undo an action; calculated layers are dropped.
         
-        # Add to main pot (simple case: chips go to main pot)
-        self.main_pot.add(amount)
+        Raises:
+            IndexError: If nothing has been added.
+        """
+        self.ledger.pop()
+        self._main_pot = None
+        self.side_pots = []
     
     def set_all_in(self, player_id: str, remaining_stack: int) -> None:
         """
@@ -132,70 +258,154 @@ class PotManager:
         Raises:
             ValueError: If player_id not in game.
         """
-        if player_id not in self.player_contributions:
+        if player_id not in self._ledger_index:
             raise ValueError(f"Player {player_id} not in this game")
         
         # Record total contributed amount as their all-in limit
-        self.all_in_amounts[player_id] = self.player_contributions[player_id]
+        self.all_in_amounts[player_id] = self.get_player_contribution(player_id)
     
-    def calculate_side_pots(self) -> None:
+    def set_folded(self, player_id: str) -> None:
         """
-        Create side pots based on all-in amounts.
+        Mark a player as folded.
+        
+        Their contributions stay in the pot as dead money but they are no
+        longer eligible to win any layer.
         
-        When multiple players have different all-in amounts, side pots ensure
-        that only eligible players can win. For example:
+        Args:
+            player_id (str): ID of player folding.
+        
+        Raises:
+            ValueError: If player_id not in game.
+        """
+        if player_id not in self._ledger_index:
+            raise ValueError(f"Player {player_id} not in this game")
+        self.folded_players.add(player_id)
+    
+    def snapshot(self) -> Tuple:
+        """
+        Capture the pot state for restore().
+        
+        Returns:
+            Tuple: Ledger token, folded players, all-in amounts and the
+            players in the hand.
+        """
+        return (
+            self.ledger.snapshot(),
+            frozenset(self.folded_players),
+            tuple(self.all_in_amounts.items()),
+            self._ledger_index,
+        )
+    
+    def restore(self, token: Tuple) -> None:
+        """
+        Return the pot state to a snapshot() of this manager.
+        
+        Calculated layers are dropped; they are rebuilt on demand.
+        
+        Args:
+            token (Tuple): Value returned by snapshot().
+        """
+        ledger_token, folded_players, all_in_amounts, self._ledger_index = token
+        self.ledger.restore(ledger_token)
+        self.folded_players = set(folded_players)
+        self.all_in_amounts = dict(all_in_amounts)
+        self._main_pot = None
+        self.side_pots = []
+    
+    def build_pots(self) -> PotStructure:
+        """
+        Layer all contributions into a main pot and side pots.
+        
+        Contributions are sorted once. Walking them from smallest to
+        largest, each distinct contribution level closes a layer worth
+        (level - previous level) from every player who reached it, folded
+        or not. A layer is eligible to the live players who reached it;
+        adjacent layers with the same eligibility are merged, and dead
+        money in a layer no live player reached rolls into the next layer
+        that has one (or the last layer if none does). For example:
         
         - Player A: contributes 50 (all-in)
-        - Player B: contributes 100
+        - Player B: contributes 30 (folded)
         - Player C: contributes 100
+        - Player D: contributes 100
         
-        Main pot: 50 × 3 = 150 (everyone eligible)
-        Side pot 1: 50 × 2 = 100 (B and C only)
+        Main pot: 30 × 4 + 20 × 3 = 180 (A, C and D eligible)
+        Side pot 1: 50 × 2 = 100 (C and D only)
         
-        Side pots are created in order of contribution amounts.
+        Returns:
+            PotStructure: Immutable layers, O(n log n) in players.
         """
-        if not self.all_in_amounts:
-            # No all-ins: everything stays in main pot
-            return
+        contributions = self.player_contributions
+        player_ids = tuple(contributions)
+        live_mask = 0
+        for i, player_id in enumerate(player_ids):
+            if player_id not in self.folded_players:
+                live_mask |= 1 << i
+        if not live_mask:
+            # Everyone folded (only reachable in tests); nobody forfeits
+            live_mask = (1 << len(player_ids)) - 1
         
-        # Get unique all-in amounts, sorted low to high
-        sorted_amounts = sorted(set(self.all_in_amounts.values()))
+        order = sorted(
+            range(len(player_ids)),
+            key=lambda i: contributions[player_ids[i]]
+        )
         
-        # Move chips from main pot to side pots
-        # For each all-in level, create a side pot
+        pots: List[PotLayer] = []
+        remaining_mask = (1 << len(player_ids)) - 1
         previous_level = 0
+        carried = 0
         
-        for all_in_level in sorted_amounts:
-            # Chips contributed between previous level and this level
-            chips_per_player = all_in_level - previous_level
-            
-            # Count how many players contributed at least this much
-            eligible = [
-                player_id for player_id, contributed in self.player_contributions.items()
-                if contributed >= all_in_level
-            ]
-            
-            if eligible:
-                side_pot_amount = chips_per_player * len(eligible)
-                # Move chips from main pot into this side pot to prevent
-                # double-counting in get_pot_total().
-                self.main_pot.amount -= side_pot_amount
-                side_pot = Pot(side_pot_amount, eligible)
-                self.side_pots.append(side_pot)
-            
-            previous_level = all_in_level
+        for position, i in enumerate(order):
+            level = contributions[player_ids[i]]
+            if level > previous_level:
+                amount = (level - previous_level) * (len(order) - position) + carried
+                eligible = remaining_mask & live_mask
+                if not eligible:
+                    carried = amount
+                elif pots and pots[-1].eligible_mask == eligible:
+                    pots[-1] = PotLayer(pots[-1].amount + amount, eligible)
+                    carried = 0
+                else:
+                    pots.append(PotLayer(amount, eligible))
+                    carried = 0
+                previous_level = level
+            remaining_mask &= ~(1 << i)
+        
+        if carried:
+            if pots:
+                pots[-1] = PotLayer(pots[-1].amount + carried, pots[-1].eligible_mask)
+            else:
+                pots.append(PotLayer(carried, live_mask))
+        
+        total = sum(pot.amount for pot in pots)
+        return PotStructure(player_ids, tuple(pots), total)
+    
+    def calculate_side_pots(self) -> None:
+        """
+        Rebuild main_pot and side_pots from build_pots().
+        
+        The first layer becomes the main pot and the remaining layers become
+        side pots. Safe to call more than once.
+        """
+        structure = self.build_pots()
+        if not structure.pots:
+            return
+        
+        main_layer = structure.pots[0]
+        self._main_pot = Pot(main_layer.amount, structure.eligible_players(main_layer))
+        self.side_pots = [
+            Pot(pot.amount, structure.eligible_players(pot))
+            for pot in structure.pots[1:]
+        ]
     
     def get_pot_total(self) -> int:
         """
         Get the total of all pots in the game.
         
         Returns:
-            int: Sum of main pot and all side pots.
+            int: Chips contributed and not yet awarded (O(1) from the ledger).
         """
-        total = self.main_pot.amount
-        for side_pot in self.side_pots:
-            total += side_pot.amount
-        return total
+        return self.ledger.pot_total
     
     def get_main_pot(self) -> int:
         """
@@ -247,9 +457,9 @@ class PotManager:
         Raises:
             ValueError: If player_id not in game.
         """
-        if player_id not in self.player_contributions:
+        if player_id not in self._ledger_index:
             raise ValueError(f"Player {player_id} not in this game")
-        return self.player_contributions[player_id]
+        return self.ledger.contributions[self._ledger_index[player_id]]
     
     def __repr__(self) -> str:
         """Return string representation."""
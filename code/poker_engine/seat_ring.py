@@ -0,0 +1,146 @@
+"""Circular linked ring of seats for constant-time turn order."""
+
+from typing import List, Optional
+
+
+class SeatRing:
+    """
+    Doubly linked ring over a subset of seats, in clockwise order.
+
+    Each member seat stores its next and previous member, so stepping to
+    the next seat and removing a seat (a fold or an all-in) are O(1).
+    Seats outside the ring are resolved with bit operations on the member
+    mask, which is also constant time for a table of at most eight seats.
+
+    Attributes:
+        num_seats (int): Seats at the table.
+        mask (int): Bit per seat currently in the ring.
+    """
+
+    __slots__ = ("num_seats", "mask", "_next", "_prev")
+
+    def __init__(self, num_seats: int, mask: int = 0):
+        """
+        Initialise a ring.
+
+        Args:
+            num_seats (int): Seats at the table (must be positive).
+            mask (int): Initial member seats (default: none).
+
+        Raises:
+            ValueError: If num_seats <= 0.
+        """
+        if num_seats <= 0:
+            raise ValueError(f"num_seats must be positive, got {num_seats}")
+
+        self.num_seats = num_seats
+        self.mask = 0
+        self._next: List[int] = list(range(num_seats))
+        self._prev: List[int] = list(range(num_seats))
+        self.reset(mask)
+
+    def reset(self, mask: int) -> None:
+        """
+        Rebuild the links for a new set of members.
+
+        Args:
+            mask (int): Member seats.
+        """
+        seats = [seat for seat in range(self.num_seats) if mask >> seat & 1]
+        self.mask = mask
+        for i, seat in enumerate(seats):
+            self._next[seat] = seats[(i + 1) % len(seats)]
+            self._prev[seat] = seats[i - 1]
+
+    def __contains__(self, seat: int) -> bool:
+        """Return True if seat is in the ring."""
+        return bool(self.mask >> seat & 1)
+
+    def __len__(self) -> int:
+        """Return the number of member seats."""
+        return self.mask.bit_count()
+
+    def remove(self, seat: int) -> None:
+        """
+        Unlink a seat (no-op if it is not a member).
+
+        Args:
+            seat (int): Seat to remove.
+        """
+        if not self.mask >> seat & 1:
+            return
+        self.mask &= ~(1 << seat)
+        next_seat = self._next[seat]
+        prev_seat = self._prev[seat]
+        self._next[prev_seat] = next_seat
+        self._prev[next_seat] = prev_seat
+
+    def insert(self, seat: int) -> None:
+        """
+        Link a seat back in at its clockwise position (no-op if a member).
+
+        Args:
+            seat (int): Seat to add.
+        """
+        if self.mask >> seat & 1:
+            return
+        next_seat = self.next_after(seat)
+        self.mask |= 1 << seat
+        if next_seat is None:
+            self._next[seat] = seat
+            self._prev[seat] = seat
+            return
+        prev_seat = self._prev[next_seat]
+        self._next[seat] = next_seat
+        self._prev[seat] = prev_seat
+        self._next[prev_seat] = seat
+        self._prev[next_seat] = seat
+
+    def next_after(self, seat: int) -> Optional[int]:
+        """
+        Get the first member clockwise after seat (seat itself excluded).
+
+        Args:
+            seat (int): Any seat, member or not.
+
+        Returns:
+            Optional[int]: Next member seat, or None if there is none.
+        """
+        if self.mask >> seat & 1:
+            next_seat = self._next[seat]
+            return None if next_seat == seat else next_seat
+
+        after = self.mask >> (seat + 1)
+        if after:
+            return seat + (after & -after).bit_length()
+        before = self.mask & ((1 << seat) - 1)
+        if before:
+            return (before & -before).bit_length() - 1
+        return None
+
+    def previous_before(self, seat: int) -> Optional[int]:
+        """
+        Get the first member anticlockwise before seat (seat itself excluded).
+
+        Args:
+            seat (int): Any seat, member or not.
+
+        Returns:
+            Optional[int]: Previous member seat, or None if there is none.
+        """
+        if self.mask >> seat & 1:
+            prev_seat = self._prev[seat]
+            return None if prev_seat == seat else prev_seat
+
+        before = self.mask & ((1 << seat) - 1)
+        if before:
+            return before.bit_length() - 1
+        after = self.mask >> (seat + 1)
+        if after:
+            return seat + after.bit_length()
+        return None
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        seats = [seat for seat in range(self.num_seats) if self.mask >> seat & 1]
+        return f"SeatRing(seats={seats})"
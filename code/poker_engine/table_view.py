@@ -0,0 +1,82 @@
+"""Immutable views of a table, published by the dealer engine for readers."""
+
+from typing import NamedTuple, Optional, Tuple
+
+from poker_engine.card import Card
+from poker_engine.game_state import GamePhase
+from poker_engine.player_state import PlayerState, PlayerStatus, RoundStatus
+
+
+class SeatView(NamedTuple):
+    """
+    Frozen copy of one seat.
+
+    Attributes:
+        player_id (str): Player's ID.
+        seat (int): Seat index.
+        stack (int): Chips behind.
+        current_bet (int): Chips bet this round.
+        status (PlayerStatus): Status in the hand.
+        round_status (RoundStatus): Status in the betting round.
+        hole_cards (Tuple[Card, ...]): Private cards.
+    """
+
+    player_id: str
+    seat: int
+    stack: int
+    current_bet: int
+    status: PlayerStatus
+    round_status: RoundStatus
+    hole_cards: Tuple[Card, ...]
+
+    @classmethod
+    def of(cls, seat: int, player: PlayerState) -> "SeatView":
+        """
+        Copy a player's current state.
+
+        Args:
+            seat (int): Seat index.
+            player (PlayerState): Player in that seat.
+
+        Returns:
+            SeatView: Frozen copy.
+        """
+        return cls(
+            player.player_id,
+            seat,
+            player.stack,
+            player.current_bet,
+            player.status,
+            player.round_status,
+            tuple(player.hole_cards),
+        )
+
+
+class TableView(NamedTuple):
+    """
+    Frozen, consistent copy of a whole table at one state_version.
+
+    The dealer engine builds a new TableView after each change and
+    publishes it with a single reference assignment, so readers on other
+    threads always see a complete view without locking. Seats and the
+    board that did not change are shared with the previous view.
+
+    Attributes:
+        version (int): Engine state_version this view reflects.
+        game_id (str): Game identifier.
+        phase (GamePhase): Phase of the hand.
+        current_action_player (Optional[int]): Seat due to act.
+        dealer_button (int): Button seat.
+        pot_total (int): Chips in the pot.
+        community_cards (Tuple[Card, ...]): Board.
+        seats (Tuple[SeatView, ...]): Every seat, in seat order.
+    """
+
+    version: int
+    game_id: str
+    phase: GamePhase
+    current_action_player: Optional[int]
+    dealer_button: int
+    pot_total: int
+    community_cards: Tuple[Card, ...]
+    seats: Tuple[SeatView, ...]
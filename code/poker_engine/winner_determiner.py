@@ -1,155 +1,349 @@
 """Winner determination and pot distribution logic."""
 
 from itertools import combinations
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from poker_engine.hand_evaluator import HandEvaluator
 from poker_engine.player_state import PlayerState, PlayerStatus
+from poker_engine.evaluation_cache import EvaluationCache, card_mask, canonical_key
+from poker_engine.pot_manager import PotLayer, PotStructure
+
+# Seat numbers run 0-7; used to order seats clockwise from the button
+MAX_SEATS = 8
 
 
 class WinnerDeterminer:
     """Determines winners of pots and distributes winnings."""
     
-    def __init__(self, hand_evaluator: HandEvaluator):
+    def __init__(
+        self,
+        hand_evaluator: HandEvaluator,
+        evaluation_cache: Optional[EvaluationCache] = None,
+    ):
         """
         Initialise winner determiner.
         
         Args:
             hand_evaluator (HandEvaluator): Evaluator for comparing hands.
+            evaluation_cache (Optional[EvaluationCache]): Cache of best-hand
+                strengths consulted before searching combinations.
         """
         self.hand_evaluator = hand_evaluator
+        self.evaluation_cache = evaluation_cache
     
     def determine_winners(
         self,
         remaining_players: List[PlayerState],
         main_pot: int,
         side_pots: List[Dict],
-        community_cards: List
+        community_cards: List,
+        button_seat: Optional[int] = None
     ) -> Dict[str, int]:
         """
         Determine winners for all pots and calculate winnings.
         
+        The main pot is open to every non-folded player; side pots are open
+        to the non-folded players they list. Settlement is delegated to
+        award_pots().
+        
         Args:
             remaining_players (List[PlayerState]): Players still in the hand.
             main_pot (int): Amount in the main pot.
             side_pots (List[Dict]): Side pots with structure:
                 [{'amount': int, 'eligible_players': [player_ids]}]
             community_cards (List): Community cards (for hand evaluation).
+            button_seat (Optional[int]): Dealer seat, for odd-chip order.
         
         Returns:
             Dict[str, int]: Winnings per player_id (may be 0 for losers).
         """
-        # Initialise winnings tracker
-        winnings = {player.player_id: 0 for player in remaining_players}
-        
-        # Build quick lookup for players
-        players_by_id = {p.player_id: p for p in remaining_players}
-        
-        # Only evaluate hands for non-folded players
         active_players = [p for p in remaining_players if p.status != PlayerStatus.FOLDED]
         
         # If only one player remains, they win everything
         if len(active_players) == 1:
-            winner_id = active_players[0].player_id
+            winnings = {player.player_id: 0 for player in remaining_players}
             total_pot = main_pot + sum(pot['amount'] for pot in side_pots)
-            winnings[winner_id] = total_pot
+            winnings[active_players[0].player_id] = total_pot
             return winnings
         
-        # Evaluate hands for remaining players
-        # For Texas Hold'em: pick best 5-card hand from 7 (2 hole + 5 community)
-        player_hands = {}
-        for player in active_players:
+        player_ids = tuple(p.player_id for p in active_players)
+        bit_by_id = {player_id: 1 << i for i, player_id in enumerate(player_ids)}
+        
+        pots = [PotLayer(main_pot, (1 << len(player_ids)) - 1)]
+        for side_pot in side_pots:
+            mask = 0
+            for player_id in side_pot['eligible_players']:
+                mask |= bit_by_id.get(player_id, 0)
+            pots.append(PotLayer(side_pot['amount'], mask))
+        
+        structure = PotStructure(player_ids, tuple(pots), sum(p.amount for p in pots))
+        return self.award_pots(remaining_players, structure, community_cards, button_seat)
+    
+    def award_pots(
+        self,
+        remaining_players: List[PlayerState],
+        pots: PotStructure,
+        community_cards: List,
+        button_seat: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Award every layer of a PotStructure in a single pass.
+        
+        Each live hand is evaluated exactly once and players are grouped
+        into rank tiers (best first). Each pot goes to the highest tier
+        that intersects its eligibility mask. Because build_pots() layers
+        are nested, the tier search resumes where the previous pot stopped,
+        so settlement is linear in pots plus players. Players without a
+        complete hand form a bottom tier and only win pots nobody else can.
+        
+        Split pots divide equally; odd chips go one at a time to the tied
+        winners in seat order starting left of the button.
+        
+        Args:
+            remaining_players (List[PlayerState]): Players still in the hand.
+            pots (PotStructure): Output of PotManager.build_pots().
+            community_cards (List): Community cards (for hand evaluation).
+            button_seat (Optional[int]): Dealer seat (default: seat order from 0).
+        
+        Returns:
+            Dict[str, int]: Winnings per player_id (may be 0 for losers).
+        """
+        winnings = {player.player_id: 0 for player in remaining_players}
+        strengths = {}
+        for player in self._live_players(remaining_players):
             try:
-                all_cards = player.hole_cards + community_cards
-                best_hand = self._find_best_five_card_hand(all_cards)
-                if best_hand is None:
-                    continue
-                player_hands[player.player_id] = best_hand
+                strengths[player.player_id] = self._best_hand_strength(
+                    player.hole_cards + community_cards
+                )
             except ValueError:
-                # Skip players with incomplete hands
-                continue
+                strengths[player.player_id] = None
         
-        # Distribute main pot
-        self._distribute_pot(
-            main_pot,
-            active_players,
-            player_hands,
-            None,  # Main pot: all active players eligible
-            winnings
-        )
+        tiers = self._rank_tiers(remaining_players, pots.player_ids, strengths)
+        self._settle(tiers, pots, button_seat, winnings)
+        return winnings
+    
+    def award_pots_multi_run(
+        self,
+        remaining_players: List[PlayerState],
+        pots: PotStructure,
+        community_cards: List,
+        runouts: List[List],
+        button_seat: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Award every layer once per runout ("run it N times").
         
-        # Distribute side pots
-        for side_pot in side_pots:
-            eligible_ids = side_pot['eligible_players']
-            eligible_players = [
-                p for p in active_players if p.player_id in eligible_ids
-            ]
-            
-            self._distribute_pot(
-                side_pot['amount'],
-                eligible_players,
-                player_hands,
-                eligible_ids,
-                winnings
+        Each layer is divided into len(runouts) shares (earlier runs take
+        the odd chips) and each share is settled against that run's board,
+        so the chips awarded always equal pots.total. The best hand from
+        each player's hole cards plus the shared community cards is found
+        once; a run then only evaluates the 5-card combinations that use at
+        least one of its own cards.
+        
+        Args:
+            remaining_players (List[PlayerState]): Players still in the hand.
+            pots (PotStructure): Output of PotManager.build_pots().
+            community_cards (List): Board cards common to every run.
+            runouts (List[List]): Cards completing the board for each run.
+            button_seat (Optional[int]): Dealer seat, for odd-chip order.
+        
+        Returns:
+            Dict[str, int]: Winnings per player_id summed over all runs.
+        
+        Raises:
+            ValueError: If runouts is empty.
+        """
+        if not runouts:
+            raise ValueError("Must provide at least one runout")
+        
+        winnings = {player.player_id: 0 for player in remaining_players}
+        live_players = self._live_players(remaining_players)
+        
+        # Partial state shared by every run: known cards and their best hand
+        known = {}
+        for player in live_players:
+            cards = player.hole_cards + community_cards
+            try:
+                best = self._best_hand_strength(cards)
+            except ValueError:
+                best = None
+            known[player.player_id] = (cards, best)
+        
+        num_runs = len(runouts)
+        for run_index, runout in enumerate(runouts):
+            run_pots = PotStructure(
+                pots.player_ids,
+                tuple(
+                    PotLayer(
+                        pot.amount // num_runs + (1 if run_index < pot.amount % num_runs else 0),
+                        pot.eligible_mask
+                    )
+                    for pot in pots.pots
+                ),
+                0
             )
+            strengths = {
+                player_id: self._extend_best_strength(cards, best, runout)
+                for player_id, (cards, best) in known.items()
+            }
+            tiers = self._rank_tiers(remaining_players, pots.player_ids, strengths)
+            self._settle(tiers, run_pots, button_seat, winnings)
         
         return winnings
     
-    def _distribute_pot(
+    def _live_players(self, remaining_players: List[PlayerState]) -> List[PlayerState]:
+        """Return the players who have not folded."""
+        return [p for p in remaining_players if p.status != PlayerStatus.FOLDED]
+    
+    def _settle(
         self,
-        pot_amount: int,
-        eligible_players: List[PlayerState],
-        player_hands: Dict,
-        eligible_ids: Optional[List[str]],
+        tiers: List[Tuple[int, List[Tuple[int, PlayerState]]]],
+        pots: PotStructure,
+        button_seat: Optional[int],
         winnings: Dict[str, int]
     ) -> None:
         """
-        Distribute a single pot among eligible winners.
-        
-        Handles ties by splitting the pot equally.
-        Only compares hands of eligible players in this pot.
+        Award each layer to the highest tier intersecting its mask.
         
         Args:
-            pot_amount (int): Amount to distribute.
-            eligible_players (List[PlayerState]): Players eligible for this pot.
-            player_hands (Dict): Evaluated hands for all active players.
-            eligible_ids (Optional[List[str]]): Explicit list of eligible player IDs.
+            tiers: Output of _rank_tiers().
+            pots (PotStructure): Layers to award.
+            button_seat (Optional[int]): Dealer seat, for odd-chip order.
             winnings (Dict[str, int]): Winnings tracker to update.
         """
-        if not eligible_players or pot_amount == 0:
-            return
-        
-        # Filter to only eligible players with valid hands
-        valid_players = [
-            p for p in eligible_players
-            if p.player_id in player_hands
-        ]
-        
-        if not valid_players:
-            # All eligible players folded, split among remaining
-            split_amount = pot_amount // len(eligible_players)
-            for player in eligible_players:
-                winnings[player.player_id] += split_amount
-            return
-        
-        # Find best hand(s)
-        best_strength = max(
-            player_hands[p.player_id]['strength'] for p in valid_players
+        start_seat = button_seat + 1 if button_seat is not None else 0
+        
+        tier_index = 0
+        previous_mask = 0
+        for pot in pots.pots:
+            if pot.amount == 0 or pot.eligible_mask == 0:
+                continue
+            # Nested layer: no higher tier can intersect it
+            if pot.eligible_mask & ~previous_mask:
+                tier_index = 0
+            previous_mask = pot.eligible_mask
+            
+            while tier_index < len(tiers) and not tiers[tier_index][0] & pot.eligible_mask:
+                tier_index += 1
+            if tier_index == len(tiers):
+                continue
+            
+            winners = [
+                player for bit, player in tiers[tier_index][1]
+                if bit & pot.eligible_mask
+            ]
+            winners.sort(key=lambda p: (p.seat_number - start_seat) % MAX_SEATS)
+            
+            share, odd_chips = divmod(pot.amount, len(winners))
+            for i, winner in enumerate(winners):
+                winnings[winner.player_id] += share + (1 if i < odd_chips else 0)
+    
+    def _rank_tiers(
+        self,
+        remaining_players: List[PlayerState],
+        player_ids: Tuple[str, ...],
+        strengths: Dict[str, Optional[float]]
+    ) -> List[Tuple[int, List[Tuple[int, PlayerState]]]]:
+        """
+        Group evaluated players into tiers of equal strength.
+        
+        Args:
+            remaining_players (List[PlayerState]): Players still in the hand.
+            player_ids (Tuple[str, ...]): Eligibility bit order of the pots.
+            strengths (Dict[str, Optional[float]]): Best strength per live
+                player (None for an incomplete hand).
+        
+        Returns:
+            List of (tier_mask, [(bit, player), ...]) from best to worst.
+        """
+        bit_by_id = {player_id: 1 << i for i, player_id in enumerate(player_ids)}
+        
+        ranked = []
+        for player in remaining_players:
+            bit = bit_by_id.get(player.player_id)
+            if bit is None or player.player_id not in strengths:
+                continue
+            strength = strengths[player.player_id]
+            ranked.append((strength if strength is not None else -1, bit, player))
+        
+        ranked.sort(key=lambda entry: entry[0], reverse=True)
+        
+        tiers: List[Tuple[int, List[Tuple[int, PlayerState]]]] = []
+        previous_strength = None
+        for strength, bit, player in ranked:
+            if tiers and strength == previous_strength:
+                mask, members = tiers[-1]
+                members.append((bit, player))
+                tiers[-1] = (mask | bit, members)
+            else:
+                tiers.append((bit, [(bit, player)]))
+            previous_strength = strength
+        return tiers
+    
+    def _extend_best_strength(
+        self,
+        known_cards: List,
+        known_best: Optional[float],
+        new_cards: List
+    ) -> Optional[float]:
+        """
+        Best strength after adding new_cards to an already-evaluated set.
+        
+        Only combinations containing at least one new card are looked up
+        (by rank-prime key, see HandEvaluator.best_strength()); the rest
+        are covered by known_best. Full card sets are looked up in
+        (and stored to) the evaluation cache when one is configured.
+        
+        Args:
+            known_cards (List): Cards already evaluated.
+            known_best (Optional[float]): Best strength among known_cards.
+            new_cards (List): Cards added for this run.
+        
+        Returns:
+            Optional[float]: Best strength, or None if fewer than 5 cards.
+        """
+        all_cards = known_cards + list(new_cards)
+        if len(all_cards) < 5:
+            return None
+        
+        key = None
+        if self.evaluation_cache is not None:
+            key = canonical_key(card_mask(all_cards))
+            cached = self.evaluation_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        best = self.hand_evaluator.extend_best_strength(
+            known_cards, known_best if known_best is not None else -1, new_cards
         )
         
-        # Get all winners (in case of tie)
-        winners = [
-            p for p in valid_players
-            if player_hands[p.player_id]['strength'] == best_strength
-        ]
+        if key is not None:
+            self.evaluation_cache.put(key, best)
+        return best
+    
+    def _best_hand_strength(self, all_cards: List) -> Optional[float]:
+        """
+        Get the strength of the best 5-card hand, using the cache if set.
+        
+        Args:
+            all_cards (List): All cards available (2-7 cards).
+        
+        Returns:
+            Optional[float]: Best strength, or None if fewer than 5 cards.
         
-        # Split pot among winners
-        split_amount = pot_amount // len(winners)
-        remainder = pot_amount % len(winners)
+        Raises:
+            ValueError: Propagated from hand_evaluator.best_strength().
+        """
+        if len(all_cards) < 5:
+            return None
+        if self.evaluation_cache is None:
+            return self.hand_evaluator.best_strength(all_cards)
         
-        for i, winner in enumerate(winners):
-            # Give remainder chips to first winner
-            extra = 1 if i < remainder else 0
-            winnings[winner.player_id] += split_amount + extra
+        key = canonical_key(card_mask(all_cards))
+        strength = self.evaluation_cache.get(key)
+        if strength is None:
+            strength = self.hand_evaluator.best_strength(all_cards)
+            self.evaluation_cache.put(key, strength)
+        return strength
     
     def _find_best_five_card_hand(self, all_cards: List) -> Optional[Dict]:
         """
@@ -168,7 +362,7 @@ class WinnerDeterminer:
         Raises:
             ValueError: Propagated from hand_evaluator.evaluate() if a card list
                 is malformed (e.g. wrong number of cards or invalid card objects).
-                Callers (determine_winners, get_hand_summary) catch this with a
+                Callers (_rank_tiers, get_hand_summary) catch this with a
                 try/except ValueError block and skip the affected player.
         """
         if len(all_cards) < 5:
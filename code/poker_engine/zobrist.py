@@ -0,0 +1,169 @@
+"""Zobrist hashing of table state for transposition tables."""
+
+import random
+from typing import List
+
+from poker_engine.card import Card
+from poker_engine.game_state import GameState, GamePhase
+from poker_engine.player_state import PlayerState, PlayerStatus, RoundStatus
+
+MAX_SEATS = 8
+DEFAULT_SEED = 20260
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(value: int) -> int:
+    """
+    Scramble a 64-bit value (the SplitMix64 finaliser).
+
+    Used for chip amounts, which are unbounded and so cannot each have a
+    pre-drawn key: key + amount is mixed into a pseudo-random 64-bit term.
+    """
+    value &= _MASK64
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return value ^ (value >> 31)
+
+
+class ZobristKeys:
+    """
+    Random 64-bit keys for Zobrist hashing a table.
+
+    A table's hash is the XOR of one key per feature present: each seat's
+    stack, current bet, status, round status and hole cards, each board
+    card, the phase and the seat due to act. Changing a feature XORs its
+    old key out and its new key in, so the hash updates in O(1) per change.
+    Keys are drawn from a seeded generator, so engines built with the same
+    seed produce comparable hashes.
+
+    Attributes:
+        seed (int): Seed the keys were drawn from.
+    """
+
+    __slots__ = (
+        "seed",
+        "_stack",
+        "_bet",
+        "_status",
+        "_round_status",
+        "_hole_card",
+        "_board_card",
+        "_phase",
+        "_action",
+    )
+
+    def __init__(self, seed: int = DEFAULT_SEED):
+        """
+        Draw a key set.
+
+        Args:
+            seed (int): Seed for the key generator (default: DEFAULT_SEED).
+        """
+        rng = random.Random(seed)
+
+        def draw(count: int) -> List[int]:
+            return [rng.getrandbits(64) for _ in range(count)]
+
+        self.seed = seed
+        self._stack = draw(MAX_SEATS)
+        self._bet = draw(MAX_SEATS)
+        self._status = [draw(len(PlayerStatus)) for _ in range(MAX_SEATS)]
+        self._round_status = [draw(len(RoundStatus)) for _ in range(MAX_SEATS)]
+        self._hole_card = [draw(52) for _ in range(MAX_SEATS)]
+        self._board_card = draw(52)
+        self._phase = draw(len(GamePhase))
+        # Index MAX_SEATS stands for nobody to act
+        self._action = draw(MAX_SEATS + 1)
+
+    def seat_term(self, seat: int, player: PlayerState) -> int:
+        """
+        Hash a seat's stack, current bet and statuses (not its cards).
+
+        Args:
+            seat (int): Seat index (0-7).
+            player (PlayerState): Player in that seat.
+
+        Returns:
+            int: 64-bit term to XOR into the table hash.
+        """
+        return (
+            _mix64(self._stack[seat] + player.stack)
+            ^ _mix64(self._bet[seat] + player._current_bet)
+            ^ self._status[seat][player._status]
+            ^ self._round_status[seat][player._round_status]
+        )
+
+    def hole_cards_term(self, seat: int, cards: List[Card]) -> int:
+        """
+        Hash the hole cards held in a seat.
+
+        Args:
+            seat (int): Seat index (0-7).
+            cards (List[Card]): The seat's hole cards.
+
+        Returns:
+            int: 64-bit term to XOR into the table hash.
+        """
+        keys = self._hole_card[seat]
+        term = 0
+        for card in cards:
+            term ^= keys[card.get_index()]
+        return term
+
+    def board_card_key(self, card: Card) -> int:
+        """
+        Get the key of a community card.
+
+        Args:
+            card (Card): Card on the board.
+
+        Returns:
+            int: 64-bit key to XOR into the table hash.
+        """
+        return self._board_card[card.get_index()]
+
+    def turn_term(self, game_state: GameState) -> int:
+        """
+        Hash the phase and the seat due to act.
+
+        These are read straight from the table rather than tracked, as
+        both are a single lookup.
+
+        Args:
+            game_state (GameState): Table to read.
+
+        Returns:
+            int: 64-bit term to XOR into the table hash.
+        """
+        action_seat = game_state.current_action_player
+        return (
+            self._phase[game_state._phase]
+            ^ self._action[MAX_SEATS if action_seat is None else action_seat]
+        )
+
+    def hash_state(self, game_state: GameState) -> int:
+        """
+        Hash a whole table from scratch (O(seats + cards)).
+
+        Args:
+            game_state (GameState): Table to hash.
+
+        Returns:
+            int: 64-bit hash equal to the incrementally maintained one.
+        """
+        value = self.turn_term(game_state)
+        for seat, player in enumerate(game_state.players):
+            value ^= self.seat_term(seat, player)
+            value ^= self.hole_cards_term(seat, player.hole_cards)
+        for card in game_state.community_cards:
+            value ^= self.board_card_key(card)
+        return value
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"ZobristKeys(seed={self.seed})"
+
+
+# Shared by engines that do not supply their own keys
+DEFAULT_KEYS = ZobristKeys()
@@ -24,6 +24,7 @@ from bots.passive_bot import PassiveBot
 from bots.folder_bot import FolderBot
 from bots.all_in_bot import AllInBot
 from bots.random_bot import RandomBot
+from poker_engine import EvaluationCache
 from simulator.game_runner import GameRunner, run_survivor_test
 from simulator.logger import SimulationLogger
 
@@ -33,6 +34,10 @@ def main() -> int:
     total_violations = 0
     session_results = []
 
+    # One hand-strength cache for the whole run: every session repeats
+    # the same seven-card combinations, so later sessions start warm.
+    evaluation_cache = EvaluationCache()
+
     # -------------------------------------------------------------------------
     # Session 1: Main 500-hand session with all six bot types
     # -------------------------------------------------------------------------
@@ -45,7 +50,7 @@ def main() -> int:
         RandomBot('Random'),
     ]
     logger1 = SimulationLogger('Session 1 - Main Mixed')
-    runner1 = GameRunner(bots_main, logger1)
+    runner1 = GameRunner(bots_main, logger1, evaluation_cache)
     stats1 = runner1.run_session(500, 'session1-main-mixed', batch_size=100)
     viols1 = stats1.summary()['invariant_violations']
     total_violations += viols1
@@ -57,7 +62,7 @@ def main() -> int:
     # -------------------------------------------------------------------------
     bots_allin = [AllInBot(f'AllIn{i}') for i in range(1, 7)]
     logger2 = SimulationLogger('Session 2 - All-In Stress')
-    runner2 = GameRunner(bots_allin, logger2)
+    runner2 = GameRunner(bots_allin, logger2, evaluation_cache)
     stats2 = runner2.run_session(200, 'session2-allin-stress', batch_size=50)
     viols2 = stats2.summary()['invariant_violations']
     total_violations += viols2
@@ -69,7 +74,7 @@ def main() -> int:
     # -------------------------------------------------------------------------
     bots_random = [RandomBot(f'Rand{i}') for i in range(1, 7)]
     logger3 = SimulationLogger('Session 3 - Random Chaos')
-    runner3 = GameRunner(bots_random, logger3)
+    runner3 = GameRunner(bots_random, logger3, evaluation_cache)
     stats3 = runner3.run_session(500, 'session3-random-chaos', batch_size=100)
     viols3 = stats3.summary()['invariant_violations']
     total_violations += viols3
@@ -89,7 +94,8 @@ def main() -> int:
     ]
     logger4 = SimulationLogger('Session 4 - Survivor')
     stats4 = run_survivor_test(bots_survivor, logger4, max_hands=2000,
-                               session_label='session4-survivor')
+                               session_label='session4-survivor',
+                               evaluation_cache=evaluation_cache)
     viols4 = stats4.summary()['invariant_violations']
     total_violations += viols4
     session_results.append(('Session 4 - Survivor (up to 2000 hands)', viols4))
@@ -102,7 +108,7 @@ def main() -> int:
         CallingStationBot('CS'),
     ]
     logger5 = SimulationLogger('Session 5 - Heads-Up Agg vs CS')
-    runner5 = GameRunner(bots_hu, logger5)
+    runner5 = GameRunner(bots_hu, logger5, evaluation_cache)
     stats5 = runner5.run_session(1000, 'session5-headsup-agg-vs-cs', batch_size=200)
     viols5 = stats5.summary()['invariant_violations']
     total_violations += viols5
@@ -117,6 +123,9 @@ def main() -> int:
     for name, viols in session_results:
         status = 'PASS' if viols == 0 else f'FAIL ({viols} violations)'
         print(f'  {name:<45} {status}')
+    cache_stats = evaluation_cache.get_stats()
+    print(f"\n  Evaluation cache: {cache_stats['hits'] + cache_stats['shared_hits']} hits, "
+          f"{cache_stats['misses']} misses ({cache_stats['hit_rate']:.1%} hit rate)")
     print()
     if total_violations == 0:
         print('  OVERALL RESULT: PASS - zero invariant violations')
@@ -8,7 +8,6 @@ survivor (persistent-stack) tests.
 
 import sys
 import os
-import random
 from typing import Dict, List, Optional, Tuple
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,13 +16,15 @@ from poker_engine import (
     PlayerState,
     Card,
     ActionType,
+    ActionResult,
     GamePhase,
     PlayerStatus,
-    RoundStatus,
-    InvalidActionError,
-    NotPlayersTurnError,
+    EvaluationCache,
 )
 from poker_engine.dealer_engine import DealerEngine, GameType
+from poker_engine.deck import Deck
+from poker_engine.chip_ledger import ChipLedger
+from poker_engine.equity import DEFAULT_MAX_RUNOUTS
 from bots.base_bot import BaseBot
 
 from .statistics import SessionStatistics, HandResult
@@ -38,18 +39,6 @@ BIG_BLIND = 20
 MAX_HAND_ITERATIONS = 500
 
 
-# =============================================================================
-# DECK UTILITIES
-# =============================================================================
-
-def _create_shuffled_deck() -> List[Card]:
-    """Create and shuffle a standard 52-card deck."""
-    suits = [Card.HEARTS, Card.DIAMONDS, Card.CLUBS, Card.SPADES]
-    deck = [Card(suit, rank) for suit in suits for rank in Card.RANKS]
-    random.shuffle(deck)
-    return deck
-
-
 # =============================================================================
 # INVARIANT CHECKING
 # =============================================================================
@@ -58,6 +47,7 @@ def _check_invariants(
     chips_before: Dict[str, int],
     chips_after: Dict[str, int],
     dealt_cards: List[Card],
+    ledger: Optional[ChipLedger] = None,
 ) -> List[str]:
     """
     Validate all invariants from TEST-PLAN.md Section 7 after a hand.
@@ -66,6 +56,8 @@ def _check_invariants(
     - Pot conservation (total chips unchanged)
     - No negative stacks
     - Deck integrity (no duplicate cards dealt)
+    - Ledger consistency (pot fully awarded, every stack matches the
+      ledger), which pinpoints the player behind a conservation failure
 
     Returns:
         List of violation descriptions. Empty list means all passed.
@@ -96,6 +88,12 @@ def _check_invariants(
             )
         seen.add(key)
 
+    # 4. Ledger consistency
+    if ledger is not None:
+        if ledger.pot_total != 0:
+            violations.append(f"Undistributed chips in ledger: {ledger.pot_total}")
+        violations.extend(ledger.find_discrepancies(chips_after))
+
     return violations
 
 
@@ -103,112 +101,111 @@ def _check_invariants(
 # GAME LOOP HELPERS
 # =============================================================================
 
-def _is_round_complete(engine: DealerEngine) -> bool:
+def _is_all_in_locked(engine: DealerEngine) -> bool:
     """
-    Return True when all ACTIVE players have ACTED and matched the current bet.
-
-    Two conditions must both hold for every PlayerStatus.ACTIVE player:
-    1. Their RoundStatus is ACTED (not SITTING_OUT or WAITING_FOR_ACTION).
-    2. Their current_bet equals the highest bet at the table, OR their stack
-       is 0 (they went all-in for less than the max bet).
+    Return True when no further betting is possible but 2+ players remain.
 
-    Condition 2 handles an engine limitation: the ALL_IN action does not reset
-    other players to WAITING_FOR_ACTION (only RAISE does).  Without this check,
-    a player who previously ACTED at a lower bet level would not be re-prompted
-    when a later ALL_IN exceeds their committed amount.
+    That is the point at which the rest of the hand is pure runout luck,
+    so all-in EV is measured from the board dealt so far.
     """
-    active = engine.game_state.get_active_players()
-    max_bet = max((p.current_bet for p in active), default=0)
-
-    for p in active:
-        if p.status == PlayerStatus.ACTIVE:
-            if p.round_status != RoundStatus.ACTED:
-                return False
-            # Player acted at a lower level than the current max bet and still
-            # has chips to contribute - they must respond again.
-            if p.current_bet < max_bet and p.stack > 0:
-                return False
-    return True
-
-
-def _deal_community_cards(
-    engine: DealerEngine,
-    deck: List[Card],
-    dealt_cards: List[Card],
-    prev_phase: GamePhase,
-    new_phase: GamePhase,
-) -> None:
-    """Deal the appropriate community cards when advancing between phases."""
-    if new_phase == GamePhase.FLOP and prev_phase == GamePhase.PRE_FLOP:
-        for _ in range(3):
-            card = deck.pop()
-            dealt_cards.append(card)
-            engine.game_state.reveal_community_card(card)
-
-    elif new_phase == GamePhase.TURN and prev_phase == GamePhase.FLOP:
-        card = deck.pop()
-        dealt_cards.append(card)
-        engine.game_state.reveal_community_card(card)
-
-    elif new_phase == GamePhase.RIVER and prev_phase == GamePhase.TURN:
-        card = deck.pop()
-        dealt_cards.append(card)
-        engine.game_state.reveal_community_card(card)
+    game_state = engine.game_state
+    return (
+        game_state.count_active_players() >= 2
+        and game_state.count_acting_players() <= 1
+    )
 
 
 # =============================================================================
 # SINGLE HAND
 # =============================================================================
 
-def play_single_hand(
+def create_table(
     bots: list,
-    hand_number: int,
+    evaluation_cache: Optional[EvaluationCache] = None,
     starting_stacks: Optional[Dict[str, int]] = None,
-) -> Tuple[HandResult, Dict[str, int]]:
+) -> DealerEngine:
     """
-    Play one complete Texas Hold'em hand between the given bots.
+    Seat the bots at an engine that can play every hand of a session.
+
+    The engine deals from its own deck, shuffled with the random module's
+    generator, so random.seed() makes a session repeatable.
 
     Args:
-        bots: List of BaseBot instances.
-        hand_number: Hand sequence number for logging.
+        bots: List of BaseBot instances, in seat order.
+        evaluation_cache: Optional hand-strength cache shared across hands.
         starting_stacks: Optional dict of player_id -> stack.
                          Defaults to STARTING_STACK for all players.
 
     Returns:
-        Tuple of (HandResult, final_stacks dict).
+        DealerEngine with no hand started.
     """
     stacks = starting_stacks or {bot.name: STARTING_STACK for bot in bots}
-
-    # Create PlayerState objects with appropriate starting stacks
     players = [
         PlayerState(bot.name, seat_number=i, starting_stack=stacks[bot.name])
         for i, bot in enumerate(bots)
     ]
-
-    bot_map: Dict[str, BaseBot] = {bot.name: bot for bot in bots}
-    chips_before = {p.player_id: p.stack for p in players}
-
-    # Create a fresh engine for this hand
-    engine = DealerEngine(
+    return DealerEngine(
         game_type=GameType.TEXAS_HOLDEM,
         players=players,
         small_blind_amount=SMALL_BLIND,
         big_blind_amount=BIG_BLIND,
+        evaluation_cache=evaluation_cache,
+        deck=Deck(),
     )
 
-    deck = _create_shuffled_deck()
-    dealt_cards: List[Card] = []
 
-    engine.start_hand()
+def play_single_hand(
+    bots: list,
+    hand_number: int,
+    starting_stacks: Optional[Dict[str, int]] = None,
+    evaluation_cache: Optional[EvaluationCache] = None,
+    ev_runouts: int = DEFAULT_MAX_RUNOUTS,
+    run_it_times: int = 1,
+    trusted: bool = False,
+    engine: Optional[DealerEngine] = None,
+) -> Tuple[HandResult, Dict[str, int]]:
+    """
+    Play one complete Texas Hold'em hand between the given bots.
+
+    Args:
+        bots: List of BaseBot instances.
+        hand_number: Hand sequence number for logging.
+        starting_stacks: Optional dict of player_id -> stack.
+                         Defaults to STARTING_STACK for all players, or
+                         with an engine to the stacks left from its last
+                         hand.
+        evaluation_cache: Optional hand-strength cache shared across hands
+                          (used only when no engine is given).
+        ev_runouts: Runouts sampled when measuring the EV of a pre-flop
+                    all-in (later all-ins are enumerated exactly).
+        run_it_times: Boards dealt (pots split per board) when players
+                      are all-in before the river.
+        trusted: Apply the bots' actions without full validation; only
+                 for bots that choose from the snapshot's legal_actions.
+        engine: Table from create_table() (or any engine with a deck) to
+                play on, so one engine serves a whole session and the
+                button rotates (default: a new table for this hand only).
+
+    Returns:
+        Tuple of (HandResult, final_stacks dict).
+    """
+    if engine is None:
+        engine = create_table(bots, evaluation_cache, starting_stacks)
+        starting_stacks = None
+
+    bot_map: Dict[str, BaseBot] = {bot.name: bot for bot in bots}
 
-    # Deal hole cards to all active players
-    for player in engine.game_state.get_active_players():
-        c1, c2 = deck.pop(), deck.pop()
-        dealt_cards.extend([c1, c2])
-        player.deal_hole_cards([c1, c2])
+    # The engine shuffles its deck and deals the hole cards
+    engine.start_hand(starting_stacks)
+    # The ledger holds every stack as it was before the blinds
+    chips_before = dict(zip(engine.ledger.player_ids, engine.ledger.starting_stacks))
 
     went_to_showdown = False
     winnings: Dict[str, int] = {}
+    # Board size when betting closed with 2+ players and at most one able
+    # to act (everyone else all-in); None if that never happened
+    all_in_board_size: Optional[int] = None
+    runouts: Optional[List[List[Card]]] = None
 
     # Main game loop
     for _ in range(MAX_HAND_ITERATIONS):
@@ -219,19 +216,23 @@ def play_single_hand(
             went_to_showdown = True
             break
 
-        # Advance the round when all ACTIVE players have ACTED (or all-in/folded).
-        # This must be checked BEFORE processing the next player, because
-        # the engine's _get_next_action_seat() does not inspect RoundStatus and
-        # will keep cycling back to already-acted players indefinitely.
-        if _is_round_complete(engine):
-            prev_phase = phase
+        # Advance the round once the engine reports nobody left to act.
+        if engine.is_round_complete():
+            if all_in_board_size is None and _is_all_in_locked(engine):
+                all_in_board_size = len(engine.game_state.community_cards)
+                if run_it_times > 1 and all_in_board_size < 5:
+                    runouts = [
+                        engine.deck.deal(5 - all_in_board_size)
+                        for _ in range(run_it_times)
+                    ]
+                    went_to_showdown = True
+                    break
+            # The engine deals the next street's community cards
             try:
                 engine.advance_round()
             except ValueError:
                 # Unexpected - treat as hand over
                 break
-            new_phase = engine.game_state.current_phase
-            _deal_community_cards(engine, deck, dealt_cards, prev_phase, new_phase)
             continue
 
         # Round not complete - get the next player who must act
@@ -248,41 +249,46 @@ def play_single_hand(
         if bot is None:
             break
 
+        attempts = [(ActionType.CHECK, 0, False), (ActionType.FOLD, 0, False)]
         try:
             snapshot = engine.request_action(player_id)
             action, amount = bot.get_action(snapshot)
-            engine.process_action(player_id, action, amount)
-        except Exception as _action_err:
-            # Expected: InvalidActionError or NotPlayersTurnError when a bot
-            # returns an action that is currently illegal (e.g. BET when
-            # someone has already bet).  Unexpected errors (AttributeError,
-            # KeyError, etc.) are written to stderr so they surface during
-            # development without aborting the simulation.
-            if not isinstance(_action_err, (InvalidActionError, NotPlayersTurnError)):
-                sys.stderr.write(
-                    f"[game_runner] Unexpected error for {player_id} "
-                    f"({type(_action_err).__name__}: {_action_err})\n"
-                )
-            # Fallback cascade: try CHECK first (safe when player has matched
-            # the current bet), then FOLD.  Using CHECK before FOLD avoids
-            # eliminating the last active player when BET/RAISE fails because
-            # someone already bet — a FOLD there would leave zero active
-            # players and cause a pot-conservation violation.
-            for fallback_action, fallback_amount in [
-                (ActionType.CHECK, 0),
-                (ActionType.FOLD, 0),
-            ]:
-                try:
-                    engine.process_action(player_id, fallback_action, fallback_amount)
-                    break
-                except Exception:
-                    continue
-            else:
+            attempts.insert(0, (action, amount, trusted))
+        except Exception as _bot_err:
+            # Unexpected errors (AttributeError, KeyError, etc.) are written to
+            # stderr so they surface during development without aborting the
+            # simulation; the player then gets the fallback below.
+            sys.stderr.write(
+                f"[game_runner] Unexpected error for {player_id} "
+                f"({type(_bot_err).__name__}: {_bot_err})\n"
+            )
+
+        # try_action reports an illegal action as a result code instead of
+        # raising, so a bad bot decision costs no exception or log message.
+        # Fallback cascade: try CHECK first (safe when player has matched
+        # the current bet), then FOLD.  Using CHECK before FOLD avoids
+        # eliminating the last active player when BET/RAISE fails because
+        # someone already bet — a FOLD there would leave zero active
+        # players and cause a pot-conservation violation.  The fallbacks
+        # are always validated, even for trusted bots.
+        for action, amount, trusted_attempt in attempts:
+            if engine.try_action(player_id, action, amount, trusted_attempt) == ActionResult.OK:
                 break
+        else:
+            break
 
     # Determine winners and distribute pot
+    ev_winnings: Optional[Dict[str, float]] = None
     try:
-        winnings = engine.determine_winners()
+        winnings = engine.determine_winners(runouts)
+        if (
+            all_in_board_size is not None
+            and all_in_board_size < 5
+            and engine.game_state.count_active_players() >= 2
+        ):
+            ev_winnings = engine.get_expected_winnings(
+                board_size=all_in_board_size, max_runouts=ev_runouts
+            )
         engine.distribute_pot(winnings)
     except Exception as _winner_err:
         # Write the root cause to stderr so it surfaces in development.
@@ -298,7 +304,9 @@ def play_single_hand(
 
     # Collect final stacks and check invariants
     chips_after = {p.player_id: p.stack for p in engine.game_state.players}
-    violations = _check_invariants(chips_before, chips_after, dealt_cards)
+    violations = _check_invariants(
+        chips_before, chips_after, engine.deck.dealt, engine.ledger
+    )
 
     pot_total = sum(winnings.values())
     players_folded = sum(
@@ -313,6 +321,9 @@ def play_single_hand(
         players_folded=players_folded,
         went_to_showdown=went_to_showdown,
         invariant_violations=violations,
+        ev_winners=ev_winnings,
+        chip_ledger=engine.ledger.to_dict(),
+        hand_log=engine.hand_log.copy(),
     )
 
     return result, chips_after
@@ -325,9 +336,19 @@ def play_single_hand(
 class GameRunner:
     """Runs multi-hand sessions and collects statistics."""
 
-    def __init__(self, bots: list, logger: SimulationLogger) -> None:
+    def __init__(
+        self,
+        bots: list,
+        logger: SimulationLogger,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        run_it_times: int = 1,
+        trusted: bool = False,
+    ) -> None:
         self.bots = bots
         self.logger = logger
+        self.evaluation_cache = evaluation_cache
+        self.run_it_times = run_it_times
+        self.trusted = trusted
 
     def run_session(
         self,
@@ -359,8 +380,17 @@ class GameRunner:
         )
         self.logger.log("")
 
+        # One table for the session; stacks are reset each hand
+        engine = create_table(self.bots, self.evaluation_cache)
+        fresh_stacks = {name: STARTING_STACK for name in bot_names}
+
         for hand_num in range(1, num_hands + 1):
-            result, _ = play_single_hand(self.bots, hand_num)
+            result, _ = play_single_hand(
+                self.bots, hand_num, fresh_stacks,
+                run_it_times=self.run_it_times,
+                trusted=self.trusted,
+                engine=engine,
+            )
             stats.record_hand(result)
             self.logger.log_hand(
                 hand_num, result.winners, result.pot_total,
@@ -387,19 +417,21 @@ def run_survivor_test(
     logger: SimulationLogger,
     max_hands: int = 2000,
     session_label: str = "survivor",
+    evaluation_cache: Optional[EvaluationCache] = None,
 ) -> SessionStatistics:
     """
     Run until one player holds all chips or max_hands is reached.
 
-    Each bot keeps their stack across hands. Bots eliminated (stack = 0)
-    are removed from subsequent hands. The simulation ends when only one
-    player remains.
+    Each bot keeps their stack across hands at a single table, so the
+    button rotates. Bots eliminated (stack = 0) sit out subsequent hands.
+    The simulation ends when only one player remains.
 
     Args:
         bots: List of BaseBot instances.
         logger: SimulationLogger for output.
         max_hands: Hard limit to prevent infinite sessions.
         session_label: Label for the report filename.
+        evaluation_cache: Optional hand-strength cache shared across hands.
 
     Returns:
         SessionStatistics for the full survivor session.
@@ -409,6 +441,7 @@ def run_survivor_test(
 
     current_stacks = {bot.name: STARTING_STACK for bot in bots}
     active_bots = list(bots)
+    engine = create_table(bots, evaluation_cache)
 
     logger.log_section(
         f"{session_label} - Survivor test ({len(bots)} bots, max {max_hands} hands)"
@@ -426,14 +459,8 @@ def run_survivor_test(
                        f"Survivor: {active_bots[0].name if active_bots else 'none'}")
             break
 
-        # Only include bots with chips
-        hand_bots = [b for b in active_bots if current_stacks.get(b.name, 0) >= BIG_BLIND]
-        if len(hand_bots) < 2:
-            logger.log(f"\n  Fewer than 2 bots can afford the blind. Ending.")
-            break
-
-        hand_stacks = {b.name: current_stacks[b.name] for b in hand_bots}
-        result, final_stacks = play_single_hand(hand_bots, hand_num, hand_stacks)
+        # Stacks carry forward on the table; bots with no chips sit out
+        result, final_stacks = play_single_hand(bots, hand_num, engine=engine)
         stats.record_hand(result)
 
         # Update persistent stacks
@@ -62,10 +62,15 @@ class SimulationLogger:
         self.log(f"  Average pot         : {summary['average_pot']}")
         self.log(f"  Largest pot         : {summary['largest_pot']}")
         self.log(f"  Invariant violations: {summary['invariant_violations']}")
+        self.log(f"  All-in EV adjusted  : {summary['hands_ev_adjusted']} hands")
         self.log(f"\n  Wins per player:")
         for player, wins in summary['wins_per_player'].items():
             chips = summary['chips_won_per_player'].get(player, 0)
-            self.log(f"    {player:<25} {wins:4d} wins  {chips:8d} chips")
+            ev_chips = summary['ev_chips_per_player'].get(player, 0.0)
+            self.log(
+                f"    {player:<25} {wins:4d} wins  {chips:8d} chips  "
+                f"{ev_chips:10.1f} EV chips"
+            )
 
     def write_report(self, summary: dict, session_label: str) -> str:
         """
@@ -93,16 +98,21 @@ class SimulationLogger:
             f"| Average pot | {summary['average_pot']} chips |",
             f"| Largest pot | {summary['largest_pot']} chips |",
             f"| Invariant violations | {summary['invariant_violations']} |",
+            f"| All-in EV adjusted hands | {summary['hands_ev_adjusted']} |",
             f"",
             f"## Results by Player",
             f"",
-            f"| Player | Wins | Chips Won |",
-            f"|--------|------|-----------|",
+            f"EV chips replace all-in-before-the-river results with the",
+            f"equity-weighted share of each pot.",
+            f"",
+            f"| Player | Wins | Chips Won | EV Chips Won |",
+            f"|--------|------|-----------|--------------|",
         ]
 
         for player, wins in summary['wins_per_player'].items():
             chips = summary['chips_won_per_player'].get(player, 0)
-            lines.append(f"| {player} | {wins} | {chips} |")
+            ev_chips = summary['ev_chips_per_player'].get(player, 0.0)
+            lines.append(f"| {player} | {wins} | {chips} | {ev_chips} |")
 
         violation_note = (
             'None detected.'
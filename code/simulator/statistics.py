@@ -1,7 +1,9 @@
 """Statistics tracking for clinical test sessions."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from poker_engine.hand_log import HandLog
 
 
 @dataclass
@@ -13,6 +15,13 @@ class HandResult:
     players_folded: int
     went_to_showdown: bool
     invariant_violations: List[str]
+    # player_id -> equity-weighted chips won; set only when players were
+    # all-in before the river (otherwise EV equals the actual result)
+    ev_winners: Optional[Dict[str, float]] = None
+    # Serialised ChipLedger (ChipLedger.to_dict()) for the hand history
+    chip_ledger: Optional[dict] = None
+    # Every event of the hand, for replay (DealerEngine.replay())
+    hand_log: Optional[HandLog] = None
 
 
 @dataclass
@@ -26,12 +35,15 @@ class SessionStatistics:
     invariant_violations: int = 0
     wins: Dict[str, int] = field(default_factory=dict)
     chips_won: Dict[str, int] = field(default_factory=dict)
+    ev_chips_won: Dict[str, float] = field(default_factory=dict)
+    hands_ev_adjusted: int = 0
     hand_results: List[HandResult] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         for name in self.bot_names:
             self.wins.setdefault(name, 0)
             self.chips_won.setdefault(name, 0)
+            self.ev_chips_won.setdefault(name, 0.0)
 
     def record_hand(self, result: HandResult) -> None:
         """Update statistics with the result of one hand."""
@@ -48,6 +60,13 @@ class SessionStatistics:
                 self.wins[player_id] = self.wins.get(player_id, 0) + 1
                 self.chips_won[player_id] = self.chips_won.get(player_id, 0) + chips
 
+        if result.ev_winners is not None:
+            self.hands_ev_adjusted += 1
+        ev_winners = result.ev_winners if result.ev_winners is not None else result.winners
+        for player_id, chips in ev_winners.items():
+            if chips > 0:
+                self.ev_chips_won[player_id] = self.ev_chips_won.get(player_id, 0.0) + chips
+
         self.hand_results.append(result)
 
     def summary(self) -> dict:
@@ -70,4 +89,11 @@ class SessionStatistics:
             'chips_won_per_player': dict(
                 sorted(self.chips_won.items(), key=lambda x: x[1], reverse=True)
             ),
+            'hands_ev_adjusted': self.hands_ev_adjusted,
+            'ev_chips_per_player': {
+                name: round(chips, 1)
+                for name, chips in sorted(
+                    self.ev_chips_won.items(), key=lambda x: x[1], reverse=True
+                )
+            },
         }
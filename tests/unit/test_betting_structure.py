@@ -0,0 +1,59 @@
+"""Tests for BettingStructure."""
+
+import pytest
+from poker_engine.betting_structure import BettingLimit, BettingStructure, NO_LIMIT
+from poker_engine.game_state import GameState, GamePhase
+from poker_engine.player_state import PlayerState
+
+
+class TestBettingStructure:
+    """Test building structures and reading bet sizes."""
+
+    def test_default_is_no_limit(self):
+        """Test the structure used when none is given."""
+        assert NO_LIMIT.limit == BettingLimit.NO_LIMIT
+        assert NO_LIMIT.bet_sizes == ()
+        assert NO_LIMIT.raise_cap == 0
+
+    def test_fixed_limit_defaults(self):
+        """Test that the big bet defaults to twice the small bet."""
+        structure = BettingStructure.fixed_limit(20)
+
+        assert structure.bet_sizes == (20, 20, 40, 40)
+        assert structure.raise_cap == 4
+
+    def test_bet_size_follows_street(self):
+        """Test the per-phase bet size lookup."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        game = GameState("game_001", players, 10, 20)
+        structure = BettingStructure.fixed_limit(20, 50)
+
+        sizes = {}
+        for phase in (GamePhase.PRE_FLOP, GamePhase.FLOP, GamePhase.TURN, GamePhase.RIVER):
+            game.advance_phase(phase)
+            sizes[phase] = structure.bet_size(game)
+
+        assert list(sizes.values()) == [20, 20, 50, 50]
+        assert BettingStructure.pot_limit().bet_size(game) == 0
+
+    def test_fixed_limit_needs_four_positive_sizes(self):
+        """Test rejection of an incomplete bet size table."""
+        with pytest.raises(ValueError, match="four positive bet sizes"):
+            BettingStructure(BettingLimit.FIXED_LIMIT, (20, 40), 4)
+        with pytest.raises(ValueError, match="four positive bet sizes"):
+            BettingStructure(BettingLimit.FIXED_LIMIT, (20, 20, 0, 40), 4)
+
+    def test_fixed_limit_needs_raise_cap(self):
+        """Test rejection of a zero raise cap."""
+        with pytest.raises(ValueError, match="Raise cap"):
+            BettingStructure.fixed_limit(20, raise_cap=0)
+
+    def test_other_limits_take_no_sizes(self):
+        """Test that bet sizes are only accepted for fixed limit."""
+        with pytest.raises(ValueError, match="takes no bet sizes"):
+            BettingStructure(BettingLimit.POT_LIMIT, (20, 20, 40, 40))
+
+    def test_repr(self):
+        """Test string representation."""
+        assert repr(BettingStructure.pot_limit()) == "BettingStructure(POT_LIMIT)"
+        assert "raise_cap=3" in repr(BettingStructure.fixed_limit(10, raise_cap=3))
@@ -0,0 +1,152 @@
+"""Tests for BettingTree."""
+
+import pytest
+from poker_engine.betting_structure import BettingStructure
+from poker_engine.betting_tree import BettingTree, NodeKind
+from poker_engine.betting_validator import ActionType
+from poker_engine.dealer_engine import DealerEngine, GameType
+from poker_engine.player_state import PlayerState
+
+
+def _engine(structure=None, stack=200, num_players=2):
+    players = [PlayerState(f"bot_{i}", i, stack) for i in range(num_players)]
+    engine = DealerEngine(
+        game_type=GameType.TEXAS_HOLDEM,
+        players=players,
+        small_blind_amount=10,
+        big_blind_amount=20,
+        publish_views=False,
+        betting_structure=structure
+    )
+    engine.start_hand()
+    return engine
+
+
+class TestTreeLayout:
+    """Test the flat node arrays."""
+
+    def test_root_children(self):
+        """Test the first decision of a heads-up no-limit hand."""
+        tree = BettingTree.build(_engine(), bet_fractions=(0.5,))
+
+        assert tree.kind[0] == NodeKind.DECISION
+        assert tree.pot[0] == 30
+        actions = [(tree.action_type(c), tree.amount[c]) for c in tree.children(0)]
+        # Raise to half the pot after calling: 10 + 0.5 * 40
+        assert actions == [
+            (ActionType.FOLD, 0),
+            (ActionType.CALL, 10),
+            (ActionType.RAISE, 30),
+            (ActionType.ALL_IN, 190),
+        ]
+
+    def test_children_are_contiguous_and_linked(self):
+        """Test that every node's children point back at it."""
+        tree = BettingTree.build(_engine())
+
+        for node in range(len(tree)):
+            for child in tree.children(node):
+                assert tree.parent[child] == node
+            assert (tree.child_count[node] == 0) == tree.is_terminal(node)
+        assert sum(tree.child_count) == len(tree) - 1
+
+    def test_terminal_nodes(self):
+        """Test fold and showdown leaves."""
+        tree = BettingTree.build(_engine())
+
+        fold = tree.child(0, ActionType.FOLD)
+        assert tree.kind[fold] == NodeKind.FOLD
+        assert tree.player[fold] == -1
+
+        shove = tree.child(0, ActionType.ALL_IN, 190)
+        called = tree.child(shove, ActionType.CALL, 180)
+        assert tree.kind[called] == NodeKind.SHOWDOWN
+        assert tree.pot[called] == 400
+
+    def test_engine_left_unchanged(self):
+        """Test that building restores the engine."""
+        engine = _engine()
+        before = engine.state_hash
+
+        BettingTree.build(engine)
+
+        assert engine.state_hash == before
+        assert engine.pot_manager.get_pot_total() == 30
+
+
+class TestTreeLookup:
+    """Test moving between nodes and action histories."""
+
+    def test_node_id_inverts_history(self):
+        """Test that every node is found from its own history."""
+        tree = BettingTree.build(_engine())
+
+        for node in range(len(tree)):
+            assert tree.node_id(tree.history(node)) == node
+
+    def test_history_crosses_streets(self):
+        """Test a history through the flop."""
+        tree = BettingTree.build(_engine())
+        node = tree.node_id([
+            (ActionType.CALL, 10),
+            (ActionType.CHECK, 0),
+            (ActionType.CHECK, 0),
+        ])
+
+        assert tree.street[node] == 1
+        assert tree.pot[node] == 40
+
+    def test_unknown_action_raises_key_error(self):
+        """Test following an action the tree does not contain."""
+        tree = BettingTree.build(_engine())
+        with pytest.raises(KeyError):
+            tree.child(0, ActionType.RAISE, 33)
+
+
+class TestStructures:
+    """Test trees built under different betting structures."""
+
+    def test_fixed_limit_sizes_and_cap(self):
+        """Test one raise size per node and at most the cap per street."""
+        tree = BettingTree.build(
+            _engine(BettingStructure.fixed_limit(20, raise_cap=3), stack=1000)
+        )
+
+        for node in range(1, len(tree)):
+            action = tree.action_type(node)
+            if action in (ActionType.BET, ActionType.RAISE):
+                siblings = [
+                    c for c in tree.children(tree.parent[node])
+                    if tree.action_type(c) == action
+                ]
+                assert siblings == [node]
+            assert action != ActionType.ALL_IN
+            street_bets = 0
+            walk = node
+            while walk > 0 and tree.street[tree.parent[walk]] == tree.street[node]:
+                if tree.action_type(walk) in (ActionType.BET, ActionType.RAISE):
+                    street_bets += 1
+                walk = tree.parent[walk]
+            # The big blind counts as the first pre-flop bet
+            assert street_bets + (tree.street[node] == 0) <= 3
+
+    def test_pot_limit_caps_raise(self):
+        """Test that pot-limit trees never raise past the pot."""
+        tree = BettingTree.build(
+            _engine(BettingStructure.pot_limit(), stack=1000), bet_fractions=(1.0,)
+        )
+
+        amounts = [tree.amount[c] for c in tree.children(0)]
+        assert amounts == [0, 10, 50]
+
+    def test_max_nodes(self):
+        """Test the node limit."""
+        with pytest.raises(ValueError, match="exceeds 100 nodes"):
+            BettingTree.build(_engine(stack=1000), max_nodes=100)
+
+    def test_nobody_to_act_raises_error(self):
+        """Test building from a table with no decision pending."""
+        engine = _engine()
+        engine.game_state.current_action_player = None
+        with pytest.raises(ValueError, match="No player is due to act"):
+            BettingTree.build(engine)
@@ -3,9 +3,12 @@
 import pytest
 from poker_engine.game_state import GameState
 from poker_engine.player_state import PlayerState, PlayerStatus, RoundStatus
+from poker_engine.chip_ledger import ChipLedger, LedgerEntryKind
+from poker_engine.betting_structure import BettingStructure
 from poker_engine.betting_validator import (
     BettingValidator,
     ActionType,
+    ActionResult,
     InvalidActionError,
     NotPlayersTurnError
 )
@@ -336,6 +339,277 @@ class TestRaiseValidation:
         validator.validate_action("bot_2", ActionType.RAISE, amount=70)
 
 
+class TestMinRaiseFollowsLastRaise:
+    """Test the no-limit minimum raise read from the round aggregates."""
+    
+    def test_min_raise_grows_with_last_raise(self):
+        """Test that a re-raise must be at least the previous raise size."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        game = GameState("game_001", players, 10, 20)
+        validator = BettingValidator(game)
+        
+        players[0].post_bet(50)
+        players[1].post_bet(150)  # raise by 100
+        game.current_action_player = 0
+        
+        assert validator.get_min_raise_increment() == 100
+        with pytest.raises(InvalidActionError, match="at least 250"):
+            validator.validate_action("bot_1", ActionType.RAISE, amount=150)
+        validator.validate_action("bot_1", ActionType.RAISE, amount=200)
+    
+    def test_fixed_min_raise_overrides_last_raise(self):
+        """Test that an explicit min_raise_amount fixes the increment."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        game = GameState("game_001", players, 10, 20)
+        validator = BettingValidator(game, min_raise_amount=20)
+        
+        players[0].post_bet(100)
+        assert validator.get_min_raise_increment() == 20
+
+
+class TestLegalActions:
+    """Test the legal_actions() enumerator."""
+    
+    def _game(self, stacks=(1000, 1000)):
+        players = [PlayerState(f"bot_{i + 1}", i, stack) for i, stack in enumerate(stacks)]
+        game = GameState("game_001", players, 10, 20)
+        game.current_action_player = 0
+        return game, players, BettingValidator(game)
+    
+    def test_unopened_round(self):
+        """Test check, fold, any bet up to the stack, and all-in."""
+        game, players, validator = self._game()
+        
+        legal = validator.legal_actions("bot_1")
+        
+        assert legal.actions == (
+            ActionType.CHECK, ActionType.FOLD, ActionType.BET, ActionType.ALL_IN
+        )
+        assert (legal.call_amount, legal.min_bet, legal.max_bet) == (0, 1, 1000)
+        assert legal.min_raise == legal.max_raise == 0
+    
+    def test_facing_a_bet(self):
+        """Test exact call amount and the raise range."""
+        game, players, validator = self._game()
+        players[1].post_bet(60)
+        
+        legal = validator.legal_actions("bot_1")
+        
+        assert legal.actions == (
+            ActionType.FOLD, ActionType.CALL, ActionType.RAISE, ActionType.ALL_IN
+        )
+        assert legal.call_amount == 60
+        assert (legal.min_raise, legal.max_raise) == (120, 1000)
+    
+    def test_short_stack_cannot_raise(self):
+        """Test that a stack below the minimum raise may only call or shove."""
+        game, players, validator = self._game(stacks=(100, 1000))
+        players[1].post_bet(60)
+        
+        legal = validator.legal_actions("bot_1")
+        
+        assert ActionType.RAISE not in legal.actions
+        assert legal.allows(ActionType.ALL_IN, 100)
+        assert legal.allows(ActionType.CALL, 60)
+    
+    def test_allows_matches_validate_action(self):
+        """Test legal_actions against validate_action over many amounts."""
+        game, players, validator = self._game(stacks=(300, 1000))
+        for setup in (lambda: None, lambda: players[1].post_bet(40), lambda: players[0].post_bet(20)):
+            setup()
+            legal = validator.legal_actions("bot_1")
+            for action in ActionType:
+                for amount in range(0, 320, 10):
+                    try:
+                        validator.validate_action("bot_1", action, amount)
+                        accepted = True
+                    except InvalidActionError:
+                        accepted = False
+                    assert legal.allows(action, amount) == accepted, (action, amount)
+    
+    def test_call_of_nothing_is_allowed(self):
+        """Test that CALL 0 with nothing owed is allowed, as validation accepts it."""
+        game, players, validator = self._game()
+        
+        legal = validator.legal_actions("bot_1")
+        
+        assert ActionType.CALL not in legal.actions
+        assert validator.check_action("bot_1", ActionType.CALL, 0) == ActionResult.OK
+        assert legal.allows(ActionType.CALL, 0)
+        assert not legal.allows(ActionType.CALL, 10)
+    
+    def test_out_of_turn_raises_error(self):
+        """Test that only the player due to act can be enumerated."""
+        game, players, validator = self._game()
+        with pytest.raises(NotPlayersTurnError):
+            validator.legal_actions("bot_2")
+
+
+class TestCheckAction:
+    """Test the exception-free check_action() result codes."""
+    
+    def _game(self):
+        players = [PlayerState("bot_1", 0, 100), PlayerState("bot_2", 1, 1000)]
+        game = GameState("game_001", players, 10, 20)
+        game.current_action_player = 0
+        return game, players, BettingValidator(game)
+    
+    def test_legal_action_is_ok(self):
+        """Test that OK is returned for a legal action and is falsy."""
+        game, players, validator = self._game()
+        result = validator.check_action("bot_1", ActionType.CHECK)
+        
+        assert result == ActionResult.OK
+        assert not result
+    
+    def test_failure_codes(self):
+        """Test the code returned for each kind of illegal action."""
+        game, players, validator = self._game()
+        players[1].post_bet(60)
+        
+        cases = [
+            ("bot_2", ActionType.FOLD, 0, ActionResult.NOT_YOUR_TURN),
+            ("bot_1", ActionType.CHECK, 0, ActionResult.CHECK_FACING_BET),
+            ("bot_1", ActionType.CALL, 50, ActionResult.WRONG_CALL_AMOUNT),
+            ("bot_1", ActionType.BET, 80, ActionResult.BET_FACING_BET),
+            ("bot_1", ActionType.RAISE, 100, ActionResult.RAISE_TOO_SMALL),
+            ("bot_1", ActionType.RAISE, 200, ActionResult.RAISE_EXCEEDS_STACK),
+            ("bot_1", ActionType.ALL_IN, 90, ActionResult.WRONG_ALL_IN_AMOUNT),
+        ]
+        for player_id, action, amount, expected in cases:
+            assert validator.check_action(player_id, action, amount) == expected
+    
+    def test_describe_result_matches_validate_action(self):
+        """Test that the described reason is the message validate_action raises."""
+        game, players, validator = self._game()
+        players[1].post_bet(60)
+        
+        for action in ActionType:
+            for amount in (0, 30, 60, 100, 150):
+                result = validator.check_action("bot_1", action, amount)
+                if result == ActionResult.OK:
+                    validator.validate_action("bot_1", action, amount)
+                    continue
+                with pytest.raises(InvalidActionError) as excinfo:
+                    validator.validate_action("bot_1", action, amount)
+                message = validator.describe_result(result, "bot_1", action, amount)
+                assert str(excinfo.value) == message
+
+
+class TestBettingStructures:
+    """Test pot-limit and fixed-limit bounds on bets and raises."""
+    
+    def _game(self, structure, stacks=(1000, 1000), ledger=None):
+        players = [PlayerState(f"bot_{i + 1}", i, stack) for i, stack in enumerate(stacks)]
+        game = GameState("game_001", players, 10, 20)
+        game.current_action_player = 0
+        validator = BettingValidator(game, betting_structure=structure, ledger=ledger)
+        return game, players, validator
+    
+    def test_pot_limit_raise_reads_pot_from_ledger(self):
+        """Test that a pot-limit raise is capped at the pot after calling."""
+        ledger = ChipLedger(["bot_1", "bot_2"])
+        ledger.record(1, 0, 60, LedgerEntryKind.BET)
+        ledger.record(0, 0, 40, LedgerEntryKind.BET)  # earlier street
+        game, players, validator = self._game(BettingStructure.pot_limit(), ledger=ledger)
+        players[1].post_bet(60)
+        
+        legal = validator.legal_actions("bot_1")
+        
+        # Call 60 makes the pot 160, so the raise is to 60 + 160 = 220
+        assert (legal.min_raise, legal.max_raise) == (120, 220)
+        assert validator.check_action("bot_1", ActionType.RAISE, 221) == (
+            ActionResult.RAISE_TOO_LARGE
+        )
+        assert validator.check_action("bot_1", ActionType.ALL_IN, 1000) == (
+            ActionResult.ALL_IN_EXCEEDS_LIMIT
+        )
+        with pytest.raises(InvalidActionError, match="at most 220"):
+            validator.validate_action("bot_1", ActionType.RAISE, 221)
+    
+    def test_pot_limit_bet_without_ledger(self):
+        """Test that a pot-limit bet is capped at the table's pot."""
+        game, players, validator = self._game(BettingStructure.pot_limit())
+        game.add_to_main_pot(90)
+        
+        legal = validator.legal_actions("bot_1")
+        
+        assert (legal.min_bet, legal.max_bet) == (1, 90)
+        assert ActionType.ALL_IN not in legal.actions
+        assert validator.check_action("bot_1", ActionType.BET, 100) == (
+            ActionResult.BET_WRONG_SIZE
+        )
+    
+    def test_fixed_limit_sizes_are_exact(self):
+        """Test that fixed-limit bets and raises allow one amount each."""
+        game, players, validator = self._game(BettingStructure.fixed_limit(20))
+        
+        legal = validator.legal_actions("bot_1")
+        assert (legal.min_bet, legal.max_bet) == (20, 20)
+        assert validator.check_action("bot_1", ActionType.BET, 30) == (
+            ActionResult.BET_WRONG_SIZE
+        )
+        
+        players[1].post_bet(20)
+        legal = validator.legal_actions("bot_1")
+        assert (legal.min_raise, legal.max_raise) == (40, 40)
+        assert validator.get_min_raise_increment() == 20
+    
+    def test_fixed_limit_raise_cap(self):
+        """Test that raising stops once the cap is reached."""
+        game, players, validator = self._game(BettingStructure.fixed_limit(20, raise_cap=3))
+        players[1].post_bet(60)
+        
+        legal = validator.legal_actions("bot_1")
+        
+        assert legal.actions == (ActionType.FOLD, ActionType.CALL)
+        assert validator.check_action("bot_1", ActionType.RAISE, 80) == (
+            ActionResult.RAISE_CAPPED
+        )
+        with pytest.raises(InvalidActionError, match="capped at 3 bets"):
+            validator.validate_action("bot_1", ActionType.RAISE, 80)
+    
+    def test_fixed_limit_short_stack_may_shove(self):
+        """Test an all-in below a full fixed-limit raise."""
+        game, players, validator = self._game(
+            BettingStructure.fixed_limit(20, raise_cap=3), stacks=(50, 1000)
+        )
+        players[1].post_bet(40)
+        
+        legal = validator.legal_actions("bot_1")
+        
+        assert ActionType.RAISE not in legal.actions
+        assert legal.allows(ActionType.ALL_IN, 50)
+    
+    def test_fixed_limit_rejects_min_raise_amount(self):
+        """Test that fixed limit cannot be combined with a fixed increment."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        game = GameState("game_001", players, 10, 20)
+        with pytest.raises(ValueError, match="Fixed limit"):
+            BettingValidator(game, 40, BettingStructure.fixed_limit(20))
+    
+    def test_allows_matches_check_action(self):
+        """Test legal_actions against check_action for every structure."""
+        for structure in (
+            BettingStructure.no_limit(),
+            BettingStructure.pot_limit(),
+            BettingStructure.fixed_limit(20, raise_cap=3),
+        ):
+            game, players, validator = self._game(structure, stacks=(300, 1000))
+            for bet in (0, 20, 40, 60, 200):
+                if bet:
+                    players[1].post_bet(bet - players[1].current_bet)
+                legal = validator.legal_actions("bot_1")
+                for action in ActionType:
+                    for amount in range(0, 320, 10):
+                        accepted = validator.check_action("bot_1", action, amount) == (
+                            ActionResult.OK
+                        )
+                        assert legal.allows(action, amount) == accepted, (
+                            structure, bet, action, amount
+                        )
+
+
 class TestAllInValidation:
     """Test validating all-in actions."""
     
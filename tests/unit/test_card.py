@@ -77,3 +77,27 @@ class TestCardRepresentation:
         """Test Card str."""
         card = Card("hearts", "A")
         assert str(card) == "A of hearts"
+
+
+class TestCardIndex:
+    """Test Card deck index."""
+    
+    def test_indices_unique_across_deck(self):
+        """Test that all 52 cards map to distinct indices 0-51."""
+        indices = {Card(s, r).get_index() for s in Card.SUITS for r in Card.RANKS}
+        assert indices == set(range(52))
+    
+    def test_index_is_suit_major(self):
+        """Test index layout: suit value * 13 + rank value."""
+        assert Card("hearts", "2").get_index() == 0
+        assert Card("spades", "A").get_index() == 51
+    
+    def test_from_index_inverts_get_index(self):
+        """Test that from_index rebuilds every card from its index."""
+        for index in range(52):
+            assert Card.from_index(index).get_index() == index
+    
+    def test_from_index_out_of_range_raises_error(self):
+        """Test that indices outside the deck are rejected."""
+        with pytest.raises(ValueError, match="Invalid card index"):
+            Card.from_index(52)
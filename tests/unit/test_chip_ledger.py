@@ -0,0 +1,149 @@
+"""Tests for ChipLedger."""
+
+import pytest
+from poker_engine.chip_ledger import ChipLedger, LedgerEntryKind
+from poker_engine.dealer_engine import DealerEngine, GameType
+from poker_engine.player_state import PlayerState
+from poker_engine.pot_manager import PotManager
+
+
+class TestChipLedger:
+    """Test recording and running totals."""
+
+    def test_record_updates_running_totals(self):
+        """Test contributions, awards and pot total after each entry."""
+        ledger = ChipLedger(["alice", "bob"], [1000, 1000])
+        ledger.record(0, 0, 10, LedgerEntryKind.BLIND)
+        ledger.record(1, 0, 20, LedgerEntryKind.BLIND)
+        ledger.record(0, 0, 10, LedgerEntryKind.BET)
+
+        assert ledger.contributions == [20, 20]
+        assert ledger.pot_total == 40
+        assert len(ledger) == 3
+
+        ledger.record(1, 4, 40, LedgerEntryKind.AWARD)
+        assert ledger.pot_total == 0
+        assert ledger.expected_stack(0) == 980
+        assert ledger.expected_stack(1) == 1020
+
+    def test_award_exceeding_pot_raises_error(self):
+        """Test that the ledger cannot pay out more than it holds."""
+        ledger = ChipLedger(["alice", "bob"])
+        ledger.record(0, 0, 50, LedgerEntryKind.BET)
+
+        with pytest.raises(ValueError, match="exceeds chips in pot"):
+            ledger.record(1, 4, 60, LedgerEntryKind.AWARD)
+
+    def test_non_positive_amount_raises_error(self):
+        """Test that zero-chip entries are rejected."""
+        ledger = ChipLedger(["alice"])
+        with pytest.raises(ValueError, match="must be positive"):
+            ledger.record(0, 0, 0, LedgerEntryKind.BET)
+
+    def test_unknown_player_raises_error(self):
+        """Test index lookup for a player not in the hand."""
+        ledger = ChipLedger(["alice"])
+        with pytest.raises(ValueError, match="not in this game"):
+            ledger.index_of("bob")
+
+    def test_round_trip_through_dict(self):
+        """Test that to_dict/from_dict rebuilds entries and totals."""
+        ledger = ChipLedger(["alice", "bob"], [500, 700])
+        ledger.record(0, 0, 25, LedgerEntryKind.BLIND)
+        ledger.record(1, 1, 75, LedgerEntryKind.BET)
+        ledger.record(0, 4, 100, LedgerEntryKind.AWARD)
+
+        rebuilt = ChipLedger.from_dict(ledger.to_dict())
+
+        assert rebuilt.to_dict() == ledger.to_dict()
+        assert rebuilt.awards == [100, 0]
+        assert rebuilt.pot_total == 0
+
+    def test_restore_snapshot(self):
+        """Test that restore drops later entries and their totals."""
+        ledger = ChipLedger(["alice", "bob"], [1000, 1000])
+        ledger.record(0, 0, 10, LedgerEntryKind.BLIND)
+        token = ledger.snapshot()
+        ledger.record(1, 0, 500, LedgerEntryKind.BET)
+
+        ledger.restore(token)
+
+        assert len(ledger) == 1
+        assert ledger.contributions == [10, 0]
+        assert ledger.pot_total == 10
+
+    def test_reset_reuses_ledger(self):
+        """Test that reset empties entries and totals for a new hand."""
+        ledger = ChipLedger(["alice", "bob"], [1000, 1000])
+        ledger.record(0, 0, 40, LedgerEntryKind.BET)
+        token = ledger.snapshot()
+        
+        ledger.reset([960, 1040])
+        
+        assert len(ledger) == 0
+        assert ledger.contributions == [0, 0]
+        assert ledger.pot_total == 0
+        assert ledger.starting_stacks == [960, 1040]
+        
+        ledger.restore(token)
+        assert ledger.starting_stacks == [1000, 1000]
+        assert ledger.pot_total == 40
+    
+    def test_pop_reverses_last_entry(self):
+        """Test that pop removes the newest entry and its totals."""
+        ledger = ChipLedger(["alice", "bob"])
+        ledger.record(0, 0, 40, LedgerEntryKind.BET)
+        ledger.record(1, 4, 40, LedgerEntryKind.AWARD)
+
+        ledger.pop()
+        assert ledger.awards == [0, 0]
+        assert ledger.pot_total == 40
+        ledger.pop()
+        assert len(ledger) == 0
+        assert ledger.total_contributed == 0
+
+    def test_find_discrepancies_names_player(self):
+        """Test that a stack not matching the ledger is reported."""
+        ledger = ChipLedger(["alice", "bob"], [1000, 1000])
+        ledger.record(0, 0, 100, LedgerEntryKind.BET)
+
+        assert ledger.find_discrepancies({"alice": 900, "bob": 1000}) == []
+        violations = ledger.find_discrepancies({"alice": 1000, "bob": 1000})
+        assert len(violations) == 1
+        assert "alice" in violations[0]
+
+
+class TestLedgerIntegration:
+    """Test that the pot manager and engine route chips through the ledger."""
+
+    def test_pot_manager_reads_contributions_from_ledger(self):
+        """Test that add_to_pot lands in a shared ledger."""
+        ledger = ChipLedger(["alice", "bob"])
+        pm = PotManager(["alice", "bob"], ledger=ledger)
+        pm.add_to_pot("alice", 30)
+        pm.add_to_pot("bob", 0)
+
+        assert ledger.contributions == [30, 0]
+        assert len(ledger) == 1
+        assert pm.get_pot_total() == 30
+        assert pm.player_contributions == {"alice": 30, "bob": 0}
+
+    def test_engine_records_blinds(self):
+        """Test that posting blinds creates BLIND entries."""
+        players = [
+            PlayerState("alice", 0, 1000),
+            PlayerState("bob", 1, 1000),
+            PlayerState("charlie", 2, 1000),
+        ]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+
+        entries = engine.ledger.to_dict()["entries"]
+        assert [entry[3] for entry in entries] == [LedgerEntryKind.BLIND] * 2
+        assert engine.ledger.pot_total == 30
+        assert engine.pot_manager.get_pot_total() == 30
@@ -1,11 +1,21 @@
 """Comprehensive tests for DealerEngine class - integration tests."""
 
+import random
+
 import pytest
 from poker_engine.card import Card
+from poker_engine.deck import Deck
 from poker_engine.player_state import PlayerState, PlayerStatus
 from poker_engine.game_state import GameState, GamePhase
 from poker_engine.dealer_engine import DealerEngine, GameType
-from poker_engine.betting_validator import ActionType
+from poker_engine.betting_structure import BettingStructure
+from poker_engine.hand_log import EventKind
+from poker_engine.betting_validator import (
+    ActionType,
+    ActionResult,
+    InvalidActionError,
+    NotPlayersTurnError,
+)
 
 
 class TestDealerEngineInitialisation:
@@ -236,6 +246,202 @@ class TestBettingIntegration:
         engine.pot_manager.add_to_pot("bot_1", 50)
         
         assert engine.pot_manager.get_player_contribution("bot_1") == 50
+    
+    def test_action_snapshot_lists_legal_actions(self):
+        """Test that request_action embeds legal_actions for the actor."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        seat = engine.game_state.current_action_player
+        
+        snapshot = engine.request_action(players[seat].player_id)
+        
+        legal = snapshot["legal_actions"]
+        assert legal.call_amount == snapshot["current_bet_to_call"] == 10
+        assert ActionType.CHECK not in legal.actions
+        assert legal.min_raise == 10 + snapshot["min_raise_increment"]
+    
+    def test_try_action_returns_codes_without_raising(self):
+        """Test that try_action rejects with a code and applies legal actions."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        seat = engine.game_state.current_action_player
+        player_id = players[seat].player_id
+        version = engine.state_version
+        
+        assert engine.try_action(player_id, ActionType.CHECK) == ActionResult.CHECK_FACING_BET
+        assert engine.try_action(players[1 - seat].player_id, ActionType.FOLD) == (
+            ActionResult.NOT_YOUR_TURN
+        )
+        assert engine.state_version == version
+        
+        assert engine.try_action(player_id, ActionType.CALL, 10) == ActionResult.OK
+        assert engine.state_version == version + 1
+        assert players[seat].current_bet == 20
+    
+    def test_process_action_still_raises(self):
+        """Test that process_action raises for the same illegal action."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        seat = engine.game_state.current_action_player
+        
+        with pytest.raises(InvalidActionError, match="Cannot check"):
+            engine.process_action(players[seat].player_id, ActionType.CHECK)
+
+
+class TestTrustedActions:
+    """Test actions applied without full validation."""
+    
+    def _engine(self, trusted=False):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(3)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20,
+            trusted=trusted
+        )
+        engine.start_hand()
+        return engine
+    
+    def _play(self, engine):
+        """Play a legal pre-flop sequence, returning the state hash after each action."""
+        hashes = []
+        for action, amount in [
+            (ActionType.RAISE, 60),
+            (ActionType.CALL, 50),
+            (ActionType.FOLD, 0),
+        ]:
+            seat = engine.game_state.current_action_player
+            engine.process_action(engine.game_state.players[seat].player_id, action, amount)
+            hashes.append(engine.state_hash)
+        return hashes
+    
+    def test_trusted_engine_matches_validated_engine(self):
+        """Test that legal actions leave the same table either way."""
+        assert self._play(self._engine(trusted=True)) == self._play(self._engine())
+    
+    def test_trusted_skips_betting_rules(self):
+        """Test that a trusted action is not checked against the rules."""
+        engine = self._engine()
+        seat = engine.game_state.current_action_player
+        player_id = engine.game_state.players[seat].player_id
+        
+        with pytest.raises(InvalidActionError):
+            engine.process_action(player_id, ActionType.RAISE, 25)
+        engine.process_action(player_id, ActionType.RAISE, 25, trusted=True)
+        
+        assert engine.game_state.players[seat].current_bet == 25
+    
+    def test_per_call_override(self):
+        """Test that trusted=False validates on a trusted engine."""
+        engine = self._engine(trusted=True)
+        seat = engine.game_state.current_action_player
+        player_id = engine.game_state.players[seat].player_id
+        
+        with pytest.raises(InvalidActionError):
+            engine.process_action(player_id, ActionType.CHECK, trusted=False)
+        assert engine.try_action(player_id, ActionType.CHECK, trusted=False) == (
+            ActionResult.CHECK_FACING_BET
+        )
+    
+    def test_consistency_checks_still_apply(self):
+        """Test that turn order and stack size are checked for trusted actions."""
+        engine = self._engine(trusted=True)
+        seat = engine.game_state.current_action_player
+        actor = engine.game_state.players[seat]
+        other = engine.game_state.players[(seat + 1) % 3]
+        
+        with pytest.raises(NotPlayersTurnError):
+            engine.process_action(other.player_id, ActionType.FOLD)
+        with pytest.raises(InvalidActionError, match="exceeds"):
+            engine.process_action(actor.player_id, ActionType.BET, 5000)
+        with pytest.raises(InvalidActionError, match="exceeds"):
+            engine.apply(ActionType.BET, 5000)
+        assert actor.stack == 1000
+    
+    def test_trusted_apply_undo(self):
+        """Test that a trusted apply() can be undone."""
+        engine = self._engine(trusted=True)
+        before = engine.state_hash
+        
+        record = engine.apply(ActionType.CALL, 20)
+        engine.undo(record)
+        
+        assert engine.state_hash == before
+
+
+class TestBettingStructureIntegration:
+    """Test engines built with pot-limit and fixed-limit structures."""
+    
+    def _engine(self, structure):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(3)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20,
+            betting_structure=structure
+        )
+        engine.start_hand()
+        return engine
+    
+    def _actor(self, engine):
+        return engine.game_state.players[engine.game_state.current_action_player].player_id
+    
+    def test_pot_limit_follows_pot_across_hands(self):
+        """Test the pot-limit maximum before and after a raise, and next hand."""
+        engine = self._engine(BettingStructure.pot_limit())
+        
+        # Blinds make the pot 30; calling 20 makes it 50, so raise to 70
+        legal = engine.betting_validator.legal_actions(self._actor(engine))
+        assert legal.max_raise == 70
+        engine.process_action(self._actor(engine), ActionType.RAISE, 70)
+        
+        # SB owes 60; the pot is then 160, so raise to 70 + 160 = 230
+        legal = engine.betting_validator.legal_actions(self._actor(engine))
+        assert legal.max_raise == 230 - 10
+        
+        engine.start_hand()
+        legal = engine.betting_validator.legal_actions(self._actor(engine))
+        assert legal.max_raise == 70
+    
+    def test_fixed_limit_hand_caps_raises(self):
+        """Test a capped fixed-limit pre-flop round and a big-bet turn."""
+        engine = self._engine(BettingStructure.fixed_limit(20))
+        
+        for amount in (40, 50, 60):  # raise to 40, 60, 80 (cap of 4 bets)
+            engine.process_action(self._actor(engine), ActionType.RAISE, amount)
+        
+        legal = engine.betting_validator.legal_actions(self._actor(engine))
+        assert legal.actions == (ActionType.FOLD, ActionType.CALL)
+        with pytest.raises(InvalidActionError, match="capped"):
+            engine.process_action(self._actor(engine), ActionType.RAISE, 60)
+        
+        engine.process_action(self._actor(engine), ActionType.CALL, 40)
+        engine.process_action(self._actor(engine), ActionType.CALL, 20)
+        engine.advance_round()
+        engine.game_state.advance_phase(GamePhase.TURN)
+        
+        legal = engine.betting_validator.legal_actions(self._actor(engine))
+        assert (legal.min_bet, legal.max_bet) == (40, 40)
 
 
 class TestCommunityCards:
@@ -401,6 +607,559 @@ class TestActionSequence:
         )
 
 
+class TestRaiseSizing:
+    """Test that raises commit the validated amount and set the min raise."""
+    
+    def test_raise_commits_amount_and_sets_min_raise(self):
+        """Test a pre-flop raise in a three-handed game."""
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(3)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        
+        seat = engine.game_state.current_action_player
+        raiser = engine.game_state.players[seat]
+        snapshot = engine.request_action(raiser.player_id)
+        assert snapshot["min_raise_increment"] == 20
+        
+        engine.process_action(raiser.player_id, ActionType.RAISE, 60)
+        
+        assert raiser.current_bet == 60
+        assert engine.game_state.betting_round.high_bet == 60
+        assert engine.betting_validator.get_min_raise_increment() == 40
+
+
+class TestPositions:
+    """Test blind and first-to-act seats."""
+    
+    def _engine(self, num_players):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(num_players)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        return engine, players
+    
+    def test_heads_up_button_posts_small_blind_and_acts_first(self):
+        """Test heads-up: button is SB pre-flop and acts last post-flop."""
+        engine, players = self._engine(2)
+        button = engine.game_state.dealer_button
+        other = 1 - button
+        
+        assert players[button].current_bet == 10
+        assert players[other].current_bet == 20
+        assert engine.game_state.current_action_player == button
+        assert engine._get_first_action_seat_post_flop() == other
+    
+    def test_full_table_utg_acts_first(self):
+        """Test that the seat after the big blind opens pre-flop."""
+        engine, players = self._engine(6)
+        button = engine.game_state.dealer_button
+        
+        assert players[(button + 1) % 6].current_bet == 10
+        assert players[(button + 2) % 6].current_bet == 20
+        assert engine.game_state.current_action_player == (button + 3) % 6
+    
+    def test_post_flop_first_skips_folded_and_all_in(self):
+        """Test that post-flop action starts at the first seat able to act."""
+        engine, players = self._engine(4)
+        button = engine.game_state.dealer_button
+        players[(button + 1) % 4].fold()
+        players[(button + 2) % 4].go_all_in()
+        
+        assert engine._get_first_action_seat_post_flop() == (button + 3) % 4
+
+
+class TestSnapshotRestore:
+    """Test cloning engine state for search."""
+    
+    def _engine(self):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(3)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        for i, player in enumerate(players):
+            player.deal_hole_cards([Card("hearts", str(i + 2)), Card("spades", str(i + 2))])
+        return engine
+    
+    def _act(self, engine, action, amount=0):
+        seat = engine.game_state.current_action_player
+        engine.process_action(engine.game_state.players[seat].player_id, action, amount)
+    
+    def test_restore_undoes_a_line_of_play(self):
+        """Test that restoring returns every visible field and the ledger."""
+        engine = self._engine()
+        before = engine.get_game_state()
+        token = engine.snapshot()
+        
+        self._act(engine, ActionType.RAISE, 60)
+        self._act(engine, ActionType.FOLD)
+        self._act(engine, ActionType.ALL_IN, 980)
+        assert engine.get_game_state() != before
+        
+        engine.restore(token)
+        
+        assert engine.get_game_state() == before
+        assert engine.ledger.pot_total == 30
+        assert len(engine.ledger) == 2
+        assert engine.game_state.count_acting_players() == 3
+        assert engine.game_state.betting_round.to_act == 3
+    
+    def test_token_reusable_for_many_branches(self):
+        """Test that one token can be restored after several different lines."""
+        engine = self._engine()
+        token = engine.snapshot()
+        
+        results = []
+        for action, amount in [(ActionType.CALL, 20), (ActionType.FOLD, 0)]:
+            engine.restore(token)
+            self._act(engine, action, amount)
+            results.append(engine.pot_manager.get_pot_total())
+        
+        assert results == [50, 30]
+    
+    def test_restore_across_hands(self):
+        """Test that a token from a previous hand restores that hand's pots."""
+        engine = self._engine()
+        self._act(engine, ActionType.CALL, 20)
+        token = engine.snapshot()
+        
+        engine.start_hand()
+        engine.restore(token)
+        
+        assert engine.pot_manager.get_pot_total() == 50
+        assert engine.ledger is engine.pot_manager.ledger
+
+
+class TestApplyUndo:
+    """Test in-place make/unmake of actions."""
+    
+    def _engine(self):
+        players = [PlayerState(f"bot_{i}", i, 500 + 100 * i) for i in range(4)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        return engine
+    
+    def _legal_moves(self, engine):
+        seat = engine.game_state.current_action_player
+        player = engine.game_state.players[seat]
+        to_call = engine.game_state.betting_round.high_bet - player.current_bet
+        min_raise = engine.betting_validator.get_min_raise_increment()
+        candidates = [
+            (ActionType.FOLD, 0),
+            (ActionType.CHECK, 0),
+            (ActionType.CALL, to_call),
+            (ActionType.BET, 40),
+            (ActionType.RAISE, to_call + min_raise),
+            (ActionType.ALL_IN, player.stack),
+        ]
+        moves = []
+        for action, amount in candidates:
+            try:
+                engine.betting_validator.validate_action(player.player_id, action, amount)
+            except InvalidActionError:
+                continue
+            moves.append((action, amount))
+        return moves
+    
+    def test_undo_restores_exact_state(self):
+        """Test that undoing a sequence returns the snapshot exactly."""
+        engine = self._engine()
+        before = engine.snapshot()
+        
+        records = [
+            engine.apply(ActionType.RAISE, 60),
+            engine.apply(ActionType.FOLD),
+            engine.apply(ActionType.ALL_IN, engine.game_state.players[
+                engine.game_state.current_action_player].stack),
+        ]
+        assert engine.pot_manager.get_pot_total() > 30
+        
+        for record in reversed(records):
+            engine.undo(record)
+        
+        assert engine.snapshot() == before
+        assert engine.pot_manager.folded_players == set()
+        assert engine.game_state.count_acting_players() == 4
+    
+    def test_tree_walk_leaves_state_unchanged(self):
+        """Test a depth-first walk over every legal line, three actions deep."""
+        engine = self._engine()
+        before = engine.snapshot()
+        visited = []
+        
+        def walk(depth):
+            if depth == 0 or engine.is_round_complete():
+                visited.append(engine.pot_manager.get_pot_total())
+                return
+            for action, amount in self._legal_moves(engine):
+                record = engine.apply(action, amount)
+                walk(depth - 1)
+                engine.undo(record)
+        
+        walk(3)
+        
+        assert len(visited) > 20
+        assert engine.snapshot() == before
+    
+    def test_apply_reports_next_seat(self):
+        """Test that the record carries the actor and the next seat."""
+        engine = self._engine()
+        seat = engine.game_state.current_action_player
+        record = engine.apply(ActionType.CALL, 20)
+        
+        assert record.seat == seat
+        assert record.chips == 20
+        assert record.next_seat == engine.game_state.current_action_player
+
+
+class TestStateHash:
+    """Test the incrementally maintained Zobrist state hash."""
+    
+    def _engine(self):
+        players = [PlayerState(f"bot_{i}", i, 500 + 100 * i) for i in range(4)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        for seat in range(4):
+            engine.deal_hole_cards(
+                f"bot_{seat}", [Card.from_index(seat), Card.from_index(seat + 13)]
+            )
+        return engine
+    
+    def _full_hash(self, engine):
+        return engine.zobrist_keys.hash_state(engine.game_state)
+    
+    def test_incremental_hash_matches_full_hash(self):
+        """Test the hash after actions, a new street and a board card."""
+        engine = self._engine()
+        assert engine.state_hash == self._full_hash(engine)
+        
+        for action, amount in [
+            (ActionType.RAISE, 60), (ActionType.CALL, 60),
+            (ActionType.FOLD, 0), (ActionType.CALL, 40),
+        ]:
+            engine.apply(action, amount)
+            assert engine.state_hash == self._full_hash(engine)
+        
+        engine.advance_round()
+        engine.reveal_community_card(Card("spades", "9"))
+        assert engine.state_hash == self._full_hash(engine)
+    
+    def test_undo_restores_hash(self):
+        """Test that apply/undo and restore return the same hash."""
+        engine = self._engine()
+        before = engine.state_hash
+        token = engine.snapshot()
+        
+        records = [engine.apply(ActionType.RAISE, 60), engine.apply(ActionType.ALL_IN, 600)]
+        assert engine.state_hash != before
+        for record in reversed(records):
+            engine.undo(record)
+        assert engine.state_hash == before
+        
+        engine.apply(ActionType.FOLD)
+        engine.restore(token)
+        assert engine.state_hash == before
+    
+    def test_undo_puts_back_seat_terms(self):
+        """Test that later actions hash exactly after undoing a re-raise."""
+        engine = self._engine()
+        engine.apply(ActionType.RAISE, 60)
+        engine.undo(engine.apply(ActionType.RAISE, 200))
+        
+        for action, amount in [(ActionType.CALL, 60), (ActionType.FOLD, 0)]:
+            engine.apply(action, amount)
+            assert engine.state_hash == self._full_hash(engine)
+    
+    def test_restore_copies_hash_from_token(self):
+        """Test that restore() does not rehash and later updates stay exact."""
+        engine = self._engine()
+        token = engine.snapshot()
+        engine.apply(ActionType.RAISE, 60)
+        engine.apply(ActionType.CALL, 60)
+        
+        engine.rehash = None
+        engine.restore(token)
+        assert engine.state_hash == self._full_hash(engine)
+        
+        engine.undo(engine.apply(ActionType.ALL_IN, 500))
+        engine.apply(ActionType.FOLD)
+        assert engine.state_hash == self._full_hash(engine)
+    
+    def test_transpositions_share_hash(self):
+        """Test that two engines reaching the same state hash equally."""
+        first = self._engine()
+        second = self._engine()
+        
+        first.apply(ActionType.CALL, 20)
+        second.apply(ActionType.RAISE, 60)
+        assert first.state_hash != second.state_hash
+        
+        second.undo(second.apply(ActionType.FOLD))
+        second.restore(self._engine().snapshot())
+        second.apply(ActionType.CALL, 20)
+        assert first.state_hash == second.state_hash
+    
+    def test_hole_cards_change_hash(self):
+        """Test that private cards are part of the hash."""
+        engine = self._engine()
+        before = engine.state_hash
+        
+        engine.deal_hole_cards("bot_0", [Card.from_index(40), Card.from_index(41)])
+        assert engine.state_hash != before
+        assert engine.state_hash == self._full_hash(engine)
+    
+    def test_rehash_after_direct_change(self):
+        """Test that rehash() picks up changes made to game_state directly."""
+        engine = self._engine()
+        engine.game_state.players[0].stack += 5
+        
+        assert engine.state_hash != self._full_hash(engine)
+        assert engine.rehash() == self._full_hash(engine)
+
+
+class TestStateDelta:
+    """Test state versions and get_game_state_delta()."""
+    
+    def _engine(self, change_log_size=128):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(3)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20,
+            change_log_size=change_log_size,
+            track_changes=True
+        )
+        engine.start_hand()
+        return engine
+    
+    def test_version_bumps_only_on_change(self):
+        """Test that mutations bump the version and queries do not."""
+        engine = self._engine()
+        version = engine.state_version
+        engine.get_game_state()
+        engine.is_round_complete()
+        assert engine.state_version == version
+        
+        engine.apply(ActionType.CALL, 20)
+        assert engine.state_version == version + 1
+    
+    def test_unchanged_table_returns_empty_delta(self):
+        """Test the delta for a consumer that is up to date."""
+        engine = self._engine()
+        delta = engine.get_game_state_delta(engine.state_version)
+        assert delta == {"version": engine.state_version, "full": False}
+    
+    def test_delta_lists_touched_seats_and_pot(self):
+        """Test that an action reports only the actor, pot and turn."""
+        engine = self._engine()
+        version = engine.state_version
+        seat = engine.game_state.current_action_player
+        next_seat = engine.game_state.get_next_acting_seat(seat)
+        
+        engine.apply(ActionType.CALL, 20)
+        delta = engine.get_game_state_delta(version)
+        
+        assert [p["seat"] for p in delta["players"]] == [seat]
+        assert delta["pot_change"] == 20
+        assert delta["pot_total"] == 50
+        assert delta["current_action_player"] == next_seat
+        assert "phase" not in delta
+        assert "community_cards" not in delta
+    
+    def test_delta_reports_new_street_and_board(self):
+        """Test phase change and only the newly revealed cards."""
+        engine = self._engine()
+        for action, amount in [(ActionType.CALL, 20), (ActionType.CALL, 10), (ActionType.CHECK, 0)]:
+            engine.apply(action, amount)
+        engine.advance_round()
+        for index in (0, 1, 2):
+            engine.reveal_community_card(Card.from_index(index))
+        version = engine.state_version
+        engine.reveal_community_card(Card.from_index(3))
+        
+        delta = engine.get_game_state_delta(version)
+        assert delta["board_from"] == 3
+        assert delta["community_cards"] == [str(Card.from_index(3))]
+        assert "players" not in delta
+        
+        delta = engine.get_game_state_delta(1)
+        assert delta["phase"] == GamePhase.FLOP.value
+        assert delta["board_from"] == 0
+        assert len(delta["community_cards"]) == 4
+    
+    def test_delta_resends_board_replaced_by_restore(self):
+        """Test that rolling back from the flop clears the consumer's board."""
+        engine = self._engine()
+        token = engine.snapshot()
+        for action, amount in [(ActionType.CALL, 20), (ActionType.CALL, 10), (ActionType.CHECK, 0)]:
+            engine.apply(action, amount)
+        engine.advance_round()
+        for index in (0, 1, 2):
+            engine.reveal_community_card(Card.from_index(index))
+        version = engine.state_version
+        
+        engine.restore(token)
+        delta = engine.get_game_state_delta(version)
+        assert delta["phase"] == GamePhase.PRE_FLOP.value
+        assert delta["board_from"] == 0
+        assert delta["community_cards"] == []
+        
+        engine.apply(ActionType.CALL, 20)
+        delta = engine.get_game_state_delta(version)
+        assert delta["board_from"] == 0
+        assert delta["community_cards"] == []
+    
+    def test_undo_is_a_new_version(self):
+        """Test that reverting keeps versions monotonic and nets to no change."""
+        engine = self._engine()
+        version = engine.state_version
+        engine.undo(engine.apply(ActionType.RAISE, 60))
+        
+        delta = engine.get_game_state_delta(version)
+        assert delta["version"] == version + 2
+        assert "pot_change" not in delta
+        assert "current_action_player" not in delta
+    
+    def test_version_older_than_log_returns_full_state(self):
+        """Test that an evicted version falls back to the full state."""
+        engine = self._engine(change_log_size=2)
+        for action, amount in [(ActionType.CALL, 20), (ActionType.CALL, 10), (ActionType.CHECK, 0)]:
+            engine.apply(action, amount)
+        
+        delta = engine.get_game_state_delta(0)
+        assert delta["full"] is True
+        assert len(delta["players"]) == 3
+        assert delta["version"] == engine.state_version
+    
+    def test_future_version_raises_error(self):
+        """Test that versions the engine has not reached are rejected."""
+        engine = self._engine()
+        with pytest.raises(ValueError, match="since_version"):
+            engine.get_game_state_delta(engine.state_version + 1)
+    
+    def test_untracked_engine_returns_full_state(self):
+        """Test that without track_changes versions move but nothing is logged."""
+        engine = self._engine()
+        engine.track_changes = False
+        version = engine.state_version
+        engine.apply(ActionType.CALL, 20)
+        
+        assert engine.state_version == version + 1
+        delta = engine.get_game_state_delta(version)
+        assert delta["full"] is True
+        assert delta["total_pot"] == 50
+    
+    def test_tracking_turned_on_later(self):
+        """Test that deltas start from the version tracking was turned on."""
+        engine = self._engine()
+        engine.track_changes = False
+        engine.apply(ActionType.CALL, 20)
+        engine.track_changes = True
+        version = engine.state_version
+        seat = engine.game_state.current_action_player
+        engine.apply(ActionType.CALL, 10)
+        
+        assert engine.get_game_state_delta(version - 1)["full"] is True
+        delta = engine.get_game_state_delta(version)
+        assert [p["seat"] for p in delta["players"]] == [seat]
+        assert delta["pot_change"] == 10
+
+
+class TestRoundCompletion:
+    """Test engine-tracked round completion."""
+    
+    def _engine(self, auto_advance=False):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(3)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20,
+            auto_advance=auto_advance
+        )
+        engine.start_hand()
+        return engine
+    
+    def _act(self, engine, action, amount=0):
+        seat = engine.game_state.current_action_player
+        player_id = engine.game_state.players[seat].player_id
+        return engine.process_action(player_id, action, amount)
+    
+    def test_round_completes_when_big_blind_checks(self):
+        """Test that the big blind keeps the option after limpers."""
+        engine = self._engine()
+        
+        assert self._act(engine, ActionType.CALL, 20) is False
+        assert self._act(engine, ActionType.CALL, 10) is False
+        assert not engine.is_round_complete()
+        assert self._act(engine, ActionType.CHECK) is True
+        assert engine.game_state.current_phase == GamePhase.PRE_FLOP
+    
+    def test_raise_reopens_round(self):
+        """Test that a raise makes earlier callers act again."""
+        engine = self._engine()
+        self._act(engine, ActionType.CALL, 20)
+        self._act(engine, ActionType.CALL, 10)
+        self._act(engine, ActionType.RAISE, 40)
+        
+        assert engine.game_state.betting_round.to_act == 2
+        assert not engine.is_round_complete()
+    
+    def test_lone_player_able_to_act_has_nothing_pending(self):
+        """Test that a street with one player not all-in is already complete."""
+        players = [PlayerState("bot_0", 0, 2000)] + [
+            PlayerState(f"bot_{i}", i, 1000) for i in (1, 2)
+        ]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        self._act(engine, ActionType.ALL_IN, 1000)
+        self._act(engine, ActionType.ALL_IN, 990)
+        self._act(engine, ActionType.CALL, 980)
+        engine.advance_round()
+        
+        assert engine.game_state.count_acting_players() == 1
+        assert engine.game_state.current_action_player is None
+        assert engine.is_round_complete()
+    
+    def test_auto_advance_moves_to_flop(self):
+        """Test that auto_advance advances when the round completes."""
+        engine = self._engine(auto_advance=True)
+        self._act(engine, ActionType.CALL, 20)
+        self._act(engine, ActionType.CALL, 10)
+        self._act(engine, ActionType.CHECK)
+        
+        assert engine.game_state.current_phase == GamePhase.FLOP
+        assert engine.game_state.betting_round.to_act == 3
+
+
 class TestGamePhaseTransitions:
     """Test game phase transitions."""
     
@@ -548,6 +1307,490 @@ class TestMultipleHands:
         for i in range(len(buttons) - 1):
             expected = (buttons[i] + 1) % 3
             assert buttons[i + 1] == expected
+    
+    def _table(self):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(3)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        return engine, players
+    
+    def _fold_round(self, engine):
+        """Fold every player to the big blind."""
+        while engine.game_state.count_active_players() > 1:
+            seat = engine.game_state.current_action_player
+            engine.process_action(engine.game_state.players[seat].player_id, ActionType.FOLD)
+        engine.distribute_pot(engine.determine_winners())
+        engine.end_hand()
+    
+    def test_components_are_reused(self):
+        """Test that a new hand resets the ledger and pots in place."""
+        engine, players = self._table()
+        validator, ledger, pot_manager = engine.betting_validator, engine.ledger, engine.pot_manager
+        
+        engine.start_hand()
+        self._fold_round(engine)
+        engine.start_hand()
+        
+        assert engine.betting_validator is validator
+        assert engine.ledger is ledger
+        assert engine.pot_manager is pot_manager
+        assert len(engine.ledger) == 2
+        assert engine.pot_manager.folded_players == set()
+    
+    def test_stacks_carry_forward(self):
+        """Test that the next hand starts from the last hand's stacks."""
+        engine, players = self._table()
+        engine.start_hand()
+        self._fold_round(engine)
+        stacks = [p.stack for p in players]
+        
+        engine.start_hand()
+        
+        assert engine.ledger.starting_stacks == stacks
+        assert sum(p.stack for p in players) + engine.ledger.pot_total == 3000
+    
+    def test_start_hand_with_stacks(self):
+        """Test starting a hand from given stacks."""
+        engine, players = self._table()
+        engine.start_hand({"bot_0": 500, "bot_1": 2000})
+        
+        assert engine.ledger.starting_stacks == [500, 2000, 1000]
+        with pytest.raises(ValueError, match="not in this game"):
+            engine.start_hand({"bot_9": 500})
+    
+    def test_busted_player_sits_out(self):
+        """Test that a player without chips is skipped by the button and blinds."""
+        engine, players = self._table()
+        engine.start_hand({"bot_2": 0})
+        
+        assert players[2].status == PlayerStatus.OUT_OF_HAND
+        assert engine.game_state.count_active_players() == 2
+        assert players[2].current_bet == 0
+        
+        buttons = []
+        for _ in range(3):
+            engine.end_hand()
+            engine.start_hand()
+            buttons.append(engine.game_state.dealer_button)
+        assert 2 not in buttons
+    
+    def test_fewer_than_two_players_with_chips_raises_error(self):
+        """Test that a hand needs two players with chips."""
+        engine, players = self._table()
+        with pytest.raises(ValueError, match="Need 2 players with chips"):
+            engine.start_hand({"bot_1": 0, "bot_2": 0})
+
+
+def _dealing_engine(num_players=3, seed=1, **kwargs):
+    """Build an engine that deals from a seeded deck."""
+    players = [PlayerState(f"bot_{i + 1}", i, 1000) for i in range(num_players)]
+    return DealerEngine(
+        game_type=GameType.TEXAS_HOLDEM,
+        players=players,
+        small_blind_amount=10,
+        big_blind_amount=20,
+        deck=Deck(random.Random(seed)),
+        **kwargs
+    )
+
+
+def _call_down(engine, player, legal):
+    """Agent that checks or calls every decision."""
+    if ActionType.CHECK in legal.actions:
+        return ActionType.CHECK, 0
+    if ActionType.CALL in legal.actions:
+        return ActionType.CALL, legal.call_amount
+    return ActionType.ALL_IN, legal.all_in_amount
+
+
+class TestEngineDealing:
+    """Test an engine dealing from its own deck."""
+    
+    def test_start_hand_deals_hole_cards(self):
+        """Test that every player in the hand gets two distinct cards."""
+        engine = _dealing_engine()
+        engine.start_hand()
+        
+        hands = [p.hole_cards for p in engine.game_state.players]
+        assert all(len(cards) == 2 for cards in hands)
+        assert len({card for cards in hands for card in cards}) == 6
+        assert engine.deck.remaining == 46
+    
+    def test_busted_player_is_not_dealt_in(self):
+        """Test that a player sitting out gets no cards."""
+        engine = _dealing_engine()
+        engine.start_hand({"bot_3": 0})
+        
+        assert engine.game_state.players[2].hole_cards == []
+        assert engine.deck.remaining == 48
+    
+    def test_advance_round_deals_the_board(self):
+        """Test flop, turn and river as the rounds advance."""
+        engine = _dealing_engine(num_players=2, auto_advance=True)
+        engine.start_hand()
+        board_sizes = []
+        while engine.game_state.current_phase != GamePhase.RIVER:
+            seat = engine.game_state.current_action_player
+            player = engine.game_state.players[seat]
+            legal = engine.betting_validator.legal_actions(player.player_id)
+            engine.process_action(player.player_id, *_call_down(engine, player, legal))
+            if engine.game_state.current_phase != GamePhase.PRE_FLOP:
+                board_sizes.append(len(engine.game_state.community_cards))
+        
+        assert sorted(set(board_sizes)) == [3, 4, 5]
+        assert engine.game_state.community_cards == engine.deck.dealt[4:]
+    
+    def test_state_hash_covers_dealt_cards(self):
+        """Test that dealing keeps the incremental hash current."""
+        engine = _dealing_engine(num_players=2)
+        engine.start_hand()
+        engine.apply(ActionType.CALL, 10)
+        engine.apply(ActionType.CHECK)
+        engine.advance_round()
+        
+        assert engine.state_hash == engine.zobrist_keys.hash_state(engine.game_state)
+    
+    def test_restore_rewinds_the_deck(self):
+        """Test that restore() puts dealt board cards back in the deck."""
+        engine = _dealing_engine(num_players=2)
+        engine.start_hand()
+        engine.apply(ActionType.CALL, 10)
+        engine.apply(ActionType.CHECK)
+        token = engine.snapshot()
+        
+        engine.advance_round()
+        flop = list(engine.game_state.community_cards)
+        engine.restore(token)
+        engine.advance_round()
+        
+        assert engine.game_state.community_cards == flop
+        assert engine.deck.remaining == 45
+    
+    def test_seeded_decks_deal_the_same_hand(self):
+        """Test that engines with equal seeds deal identically."""
+        first = _dealing_engine(seed=9)
+        second = _dealing_engine(seed=9)
+        first.start_hand()
+        second.start_hand()
+        
+        assert first.state_hash == second.state_hash
+
+
+class TestPlayHand:
+    """Test the built-in hand driver."""
+    
+    def test_plays_hand_to_showdown(self):
+        """Test a checked-down hand: full board, pot awarded, chips kept."""
+        engine = _dealing_engine()
+        agents = {p.player_id: _call_down for p in engine.game_state.players}
+        
+        winnings = engine.play_hand(agents)
+        
+        assert len(engine.game_state.community_cards) == 5
+        assert sum(winnings.values()) == 60
+        assert sum(p.stack for p in engine.game_state.players) == 3000
+        assert engine.game_state.current_phase == GamePhase.HAND_COMPLETE
+        assert engine.ledger.pot_total == 0
+    
+    def test_fold_ends_hand_early(self):
+        """Test that the last player standing wins without a board."""
+        engine = _dealing_engine(num_players=2)
+        
+        def fold(engine, player, legal):
+            return ActionType.FOLD, 0
+        
+        winnings = engine.play_hand({"bot_1": fold, "bot_2": fold})
+        
+        # The button posts the small blind heads-up and folds first
+        big_blind = engine.game_state.players[1 - engine.game_state.dealer_button]
+        assert winnings == {big_blind.player_id: 30}
+        assert engine.game_state.community_cards == []
+    
+    def test_all_in_runs_the_board_out(self):
+        """Test that the board is dealt out once nobody can bet."""
+        engine = _dealing_engine(num_players=2)
+        
+        def shove(engine, player, legal):
+            if ActionType.ALL_IN in legal.actions:
+                return ActionType.ALL_IN, legal.all_in_amount
+            return _call_down(engine, player, legal)
+        
+        engine.play_hand({"bot_1": shove, "bot_2": shove})
+        
+        assert len(engine.game_state.community_cards) == 5
+        assert sum(p.stack for p in engine.game_state.players) == 2000
+    
+    def test_agent_sees_engine_player_and_legal_actions(self):
+        """Test the arguments each agent is called with."""
+        engine = _dealing_engine(num_players=2)
+        calls = []
+        
+        def record(agent_engine, player, legal):
+            seat = agent_engine.game_state.current_action_player
+            calls.append((agent_engine, player, legal.call_amount, seat))
+            return _call_down(agent_engine, player, legal)
+        
+        engine.play_hand({"bot_1": record, "bot_2": record})
+        
+        agent_engine, player, call_amount, seat = calls[0]
+        assert agent_engine is engine
+        assert player is engine.game_state.players[seat]
+        assert call_amount == 10
+    
+    def test_hands_carry_stacks_forward(self):
+        """Test consecutive hands on one engine."""
+        engine = _dealing_engine()
+        agents = {p.player_id: _call_down for p in engine.game_state.players}
+        
+        for _ in range(20):
+            engine.play_hand(agents)
+        
+        assert sum(p.stack for p in engine.game_state.players) == 3000
+    
+    def test_illegal_action_raises_error(self):
+        """Test that an illegal agent action is rejected."""
+        engine = _dealing_engine(num_players=2)
+        
+        def bad_bet(engine, player, legal):
+            return ActionType.BET, 1
+        
+        with pytest.raises(InvalidActionError):
+            engine.play_hand({"bot_1": bad_bet, "bot_2": bad_bet})
+        assert engine.game_state.current_phase == GamePhase.PRE_FLOP
+    
+    def test_missing_agent_raises_error(self):
+        """Test that every player in the hand needs an agent."""
+        engine = _dealing_engine(num_players=2)
+        
+        with pytest.raises(ValueError, match="No agent for bot_2"):
+            engine.play_hand({"bot_1": _call_down})
+    
+    def test_needs_a_deck(self):
+        """Test that play_hand() requires an engine that deals."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        
+        with pytest.raises(ValueError, match="needs an engine with a deck"):
+            engine.play_hand({"bot_1": _call_down, "bot_2": _call_down})
+
+
+class TestHandLogAndReplay:
+    """Test the engine's hand log and replaying it."""
+    
+    def _shove(self, engine, player, legal):
+        """Agent that moves all-in whenever it can."""
+        if ActionType.ALL_IN in legal.actions:
+            return ActionType.ALL_IN, legal.all_in_amount
+        return _call_down(engine, player, legal)
+    
+    def test_hand_is_logged_in_order(self):
+        """Test blinds, deal, actions, streets, showdown and awards."""
+        engine = _dealing_engine()
+        agents = {p.player_id: _call_down for p in engine.game_state.players}
+        winnings = engine.play_hand(agents)
+        log = engine.hand_log
+        kinds = [event.kind for event in log]
+        
+        assert kinds[:2] == [EventKind.BLIND, EventKind.BLIND]
+        assert kinds[2:8] == [EventKind.DEAL] * 6
+        assert kinds.count(EventKind.STREET) == 3
+        assert [e.seat for e in log if e.kind == EventKind.DEAL][6:] == [-1] * 5
+        assert kinds.count(EventKind.SHOWDOWN) == 1
+        assert log.awards() == {pid: won for pid, won in winnings.items() if won}
+        assert log.button == engine.game_state.dealer_button
+        assert log.starting_stacks == [1000, 1000, 1000]
+    
+    def test_undo_and_restore_rewind_the_log(self):
+        """Test that the log follows undo() and restore()."""
+        engine = _dealing_engine()
+        engine.start_hand()
+        length = len(engine.hand_log)
+        token = engine.snapshot()
+        
+        record = engine.apply(ActionType.CALL, 20)
+        assert len(engine.hand_log) == length + 1
+        engine.undo(record)
+        assert len(engine.hand_log) == length
+        
+        engine.apply(ActionType.FOLD)
+        engine.restore(token)
+        assert len(engine.hand_log) == length
+    
+    def test_replay_reproduces_hand(self):
+        """Test that a replay ends in the same table and log."""
+        engine = _dealing_engine(num_players=4)
+        agents = {p.player_id: self._shove for p in engine.game_state.players}
+        stacks = {player_id: 1000 for player_id in agents}
+        for _ in range(5):
+            winnings = engine.play_hand(agents, stacks)
+            log = engine.hand_log.copy()
+            final_stacks = [p.stack for p in engine.game_state.players]
+            state_hash = engine.state_hash
+            
+            # The engine's own log may be replayed too
+            assert engine.replay(engine.hand_log) == winnings
+            engine.end_hand()
+            
+            assert [p.stack for p in engine.game_state.players] == final_stacks
+            assert engine.state_hash == state_hash
+            assert engine.hand_log.to_dict() == log.to_dict()
+    
+    def test_partial_replay_rebuilds_intermediate_state(self):
+        """Test that stopping early matches the hand at that point."""
+        engine = _dealing_engine(num_players=2)
+        engine.start_hand()
+        engine.apply(ActionType.CALL, 10)
+        engine.apply(ActionType.CHECK)
+        engine.advance_round()
+        expected = engine.state_hash
+        length = len(engine.hand_log)
+        engine.apply(ActionType.BET, 20)
+        engine.apply(ActionType.FOLD)
+        
+        assert engine.replay(engine.hand_log.copy(), until=length) is None
+        assert engine.state_hash == expected
+        assert len(engine.game_state.community_cards) == 3
+    
+    def test_replay_keeps_runouts(self):
+        """Test that a run-it-twice showdown replays with the same runs."""
+        engine = _dealing_engine(num_players=2)
+        engine.start_hand()
+        engine.apply(ActionType.ALL_IN, 990)
+        engine.apply(ActionType.CALL, 980)
+        engine.advance_round()
+        runouts = [engine.deck.deal(2), engine.deck.deal(2)]
+        winnings = engine.determine_winners(runouts)
+        engine.distribute_pot(winnings)
+        log = engine.hand_log.copy()
+        
+        assert engine.replay(log) == winnings
+        assert engine.hand_log.to_dict() == log.to_dict()
+    
+    def test_replay_keeps_runs_of_a_complete_board(self):
+        """Test that empty runouts on a full board replay as the same runs."""
+        engine = _dealing_engine(num_players=2)
+        engine.start_hand()
+        engine.apply(ActionType.ALL_IN, 990)
+        engine.apply(ActionType.CALL, 980)
+        for _ in range(3):
+            engine.advance_round()
+        assert len(engine.game_state.community_cards) == 5
+        winnings = engine.determine_winners([[], []])
+        engine.distribute_pot(winnings)
+        log = engine.hand_log.copy()
+        
+        assert [e.code for e in log if e.kind == EventKind.SHOWDOWN] == [2]
+        assert engine.replay(log) == winnings
+        assert engine.hand_log.to_dict() == log.to_dict()
+    
+    def test_replay_leaves_deck_alone(self):
+        """Test that a replay neither shuffles nor deals the deck."""
+        engine = _dealing_engine()
+        agents = {p.player_id: _call_down for p in engine.game_state.players}
+        engine.play_hand(agents)
+        log = engine.hand_log.copy()
+        dealt = engine.deck.dealt
+        
+        engine.replay(log)
+        assert engine.deck.dealt == dealt
+    
+    def test_replay_for_other_players_raises_error(self):
+        """Test that a log only replays at its own table."""
+        engine = _dealing_engine()
+        engine.play_hand({p.player_id: _call_down for p in engine.game_state.players})
+        other = _dealing_engine(num_players=2)
+        
+        with pytest.raises(ValueError, match="Hand log is for players"):
+            other.replay(engine.hand_log)
+    
+    def test_start_hand_on_given_button(self):
+        """Test putting the button on a chosen seat."""
+        engine = _dealing_engine()
+        engine.start_hand(button=2)
+        assert engine.game_state.dealer_button == 2
+        
+        with pytest.raises(ValueError, match="No seat 5"):
+            engine.start_hand(button=5)
+
+
+class TestEngineCheckpoint:
+    """Test resuming a hand from GameState.to_bytes()."""
+    
+    def _flop_engine(self):
+        """Return a dealing engine on the flop with chips in the pot."""
+        engine = _dealing_engine(num_players=4)
+        engine.start_hand()
+        engine.apply(ActionType.RAISE, 60)
+        engine.apply(ActionType.FOLD)
+        engine.apply(ActionType.CALL, 50)
+        engine.apply(ActionType.ALL_IN, engine.game_state.players[
+            engine.game_state.current_action_player].stack)
+        engine.apply(ActionType.CALL, engine._calculate_call_amount(
+            engine.game_state.players[engine.game_state.current_action_player]))
+        engine.apply(ActionType.FOLD)
+        engine.advance_round()
+        return engine
+    
+    def test_game_state_round_trip_keeps_the_pot(self):
+        """Test that a mid-hand table keeps its pot and starting stacks."""
+        engine = self._flop_engine()
+        
+        rebuilt = GameState.from_bytes(engine.game_state.to_bytes())
+        
+        assert rebuilt.get_total_pot() == engine.pot_manager.get_pot_total() > 0
+        assert rebuilt.ledger.starting_stacks == engine.ledger.starting_stacks
+        assert rebuilt.ledger.contributions == engine.ledger.contributions
+    
+    def test_load_bytes_resumes_the_hand(self):
+        """Test that a loaded engine finishes the hand as the original does."""
+        engine = self._flop_engine()
+        data = engine.game_state.to_bytes()
+        copy = _dealing_engine(num_players=4, seed=99)
+        copy.load_bytes(data)
+        
+        assert copy.state_hash == engine.state_hash
+        assert copy.pot_manager.build_pots() == engine.pot_manager.build_pots()
+        assert copy.ledger.find_discrepancies(
+            {p.player_id: p.stack for p in copy.game_state.players}
+        ) == []
+        in_play = set(copy.game_state.community_cards)
+        for player in copy.game_state.players:
+            in_play.update(player.hole_cards)
+        assert not in_play & set(copy.deck.deal(copy.deck.remaining))
+        
+        for table in (engine, copy):
+            while table.game_state.current_action_player is not None:
+                table.apply(ActionType.CHECK)
+            table.game_state.community_cards.extend(
+                [Card.from_index(51), Card.from_index(50)]
+            )
+        winnings = engine.determine_winners()
+        assert copy.determine_winners() == winnings
+        engine.distribute_pot(winnings)
+        copy.distribute_pot(winnings)
+        assert [p.stack for p in copy.game_state.players] == [
+            p.stack for p in engine.game_state.players
+        ]
+        assert sum(p.stack for p in copy.game_state.players) == 4000
+    
+    def test_load_bytes_without_contributions_raises_error(self):
+        """Test that a pot with no per-seat chips cannot be resumed."""
+        engine = _dealing_engine(num_players=2)
+        game = GameState.from_bytes(engine.game_state.to_bytes())
+        game.ledger = None
+        game.add_to_main_pot(30)
+        
+        with pytest.raises(ValueError, match="no pot contributions"):
+            engine.load_bytes(game.to_bytes())
 
 
 class TestDealerEngineRepr:
@@ -637,3 +1880,54 @@ class TestComplexGameScenario:
             
             assert short_stack.status == PlayerStatus.ALL_IN
             assert short_stack.stack == 0
+
+
+class TestRunItMultipleTimes:
+    """Test splitting an all-in pot across several runouts."""
+    
+    def _all_in_heads_up(self):
+        """Return an engine where both players are all-in on the flop."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        players[0].deal_hole_cards([Card("hearts", "A"), Card("spades", "A")])
+        players[1].deal_hole_cards([Card("diamonds", "K"), Card("clubs", "K")])
+        # Heads-up the button (bot_2) posts the small blind and acts first
+        engine.process_action("bot_2", ActionType.ALL_IN, 990)
+        engine.process_action("bot_1", ActionType.CALL, 980)
+        for card in [Card("hearts", "2"), Card("spades", "7"), Card("diamonds", "9")]:
+            engine.game_state.reveal_community_card(card)
+        return engine
+    
+    def test_each_run_awards_its_share(self):
+        """Test that each runout settles half the pot."""
+        engine = self._all_in_heads_up()
+        
+        winnings = engine.determine_winners(runouts=[
+            [Card("clubs", "J"), Card("diamonds", "3")],
+            [Card("hearts", "K"), Card("clubs", "4")],
+        ])
+        
+        assert winnings == {"bot_1": 1000, "bot_2": 1000}
+    
+    def test_runout_with_wrong_length_raises_error(self):
+        """Test that a runout must complete the board exactly."""
+        engine = self._all_in_heads_up()
+        
+        with pytest.raises(ValueError, match="must have 2 cards"):
+            engine.determine_winners(runouts=[[Card("clubs", "J")]])
+    
+    def test_runout_reusing_card_raises_error(self):
+        """Test that runouts cannot share or reuse cards."""
+        engine = self._all_in_heads_up()
+        
+        with pytest.raises(ValueError, match="dealt twice"):
+            engine.determine_winners(runouts=[
+                [Card("clubs", "J"), Card("diamonds", "3")],
+                [Card("clubs", "J"), Card("clubs", "4")],
+            ])
@@ -0,0 +1,65 @@
+"""Tests for Deck class."""
+
+import random
+
+import pytest
+from poker_engine.deck import Deck, FULL_DECK
+
+
+class TestDeck:
+    """Test shuffling and dealing."""
+    
+    def test_deals_every_card_once(self):
+        """Test that a shuffled deck deals all 52 distinct cards."""
+        deck = Deck(random.Random(1))
+        cards = deck.deal(52)
+        
+        assert len(set(cards)) == 52
+        assert set(cards) == set(FULL_DECK)
+        assert deck.remaining == 0
+    
+    def test_deal_past_the_end_raises_error(self):
+        """Test that dealing more cards than are left raises ValueError."""
+        deck = Deck(random.Random(1))
+        deck.deal(50)
+        
+        with pytest.raises(ValueError, match="2 left"):
+            deck.deal(3)
+        assert deck.remaining == 2
+    
+    def test_seeded_decks_deal_alike(self):
+        """Test that the same seed gives the same order."""
+        first = Deck(random.Random(7))
+        second = Deck(random.Random(7))
+        
+        assert first.deal(10) == second.deal(10)
+    
+    def test_shuffle_gathers_cards(self):
+        """Test that shuffle() restores a full deck."""
+        deck = Deck(random.Random(1))
+        deck.deal(9)
+        deck.shuffle()
+        
+        assert deck.remaining == 52
+        assert deck.dealt == []
+    
+    def test_dealt_lists_cards_in_order(self):
+        """Test that dealt holds every card dealt since the shuffle."""
+        deck = Deck(random.Random(1))
+        hole = deck.deal(2)
+        flop = deck.deal(3)
+        
+        assert deck.dealt == hole + flop
+    
+    def test_snapshot_restore(self):
+        """Test that restore() rewinds dealing, even across a shuffle."""
+        deck = Deck(random.Random(1))
+        deck.deal(4)
+        token = deck.snapshot()
+        expected = deck.deal(3)
+        deck.shuffle()
+        
+        deck.restore(token)
+        
+        assert deck.remaining == 48
+        assert deck.deal(3) == expected
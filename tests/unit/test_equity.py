@@ -0,0 +1,100 @@
+"""Tests for all-in expected winnings."""
+
+import random
+
+import pytest
+from poker_engine.card import Card
+from poker_engine.equity import expected_winnings
+from poker_engine.hand_evaluator import HandEvaluator
+from poker_engine.player_state import PlayerState
+from poker_engine.pot_manager import PotManager
+from poker_engine.winner_determiner import WinnerDeterminer
+
+
+def _aces_vs_kings():
+    """Return (players, pots) for AA vs KK with 100 each in the pot."""
+    alice = PlayerState("alice", 0, 1000)
+    bob = PlayerState("bob", 1, 1000)
+    alice.deal_hole_cards([Card("hearts", "A"), Card("spades", "A")])
+    bob.deal_hole_cards([Card("diamonds", "K"), Card("clubs", "K")])
+
+    pm = PotManager(["alice", "bob"])
+    pm.add_to_pot("alice", 100)
+    pm.add_to_pot("bob", 100)
+    return [alice, bob], pm.build_pots()
+
+
+class TestExpectedWinnings:
+    """Test equity-weighted pot awards."""
+
+    TURN_BOARD = [
+        Card("hearts", "2"),
+        Card("spades", "7"),
+        Card("diamonds", "9"),
+        Card("clubs", "J")
+    ]
+
+    def test_turn_all_in_exact_enumeration(self):
+        """Test exact EV with one card to come (KK has two outs in 44)."""
+        players, pots = _aces_vs_kings()
+        determiner = WinnerDeterminer(HandEvaluator())
+
+        ev = expected_winnings(determiner, players, pots, self.TURN_BOARD)
+
+        assert ev["alice"] == pytest.approx(200 * 42 / 44)
+        assert ev["bob"] == pytest.approx(200 * 2 / 44)
+
+    def test_complete_board_returns_actual_result(self):
+        """Test that a full board gives the real award."""
+        players, pots = _aces_vs_kings()
+        determiner = WinnerDeterminer(HandEvaluator())
+        board = self.TURN_BOARD + [Card("spades", "K")]
+
+        ev = expected_winnings(determiner, players, pots, board)
+
+        assert ev == {"alice": 0.0, "bob": 200.0}
+
+    def test_sampled_runouts_conserve_pot(self):
+        """Test that sampled EV still sums to the pot."""
+        players, pots = _aces_vs_kings()
+        determiner = WinnerDeterminer(HandEvaluator())
+
+        ev = expected_winnings(
+            determiner, players, pots, [], max_runouts=20, rng=random.Random(7)
+        )
+
+        assert sum(ev.values()) == pytest.approx(200)
+        assert ev["alice"] > ev["bob"]
+
+    def test_flop_all_in_is_enumerated_exactly(self):
+        """Test that every one of the 990 flop runouts is counted."""
+        players, pots = _aces_vs_kings()
+        determiner = WinnerDeterminer(HandEvaluator())
+        flop = self.TURN_BOARD[:3]
+
+        ev = expected_winnings(determiner, players, pots, flop, max_runouts=1)
+
+        # Averages over 990 boards are multiples of 200/990
+        assert ev == expected_winnings(determiner, players, pots, flop)
+        assert sum(ev.values()) == pytest.approx(200)
+        assert ev["bob"] * 990 / 200 == pytest.approx(round(ev["bob"] * 990 / 200))
+
+    def test_sampling_leaves_global_random_alone(self):
+        """Test that a pre-flop estimate does not consume the shared generator."""
+        players, pots = _aces_vs_kings()
+        determiner = WinnerDeterminer(HandEvaluator())
+
+        random.seed(11)
+        expected = random.random()
+        random.seed(11)
+        expected_winnings(determiner, players, pots, [], max_runouts=5)
+
+        assert random.random() == expected
+
+    def test_invalid_max_runouts_raises_error(self):
+        """Test that a non-positive runout budget is rejected."""
+        players, pots = _aces_vs_kings()
+        determiner = WinnerDeterminer(HandEvaluator())
+
+        with pytest.raises(ValueError, match="max_runouts"):
+            expected_winnings(determiner, players, pots, [], max_runouts=0)
@@ -0,0 +1,147 @@
+"""Tests for EvaluationCache and SharedEvaluationTable."""
+
+import pytest
+from poker_engine.card import Card
+from poker_engine.evaluation_cache import (
+    EvaluationCache,
+    SharedEvaluationTable,
+    card_mask,
+    canonical_key,
+    LRU,
+    CLOCK,
+    ENTRY_SIZE_BYTES,
+)
+from poker_engine.hand_evaluator import HandEvaluator
+from poker_engine.player_state import PlayerState
+from poker_engine.winner_determiner import WinnerDeterminer
+
+
+class TestCanonicalKey:
+    """Test card masks and suit canonicalisation."""
+
+    def test_card_mask_sets_one_bit_per_card(self):
+        """Test that each card contributes its own bit."""
+        cards = [Card("hearts", "2"), Card("spades", "A")]
+        mask = card_mask(cards)
+        assert bin(mask).count("1") == 2
+        assert mask & (1 << Card("hearts", "2").get_index())
+        assert mask & (1 << Card("spades", "A").get_index())
+
+    def test_suit_permutation_same_key(self):
+        """Test that swapping suits yields the same canonical key."""
+        hand_a = [Card("hearts", "A"), Card("hearts", "K"), Card("spades", "2")]
+        hand_b = [Card("clubs", "A"), Card("clubs", "K"), Card("diamonds", "2")]
+        assert canonical_key(card_mask(hand_a)) == canonical_key(card_mask(hand_b))
+
+    def test_different_suit_pattern_different_key(self):
+        """Test that suited and offsuit hands do not collide."""
+        suited = [Card("hearts", "A"), Card("hearts", "K")]
+        offsuit = [Card("hearts", "A"), Card("spades", "K")]
+        assert canonical_key(card_mask(suited)) != canonical_key(card_mask(offsuit))
+
+
+class TestEvictionPolicies:
+    """Test LRU and CLOCK eviction."""
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test that LRU drops the entry not touched for longest."""
+        cache = EvaluationCache(max_entries=2, policy=LRU)
+        cache.put(1, 1.0)
+        cache.put(2, 2.0)
+        cache.get(1)
+        cache.put(3, 3.0)
+
+        assert cache.get(2) is None
+        assert cache.get(1) == 1.0
+        assert cache.evictions == 1
+
+    def test_clock_gives_referenced_entries_second_chance(self):
+        """Test that CLOCK skips an entry referenced since the last sweep."""
+        cache = EvaluationCache(max_entries=2, policy=CLOCK)
+        cache.put(1, 1.0)
+        cache.put(2, 2.0)
+        cache.get(1)
+        cache.put(3, 3.0)
+
+        assert cache.get(2) is None
+        assert cache.get(1) == 1.0
+        assert cache.get(3) == 3.0
+        assert len(cache) == 2
+
+    def test_max_bytes_caps_entries(self):
+        """Test that a byte budget translates to an entry cap."""
+        cache = EvaluationCache(max_entries=1000, max_bytes=ENTRY_SIZE_BYTES * 10)
+        assert cache.max_entries == 10
+
+    def test_unknown_policy_raises_error(self):
+        """Test that an unknown policy is rejected."""
+        with pytest.raises(ValueError, match="Unknown eviction policy"):
+            EvaluationCache(policy="fifo")
+
+    def test_stats_track_hits_and_misses(self):
+        """Test hit/miss counters and hit rate."""
+        cache = EvaluationCache()
+        assert cache.get(7) is None
+        cache.put(7, 7.0)
+        assert cache.get(7) == 7.0
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+class TestSharedEvaluationTable:
+    """Test the memory-mapped shared backing."""
+
+    def test_values_visible_across_handles(self, tmp_path):
+        """Test that a second mapping of the same file sees writes."""
+        path = str(tmp_path / "eval.cache")
+        writer = SharedEvaluationTable(path, num_slots=64)
+        reader = SharedEvaluationTable(path, num_slots=64)
+
+        writer.put(12345, 678.9)
+        assert reader.get(12345) == 678.9
+        assert reader.get(54321) is None
+
+        writer.close()
+        reader.close()
+
+    def test_cache_warms_from_shared_table(self, tmp_path):
+        """Test that a local miss is answered by the shared table."""
+        path = str(tmp_path / "eval.cache")
+        warm = EvaluationCache(shared=SharedEvaluationTable(path, 64))
+        cold = EvaluationCache(shared=SharedEvaluationTable(path, 64))
+
+        warm.put(99, 1.5)
+        assert cold.get(99) == 1.5
+        assert cold.shared_hits == 1
+        assert cold.get(99) == 1.5
+        assert cold.hits == 1
+
+
+class TestWinnerDeterminerWithCache:
+    """Test that cached showdowns match uncached ones."""
+
+    def test_cached_result_matches_uncached(self):
+        """Test identical winnings with and without a cache."""
+        community = [
+            Card("hearts", "7"), Card("spades", "8"), Card("diamonds", "K"),
+            Card("clubs", "2"), Card("hearts", "J"),
+        ]
+
+        def play(determiner):
+            alice = PlayerState("alice", 0, 1000)
+            bob = PlayerState("bob", 1, 1000)
+            alice.deal_hole_cards([Card("hearts", "K"), Card("clubs", "K")])
+            bob.deal_hole_cards([Card("spades", "J"), Card("clubs", "9")])
+            return determiner.determine_winners([alice, bob], 200, [], community)
+
+        cache = EvaluationCache()
+        cached = WinnerDeterminer(HandEvaluator(), cache)
+        uncached = WinnerDeterminer(HandEvaluator())
+
+        assert play(cached) == play(uncached)
+        assert play(cached) == {"alice": 200, "bob": 0}
+        assert cache.hits == 2
+        assert cache.misses == 2
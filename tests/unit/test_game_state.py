@@ -233,6 +233,27 @@ class TestGameStatePhaseManagement:
             game.advance_phase("INVALID_PHASE")
 
 
+class TestGameStateCompactStorage:
+    """Test slotted storage of game state and side pots."""
+    
+    def test_game_state_and_side_pot_have_no_instance_dict(self):
+        """Test that GameState and SidePot are slotted."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        game = GameState("game_001", players, 10, 20)
+        assert not hasattr(game, "__dict__")
+        assert not hasattr(SidePot(10, ["bot_1"]), "__dict__")
+    
+    def test_current_phase_assignment_validates(self):
+        """Test that assigning current_phase goes through the phase codes."""
+        players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
+        game = GameState("game_001", players, 10, 20)
+        
+        game.current_phase = GamePhase.RIVER
+        assert game.current_phase is GamePhase.RIVER
+        with pytest.raises(ValueError, match="Invalid phase"):
+            game.current_phase = "RIVER"
+
+
 class TestGameStateCommunityCards:
     """Test community card management."""
     
@@ -423,6 +444,232 @@ class TestGameStateNextActiveSeat:
         assert next_seat is None
 
 
+class TestGameStateSeatIndexes:
+    """Test the id index and seat masks kept in step with player status."""
+    
+    def _game(self):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(4)]
+        return GameState("game_001", players, 10, 20), players
+    
+    def test_masks_follow_fold_and_all_in(self):
+        """Test that folding and going all-in update both masks."""
+        game, players = self._game()
+        assert game.active_mask == 0b1111
+        
+        players[1].fold()
+        players[2].go_all_in()
+        
+        assert game.active_mask == 0b1101
+        assert game.acting_mask == 0b1001
+        assert game.count_active_players() == 3
+        assert game.count_acting_players() == 2
+        assert game.get_next_acting_seat(0) == 3
+        assert game.get_next_acting_seat(3) == 0
+    
+    def test_masks_restored_on_reset(self):
+        """Test that a new hand re-activates players with chips."""
+        game, players = self._game()
+        players[0].fold()
+        players[3].status = PlayerStatus.OUT_OF_HAND
+        players[3].stack = 0
+        
+        game.reset_for_new_hand()
+        
+        assert game.active_mask == 0b0111
+        assert [p.player_id for p in game.active_players] == ["bot_0", "bot_1", "bot_2"]
+    
+    def test_active_view_cached_until_status_change(self):
+        """Test that active_players is reused until a player changes status."""
+        game, players = self._game()
+        view = game.active_players
+        assert game.active_players is view
+        
+        players[2].fold()
+        assert game.active_players is not view
+        assert players[2] not in game.active_players
+    
+    def test_player_lookup_by_id(self):
+        """Test the id -> seat index."""
+        game, players = self._game()
+        assert game.get_seat_of("bot_2") == 2
+        assert game.get_player_by_id("bot_2") is players[2]
+        assert game.get_seat_of("nobody") is None
+
+
+class TestBettingRoundAggregates:
+    """Test round aggregates maintained as players bet."""
+    
+    def _game(self):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(3)]
+        return GameState("game_001", players, 10, 20), players
+    
+    def test_full_raise_sets_increment_and_aggressor(self):
+        """Test high bet, last raise size and aggressor after bet and raise."""
+        game, players = self._game()
+        players[0].post_bet(40)
+        players[1].post_bet(120)
+        
+        betting_round = game.betting_round
+        assert betting_round.high_bet == 120
+        assert betting_round.last_raise_size == 80
+        assert betting_round.aggressor_seat == 1
+    
+    def test_short_all_in_does_not_reopen_min_raise(self):
+        """Test that a raise below the last raise size keeps the increment."""
+        game, players = self._game()
+        players[0].post_bet(100)
+        players[1].post_bet(130)
+        
+        assert game.betting_round.high_bet == 130
+        assert game.betting_round.last_raise_size == 100
+        assert game.betting_round.aggressor_seat == 0
+    
+    def test_to_act_counts_pending_players(self):
+        """Test that raises re-open action and calls/folds close it."""
+        game, players = self._game()
+        assert game.betting_round.to_act == 3
+        
+        players[0].post_bet(40)
+        assert game.betting_round.to_act == 2
+        players[1].post_bet(40)
+        players[2].fold()
+        assert game.betting_round.to_act == 0
+    
+    def test_start_betting_round_resets_aggregates(self):
+        """Test a new round: everyone pending, min raise back to big blind."""
+        game, players = self._game()
+        players[0].post_bet(100)
+        for player in players:
+            player.clear_round_data()
+        
+        game.start_betting_round()
+        
+        assert game.betting_round.high_bet == 0
+        assert game.betting_round.last_raise_size == 20
+        assert game.betting_round.aggressor_seat is None
+        assert game.betting_round.to_act == 3
+
+
+class TestGameStateBinarySerialisation:
+    """Test the struct-packed to_bytes()/from_bytes() encoding."""
+    
+    def _mid_hand_game(self):
+        players = [PlayerState(f"bot_{i}", i, 1000) for i in range(8)]
+        game = GameState("game_001", players, 10, 20, dealer_button=1)
+        for seat, player in enumerate(players):
+            player.deal_hole_cards([Card.from_index(2 * seat), Card.from_index(2 * seat + 1)])
+        game.advance_phase(GamePhase.FLOP)
+        for index in (40, 45, 50):
+            game.reveal_community_card(Card.from_index(index))
+        players[0].post_bet(100)
+        players[1].post_bet(300)
+        players[2].fold()
+        players[3].go_all_in()
+        game.current_action_player = 4
+        game.add_to_main_pot(250)
+        game.create_side_pot(80, ["bot_0", "bot_1"])
+        return game
+    
+    def test_round_trip_preserves_table(self):
+        """Test that every encoded field survives a round trip."""
+        game = self._mid_hand_game()
+        
+        rebuilt = GameState.from_bytes(game.to_bytes())
+        
+        assert rebuilt.game_id == "game_001"
+        assert rebuilt.current_phase == GamePhase.FLOP
+        assert rebuilt.dealer_button == 1
+        assert rebuilt.current_action_player == 4
+        assert rebuilt.community_cards == game.community_cards
+        assert rebuilt.get_total_pot() == game.get_total_pot()
+        assert rebuilt.side_pots[0].eligible_players == ["bot_0", "bot_1"]
+        for original, copy in zip(game.players, rebuilt.players):
+            assert copy.player_id == original.player_id
+            assert copy.stack == original.stack
+            assert copy.current_bet == original.current_bet
+            assert copy.status == original.status
+            assert copy.round_status == original.round_status
+            assert copy.hole_cards == original.hole_cards
+        assert rebuilt.to_bytes() == game.to_bytes()
+    
+    def test_round_trip_rebuilds_indexes(self):
+        """Test that seat masks and round aggregates match the original."""
+        game = self._mid_hand_game()
+        
+        rebuilt = GameState.from_bytes(game.to_bytes())
+        
+        assert rebuilt.active_mask == game.active_mask
+        assert rebuilt.acting_mask == game.acting_mask
+        assert rebuilt.get_next_acting_seat(1) == game.get_next_acting_seat(1)
+        assert rebuilt.betting_round.high_bet == game.betting_round.high_bet
+        assert rebuilt.betting_round.last_raise_size == game.betting_round.last_raise_size
+        assert rebuilt.betting_round.aggressor_seat == game.betting_round.aggressor_seat
+        assert rebuilt.betting_round.pending_mask == game.betting_round.pending_mask
+    
+    def test_eight_max_encoding_is_compact(self):
+        """Test the fixed-width size of an 8-max table."""
+        game = self._mid_hand_game()
+        game.side_pots = []
+        
+        assert len(game.to_bytes(include_ids=False)) == 195
+        # Each ID adds a length byte plus its UTF-8 bytes
+        assert len(game.to_bytes()) == 195 + 9 + 8 * 6
+    
+    def test_ids_supplied_by_caller(self):
+        """Test decoding data written without IDs."""
+        game = self._mid_hand_game()
+        data = game.to_bytes(include_ids=False)
+        player_ids = [player.player_id for player in game.players]
+        
+        rebuilt = GameState.from_bytes(data, game_id="game_001", player_ids=player_ids)
+        assert rebuilt.get_seat_of("bot_2") == 2
+        
+        with pytest.raises(ValueError, match="player_ids required"):
+            GameState.from_bytes(data, game_id="game_001")
+    
+    def test_version_one_data_is_still_read(self):
+        """Test decoding the layout without pot contributions."""
+        game = self._mid_hand_game()
+        data = bytearray(game.to_bytes(include_ids=False))
+        # Rewrite as version 1: drop each seat's 4-byte contribution
+        header, seat_size = 35, 20
+        v1 = bytearray(data[:header])
+        v1[0] = 1
+        for seat in range(8):
+            start = header + seat * seat_size
+            v1 += data[start:start + 8] + data[start + 12:start + seat_size]
+        v1 += data[header + 8 * seat_size:]
+        player_ids = [player.player_id for player in game.players]
+        
+        rebuilt = GameState.from_bytes(bytes(v1), "game_001", player_ids)
+        
+        assert rebuilt.ledger is None
+        assert rebuilt.to_bytes(include_ids=False) == bytes(data)
+    
+    def test_unsupported_version_raises_error(self):
+        """Test that data from another layout version is rejected."""
+        data = bytearray(self._mid_hand_game().to_bytes())
+        data[0] = 99
+        
+        with pytest.raises(ValueError, match="Unsupported game state version"):
+            GameState.from_bytes(bytes(data))
+    
+    def test_truncated_data_raises_error(self):
+        """Test that short data is reported as malformed."""
+        data = self._mid_hand_game().to_bytes()
+        
+        with pytest.raises(ValueError, match="Malformed"):
+            GameState.from_bytes(data[:50])
+    
+    def test_oversized_stack_raises_error(self):
+        """Test that chip amounts beyond 32 bits are rejected."""
+        game = self._mid_hand_game()
+        game.players[0].stack = 2 ** 32
+        
+        with pytest.raises(ValueError, match="Cannot serialise"):
+            game.to_bytes()
+
+
 class TestGameStateReset:
     """Test resetting game for new hand."""
     
@@ -483,6 +730,19 @@ class TestGameStateReset:
         game.reset_for_new_hand()
         assert game.dealer_button == 0  # Wraps around
     
+    def test_reset_for_new_hand_button_skips_busted_seat(self):
+        """Test that the button passes over a player with no chips."""
+        players = [
+            PlayerState("bot_1", 0, 1000),
+            PlayerState("bot_2", 1, 1000),
+            PlayerState("bot_3", 2, 1000)
+        ]
+        game = GameState("game_001", players, 10, 20, dealer_button=0)
+        players[1].stack = 0
+        
+        game.reset_for_new_hand()
+        assert game.dealer_button == 2
+    
     def test_reset_for_new_hand_sets_blinds_posted_phase(self):
         """Test that reset advances to BLINDS_POSTED phase."""
         players = [PlayerState("bot_1", 0, 1000), PlayerState("bot_2", 1, 1000)]
@@ -1,7 +1,11 @@
 """Tests for HandEvaluator class."""
 
+import random
+from itertools import combinations
+
 import pytest
 from poker_engine.card import Card
+from poker_engine.deck import FULL_DECK
 from poker_engine.hand_evaluator import HandEvaluator
 
 
@@ -210,6 +214,79 @@ class TestHandComparison:
         assert result == 0
 
 
+class TestStrength:
+    """Test the strength-only fast paths against evaluate()."""
+    
+    @pytest.fixture
+    def evaluator(self):
+        """Create HandEvaluator instance."""
+        return HandEvaluator()
+    
+    def test_strength_matches_evaluate(self, evaluator):
+        """Test strength() on every category, including the wheel."""
+        hands = [
+            ["AH", "KH", "QH", "JH", "10H"],
+            ["5S", "4S", "3S", "2S", "AS"],
+            ["9C", "9D", "9H", "9S", "2C"],
+            ["KC", "KD", "KH", "3S", "3C"],
+            ["2D", "7D", "9D", "JD", "KD"],
+            ["AC", "2D", "3H", "4S", "5C"],
+            ["7C", "7D", "7H", "AS", "2C"],
+            ["7C", "7D", "4H", "4S", "AC"],
+            ["7C", "7D", "4H", "QS", "AC"],
+            ["2C", "7D", "4H", "QS", "AC"],
+        ]
+        for codes in hands:
+            cards = [_card(code) for code in codes]
+            assert evaluator.strength(cards) == evaluator.evaluate(cards)['strength']
+    
+    def test_strength_matches_evaluate_on_random_hands(self, evaluator):
+        """Test strength() against evaluate() on random hands."""
+        rng = random.Random(3)
+        for _ in range(2000):
+            cards = rng.sample(FULL_DECK, 5)
+            assert evaluator.strength(cards) == evaluator.evaluate(cards)['strength']
+    
+    def test_best_strength_matches_every_combination(self, evaluator):
+        """Test best_strength() against the best of evaluate() over 5-7 cards."""
+        rng = random.Random(5)
+        # Half the hands from two suits, so flushes are common
+        two_suits = [card for card in FULL_DECK if card.suit in ("hearts", "spades")]
+        for i in range(600):
+            cards = rng.sample(two_suits if i % 2 else FULL_DECK, 5 + i % 3)
+            expected = max(
+                evaluator.evaluate(list(combo))['strength']
+                for combo in combinations(cards, 5)
+            )
+            assert evaluator.best_strength(cards) == expected
+    
+    def test_extend_best_strength_matches_best_strength(self, evaluator):
+        """Test adding run cards to an evaluated hand against the whole set."""
+        rng = random.Random(8)
+        for i in range(400):
+            cards = rng.sample(FULL_DECK, 7)
+            known, new = cards[:3 + i % 3], cards[3 + i % 3:]
+            known_best = evaluator.best_strength(known) if len(known) >= 5 else -1
+            assert (
+                evaluator.extend_best_strength(known, known_best, new)
+                == evaluator.best_strength(cards)
+            )
+    
+    def test_wrong_card_count_raises_error(self, evaluator):
+        """Test that both fast paths check the card count."""
+        cards = [Card("hearts", "A"), Card("spades", "K"), Card("clubs", "2")]
+        with pytest.raises(ValueError):
+            evaluator.strength(cards)
+        with pytest.raises(ValueError):
+            evaluator.best_strength(cards)
+
+
+def _card(code):
+    """Build a card written like "10H" or "AS"."""
+    suit = {"H": "hearts", "D": "diamonds", "C": "clubs", "S": "spades"}[code[-1]]
+    return Card(suit, code[:-1])
+
+
 class TestHandEvaluatorErrors:
     """Test error handling."""
     
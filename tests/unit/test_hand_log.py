@@ -0,0 +1,87 @@
+"""Tests for HandLog."""
+
+import pytest
+from poker_engine.betting_validator import ActionType
+from poker_engine.hand_log import (
+    ACTION_CODES,
+    BOARD_SEAT,
+    EventKind,
+    HandEvent,
+    HandLog,
+)
+
+
+def _sample_log():
+    """Return a short heads-up log: blinds, a card, a call and an award."""
+    log = HandLog(["alice", "bob"], [1000, 1000], button=1)
+    log.record(EventKind.BLIND, 1, amount=10)
+    log.record(EventKind.BLIND, 0, amount=20)
+    log.record(EventKind.DEAL, BOARD_SEAT, 51)
+    log.record(EventKind.ACTION, 1, ACTION_CODES[ActionType.CALL], 10)
+    log.record(EventKind.AWARD, 0, amount=40)
+    return log
+
+
+class TestHandLog:
+    """Test recording, decoding and serialising events."""
+
+    def test_events_decode_in_order(self):
+        """Test that events come back as typed HandEvents."""
+        log = _sample_log()
+
+        assert len(log) == 5
+        assert log[0] == HandEvent(EventKind.BLIND, 1, 0, 10)
+        assert log[2] == HandEvent(EventKind.DEAL, -1, 51, 0)
+        assert [event.kind for event in log] == [
+            EventKind.BLIND,
+            EventKind.BLIND,
+            EventKind.DEAL,
+            EventKind.ACTION,
+            EventKind.AWARD,
+        ]
+
+    def test_pop_removes_last_event(self):
+        """Test that pop() undoes the most recent record()."""
+        log = _sample_log()
+        log.pop()
+
+        assert len(log) == 4
+        assert log[-1].kind == EventKind.ACTION
+
+    def test_awards_by_player(self):
+        """Test chips paid out per player."""
+        assert _sample_log().awards() == {"alice": 40}
+
+    def test_reset_empties_log(self):
+        """Test that reset() starts a new hand in place."""
+        log = _sample_log()
+        log.reset([990, 1010], button=0)
+
+        assert len(log) == 0
+        assert log.starting_stacks == [990, 1010]
+        assert log.button == 0
+
+    def test_wrong_stack_count_raises_error(self):
+        """Test that every seat needs a starting stack."""
+        with pytest.raises(ValueError, match="Expected 2 starting stacks"):
+            HandLog(["alice", "bob"], [1000])
+
+    def test_snapshot_and_copy_are_independent(self):
+        """Test that restore() and copy() do not share the arrays."""
+        log = _sample_log()
+        token = log.snapshot()
+        copy = log.copy()
+        log.reset()
+
+        assert len(copy) == 5
+        log.restore(token)
+        assert log.to_dict() == copy.to_dict()
+
+    def test_round_trip_through_dict(self):
+        """Test that to_dict/from_dict rebuilds header and events."""
+        log = _sample_log()
+        rebuilt = HandLog.from_dict(log.to_dict())
+
+        assert rebuilt.to_dict() == log.to_dict()
+        assert list(rebuilt) == list(log)
+        assert rebuilt.button == 1
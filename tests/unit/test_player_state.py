@@ -322,6 +322,7 @@ class TestPlayerResetForNewHand:
         # Note: actual behaviour depends on implementation choice
         # This tests current expected behaviour
         assert player.stack == 0
+        assert player.status == PlayerStatus.OUT_OF_HAND
 
 
 class TestPlayerActiveInHand:
@@ -352,6 +353,35 @@ class TestPlayerActiveInHand:
         assert player.is_active_in_hand() is False
 
 
+class TestPlayerCompactStorage:
+    """Test slotted storage and status codes."""
+    
+    def test_player_has_no_instance_dict(self):
+        """Test that PlayerState is slotted."""
+        player = PlayerState("bot_001", 0, 1000)
+        assert not hasattr(player, "__dict__")
+        with pytest.raises(AttributeError):
+            player.nickname = "bot"
+    
+    def test_status_properties_round_trip(self):
+        """Test that statuses read back as the enums assigned."""
+        player = PlayerState("bot_001", 0, 1000)
+        for status in PlayerStatus:
+            player.status = status
+            assert player.status is status
+        for round_status in RoundStatus:
+            player.round_status = round_status
+            assert player.round_status is round_status
+    
+    def test_invalid_status_raises_error(self):
+        """Test that a non-enum status is rejected."""
+        player = PlayerState("bot_001", 0, 1000)
+        with pytest.raises(ValueError, match="Invalid player status"):
+            player.status = "ACTIVE"
+        with pytest.raises(ValueError, match="Invalid round status"):
+            player.round_status = 1
+
+
 class TestPlayerRepr:
     """Test string representation."""
     
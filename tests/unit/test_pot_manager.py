@@ -124,6 +124,26 @@ class TestPotManagerInitialisation:
         for player in players:
             assert player in pm.main_pot.eligible_players
 
+    
+    def test_reset_for_new_hand(self):
+        """Test that reset clears folds and all-ins and narrows the players."""
+        pm = PotManager(["p1", "p2", "p3"])
+        pm.add_to_pot("p1", 50)
+        pm.set_folded("p2")
+        pm.set_all_in("p1", 0)
+        token = pm.snapshot()
+        
+        pm.ledger.reset()
+        pm.reset(["p1", "p3"])
+        
+        assert pm.folded_players == set()
+        assert pm.all_in_amounts == {}
+        assert pm.player_contributions == {"p1": 0, "p3": 0}
+        
+        pm.restore(token)
+        assert pm.player_contributions == {"p1": 50, "p2": 0, "p3": 0}
+        assert pm.folded_players == {"p2"}
+
 
 class TestPotManagerContributions:
     """Test tracking player contributions."""
@@ -489,3 +509,93 @@ class TestComplexScenarios:
         # Contributions should be tracked
         assert pm.get_player_contribution("short_stack") == 50
         assert pm.get_player_contribution("big_stack") == 500
+
+
+class TestBuildPots:
+    """Test single-pass layered pot building."""
+    
+    def test_equal_contributions_single_pot(self):
+        """Test that equal contributions produce one main pot."""
+        pm = PotManager(["p1", "p2", "p3"])
+        for player in ["p1", "p2", "p3"]:
+            pm.add_to_pot(player, 100)
+        
+        pots = pm.build_pots()
+        
+        assert len(pots.pots) == 1
+        assert pots.pots[0].amount == 300
+        assert pots.eligible_players(pots.pots[0]) == ["p1", "p2", "p3"]
+    
+    def test_all_in_layers(self):
+        """Test main and side pots for staggered all-ins."""
+        pm = PotManager(["p1", "p2", "p3"])
+        pm.add_to_pot("p1", 50)
+        pm.add_to_pot("p2", 100)
+        pm.add_to_pot("p3", 100)
+        
+        pots = pm.build_pots()
+        
+        assert [pot.amount for pot in pots.pots] == [150, 100]
+        assert pots.eligible_players(pots.pots[0]) == ["p1", "p2", "p3"]
+        assert pots.eligible_players(pots.pots[1]) == ["p2", "p3"]
+        assert pots.total == 250
+    
+    def test_dead_money_assigned_to_its_layer(self):
+        """Test that a folded player's chips land in the layer they reached."""
+        pm = PotManager(["a", "b", "c", "d"])
+        pm.add_to_pot("a", 50)
+        pm.add_to_pot("b", 30)
+        pm.add_to_pot("c", 100)
+        pm.add_to_pot("d", 100)
+        pm.set_folded("b")
+        
+        pots = pm.build_pots()
+        
+        assert [pot.amount for pot in pots.pots] == [180, 100]
+        assert pots.eligible_players(pots.pots[0]) == ["a", "c", "d"]
+        assert pots.eligible_players(pots.pots[1]) == ["c", "d"]
+    
+    def test_dead_money_above_live_players_rolls_down(self):
+        """Test that chips above every live contribution are not orphaned."""
+        pm = PotManager(["a", "b", "c"])
+        pm.add_to_pot("a", 40)
+        pm.add_to_pot("b", 60)
+        pm.add_to_pot("c", 100)
+        pm.set_folded("c")
+        
+        pots = pm.build_pots()
+        
+        assert pots.total == 200
+        assert pots.eligible_players(pots.pots[-1]) == ["b"]
+        assert sum(pot.amount for pot in pots.pots) == 200
+    
+    def test_pot_structure_is_immutable(self):
+        """Test that layers cannot be modified after building."""
+        pm = PotManager(["p1", "p2"])
+        pm.add_to_pot("p1", 10)
+        pm.add_to_pot("p2", 10)
+        pots = pm.build_pots()
+        
+        with pytest.raises(AttributeError):
+            pots.pots[0].amount = 0
+    
+    def test_set_folded_non_existent_player_raises_error(self):
+        """Test folding an unknown player."""
+        pm = PotManager(["p1"])
+        with pytest.raises(ValueError, match="not in this game"):
+            pm.set_folded("p2")
+    
+    def test_calculate_side_pots_uses_layers(self):
+        """Test that calculate_side_pots mirrors build_pots without double-counting."""
+        pm = PotManager(["p1", "p2", "p3"])
+        pm.add_to_pot("p1", 50)
+        pm.set_all_in("p1", 0)
+        pm.add_to_pot("p2", 100)
+        pm.add_to_pot("p3", 100)
+        
+        pm.calculate_side_pots()
+        pm.calculate_side_pots()
+        
+        assert pm.main_pot.amount == 150
+        assert [pot.amount for pot in pm.side_pots] == [100]
+        assert pm.get_pot_total() == 250
@@ -0,0 +1,56 @@
+"""Tests for SeatRing."""
+
+import pytest
+from poker_engine.seat_ring import SeatRing
+
+
+class TestSeatRing:
+    """Test ring navigation, removal and insertion."""
+
+    def test_next_after_wraps_round_table(self):
+        """Test clockwise order over member seats."""
+        ring = SeatRing(6, 0b101101)
+        assert ring.next_after(0) == 2
+        assert ring.next_after(3) == 5
+        assert ring.next_after(5) == 0
+        assert len(ring) == 4
+
+    def test_removed_seat_skipped(self):
+        """Test that removal relinks neighbours in O(1)."""
+        ring = SeatRing(4, 0b1111)
+        ring.remove(1)
+        ring.remove(2)
+
+        assert ring.next_after(0) == 3
+        assert ring.previous_before(3) == 0
+        assert 1 not in ring
+
+    def test_non_member_seat_finds_neighbours(self):
+        """Test lookups from a seat outside the ring (e.g. a folded button)."""
+        ring = SeatRing(5, 0b10010)
+        assert ring.next_after(2) == 4
+        assert ring.next_after(4) == 1
+        assert ring.previous_before(2) == 1
+        assert ring.previous_before(0) == 4
+
+    def test_insert_restores_clockwise_position(self):
+        """Test that an inserted seat is linked between its neighbours."""
+        ring = SeatRing(4, 0b1001)
+        ring.insert(2)
+
+        assert ring.next_after(0) == 2
+        assert ring.next_after(2) == 3
+        assert ring.previous_before(3) == 2
+
+    def test_single_member_has_no_next(self):
+        """Test that a lone seat has no other seat to pass to."""
+        ring = SeatRing(3, 0b010)
+        assert ring.next_after(1) is None
+        assert ring.next_after(0) == 1
+        ring.remove(1)
+        assert ring.next_after(0) is None
+
+    def test_invalid_size_raises_error(self):
+        """Test that a ring needs at least one seat."""
+        with pytest.raises(ValueError, match="num_seats must be positive"):
+            SeatRing(0)
@@ -0,0 +1,209 @@
+"""Tests for the immutable table views published by DealerEngine."""
+
+import threading
+import time
+
+from poker_engine.betting_validator import ActionType
+from poker_engine.dealer_engine import DealerEngine, GameType
+from poker_engine.game_state import GamePhase
+from poker_engine.player_state import PlayerState
+from poker_engine.table_view import SeatView, TableView
+
+STARTING_STACK = 1000
+
+
+def _engine(num_players=3):
+    players = [PlayerState(f"bot_{i}", i, STARTING_STACK) for i in range(num_players)]
+    engine = DealerEngine(
+        game_type=GameType.TEXAS_HOLDEM,
+        players=players,
+        small_blind_amount=10,
+        big_blind_amount=20,
+        publish_views=True
+    )
+    engine.start_hand()
+    return engine
+
+
+class TestPublishedView:
+    """Test the view published after each change."""
+
+    def test_view_matches_table(self):
+        """Test that the published view reflects the live engine."""
+        engine = _engine()
+        view = engine.published
+
+        assert isinstance(view, TableView)
+        assert view.version == engine.state_version
+        assert view.phase == GamePhase.PRE_FLOP
+        assert view.pot_total == 30
+        assert [seat.stack for seat in view.seats] == [
+            p.stack for p in engine.game_state.players
+        ]
+
+    def test_new_view_per_change_and_old_view_frozen(self):
+        """Test that a change publishes a new view and leaves the old one intact."""
+        engine = _engine()
+        before = engine.published
+        seat = engine.game_state.current_action_player
+
+        engine.apply(ActionType.CALL, 20)
+
+        assert engine.published is not before
+        assert engine.published.seats[seat].current_bet == 20
+        assert before.seats[seat].current_bet == 0
+        assert before.pot_total == 30
+
+    def test_untouched_seats_are_shared(self):
+        """Test structural sharing of seats and board between views."""
+        engine = _engine()
+        before = engine.published
+        seat = engine.game_state.current_action_player
+
+        engine.apply(ActionType.FOLD)
+
+        after = engine.published
+        for other in range(3):
+            shared = after.seats[other] is before.seats[other]
+            assert shared == (other != seat)
+        assert after.community_cards is before.community_cards
+
+    def test_publishing_is_off_by_default(self):
+        """Test that an engine builds no views unless asked to."""
+        players = [PlayerState(f"bot_{i}", i, STARTING_STACK) for i in range(2)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        engine.restore(engine.snapshot())
+
+        assert engine.published is None
+
+    def test_publishing_can_be_turned_on_later(self):
+        """Test that the first view after switching on covers every seat."""
+        players = [PlayerState(f"bot_{i}", i, STARTING_STACK) for i in range(3)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20
+        )
+        engine.start_hand()
+        engine.publish_views = True
+
+        engine.apply(ActionType.CALL, 20)
+
+        assert [seat.stack for seat in engine.published.seats] == [
+            p.stack for p in engine.game_state.players
+        ]
+
+    def test_republishing_after_a_gap_copies_every_seat(self):
+        """Test that no seat keeps data from before publishing was paused."""
+        engine = _engine()
+        engine.publish_views = False
+        assert engine.published is None
+
+        engine.apply(ActionType.CALL, 20)
+        engine.apply(ActionType.RAISE, 60)
+        engine.publish_views = True
+        engine.apply(ActionType.FOLD)
+
+        view = engine.published
+        assert view.version == engine.state_version
+        for seat, player in enumerate(engine.game_state.players):
+            assert view.seats[seat] == SeatView.of(seat, player)
+
+    def test_restore_republishes_only_changed_seats(self):
+        """Test that restore() shares the seats and board it did not change."""
+        engine = _engine()
+        token = engine.snapshot()
+        seat = engine.game_state.current_action_player
+        engine.apply(ActionType.CALL, 20)
+        before = engine.published
+
+        engine.restore(token)
+
+        after = engine.published
+        assert after.version == engine.state_version
+        for other in range(3):
+            shared = after.seats[other] is before.seats[other]
+            assert shared == (other != seat)
+        assert after.community_cards is before.community_cards
+        assert after.seats[seat].current_bet == 0
+
+    def test_publishing_can_be_turned_off(self):
+        """Test an engine built without published views."""
+        players = [PlayerState(f"bot_{i}", i, STARTING_STACK) for i in range(2)]
+        engine = DealerEngine(
+            game_type=GameType.TEXAS_HOLDEM,
+            players=players,
+            small_blind_amount=10,
+            big_blind_amount=20,
+            publish_views=False
+        )
+        engine.start_hand()
+        
+        assert engine.published is None
+        assert engine.state_version == 1
+
+    def test_queries_do_not_publish(self):
+        """Test that reading the engine leaves the published view alone."""
+        engine = _engine()
+        view = engine.published
+        engine.get_game_state()
+        engine.get_game_state_delta(0)
+
+        assert engine.published is view
+
+
+class TestConcurrentReaders:
+    """Stress test readers racing the thread that drives the engine."""
+
+    def test_readers_never_see_torn_state(self):
+        """Test that every view read conserves chips and versions only grow."""
+        engine = _engine(num_players=4)
+        total_chips = 4 * STARTING_STACK
+        stop = threading.Event()
+        failures = []
+
+        def read():
+            last_version = -1
+            reads = 0
+            while not stop.is_set() or reads == 0:
+                view = engine.published
+                chips = view.pot_total + sum(seat.stack for seat in view.seats)
+                if chips != total_chips:
+                    failures.append(f"v{view.version}: {chips} chips")
+                if view.version < last_version:
+                    failures.append(f"version went back {last_version} -> {view.version}")
+                last_version = view.version
+                reads += 1
+                time.sleep(0)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+
+        try:
+            for _ in range(100):
+                records = []
+                while not engine.is_round_complete():
+                    seat = engine.game_state.current_action_player
+                    player = engine.game_state.players[seat]
+                    to_call = engine.game_state.betting_round.high_bet - player.current_bet
+                    if len(records) % 3 == 0 and player.stack > to_call + 40:
+                        records.append(engine.apply(ActionType.RAISE, to_call + 40))
+                    else:
+                        records.append(engine.apply(ActionType.CALL, to_call))
+                for record in reversed(records):
+                    engine.undo(record)
+        finally:
+            stop.set()
+            for reader in readers:
+                reader.join()
+
+        assert failures == []
+        assert engine.state_version > 200
@@ -5,6 +5,7 @@ from poker_engine.card import Card
 from poker_engine.player_state import PlayerState, PlayerStatus
 from poker_engine.hand_evaluator import HandEvaluator
 from poker_engine.winner_determiner import WinnerDeterminer
+from poker_engine.pot_manager import PotManager
 
 
 class TestWinnerDeterminerInitialisation:
@@ -559,3 +560,137 @@ class TestEdgeCases:
         assert winnings["alice"] == 400
         for i in range(1, 4):
             assert winnings[players[i].player_id] == 0
+
+
+class TestAwardPots:
+    """Test awarding a PotStructure built by PotManager."""
+    
+    def test_short_all_in_wins_main_pot_only(self):
+        """Test best hand capped at its layer; dead money goes to main pot."""
+        determiner = WinnerDeterminer(HandEvaluator())
+        
+        short = PlayerState("short", 0, 1000)
+        big = PlayerState("big", 1, 1000)
+        folder = PlayerState("folder", 2, 1000)
+        short.deal_hole_cards([Card("hearts", "A"), Card("spades", "A")])
+        big.deal_hole_cards([Card("diamonds", "9"), Card("clubs", "8")])
+        folder.deal_hole_cards([Card("clubs", "2"), Card("clubs", "3")])
+        folder.fold()
+        
+        pm = PotManager(["short", "big", "folder"])
+        pm.add_to_pot("short", 50)
+        pm.add_to_pot("big", 200)
+        pm.add_to_pot("folder", 20)
+        pm.set_folded("folder")
+        
+        community = [
+            Card("hearts", "K"),
+            Card("spades", "Q"),
+            Card("diamonds", "4"),
+            Card("clubs", "J"),
+            Card("hearts", "6")
+        ]
+        
+        winnings = determiner.award_pots([short, big], pm.build_pots(), community)
+        
+        assert winnings["short"] == 120
+        assert winnings["big"] == 150
+
+
+class TestRankTierSettlement:
+    """Test single-pass settlement by rank tiers."""
+    
+    BOARD = [
+        Card("hearts", "A"),
+        Card("spades", "K"),
+        Card("diamonds", "Q"),
+        Card("clubs", "J"),
+        Card("hearts", "10")
+    ]
+    
+    def test_odd_chip_goes_left_of_button(self):
+        """Test odd chips are dealt in seat order starting after the button."""
+        determiner = WinnerDeterminer(HandEvaluator())
+        players = [PlayerState(f"p{i}", i, 1000) for i in range(3)]
+        players[0].deal_hole_cards([Card("hearts", "2"), Card("spades", "3")])
+        players[1].deal_hole_cards([Card("diamonds", "2"), Card("clubs", "3")])
+        players[2].deal_hole_cards([Card("clubs", "2"), Card("diamonds", "3")])
+        
+        winnings = determiner.determine_winners(
+            remaining_players=players,
+            main_pot=302,
+            side_pots=[],
+            community_cards=self.BOARD,
+            button_seat=1
+        )
+        
+        # Seat order from button 1: seat 2, seat 0, seat 1
+        assert winnings == {"p0": 101, "p1": 100, "p2": 101}
+    
+    def test_eight_way_all_in_each_layer_to_best_eligible(self):
+        """Test that each nested layer goes to its best eligible hand."""
+        determiner = WinnerDeterminer(HandEvaluator())
+        board = [
+            Card("hearts", "2"),
+            Card("spades", "7"),
+            Card("diamonds", "9"),
+            Card("clubs", "J"),
+            Card("hearts", "4")
+        ]
+        pair_ranks = ["3", "5", "6", "8", "10", "Q", "K", "A"]
+        players = []
+        pm = PotManager([f"p{i}" for i in range(8)])
+        for i, rank in enumerate(pair_ranks):
+            player = PlayerState(f"p{i}", i, 1000)
+            player.deal_hole_cards([Card("spades", rank), Card("clubs", rank)])
+            players.append(player)
+            # Weaker pairs committed more, so every layer has a new winner
+            pm.add_to_pot(f"p{i}", (8 - i) * 10)
+        
+        pots = pm.build_pots()
+        winnings = determiner.award_pots(players, pots, board, button_seat=0)
+        
+        assert sum(winnings.values()) == pots.total
+        assert len(pots.pots) == 8
+        # Aces were shortest (10 each from 8 players)
+        assert winnings["p7"] == 80
+        # Trey was deepest; its last layer is uncontested
+        assert winnings["p0"] == 10
+
+
+class TestMultiRunSettlement:
+    """Test run-it-multiple-times settlement."""
+    
+    def test_odd_chips_across_runs_are_conserved(self):
+        """Test that per-run shares always add up to the pot."""
+        determiner = WinnerDeterminer(HandEvaluator())
+        alice = PlayerState("alice", 0, 1000)
+        bob = PlayerState("bob", 1, 1000)
+        alice.deal_hole_cards([Card("hearts", "A"), Card("spades", "A")])
+        bob.deal_hole_cards([Card("diamonds", "K"), Card("clubs", "K")])
+        
+        pm = PotManager(["alice", "bob"])
+        pm.add_to_pot("alice", 151)
+        pm.add_to_pot("bob", 150)
+        flop = [Card("hearts", "2"), Card("spades", "7"), Card("diamonds", "9")]
+        
+        winnings = determiner.award_pots_multi_run(
+            [alice, bob],
+            pm.build_pots(),
+            flop,
+            [
+                [Card("clubs", "J"), Card("diamonds", "3")],
+                [Card("hearts", "K"), Card("clubs", "4")],
+                [Card("spades", "K"), Card("clubs", "5")],
+            ]
+        )
+        
+        # Main layer 300 -> 100 per run; alice's uncalled 1 goes to run 1
+        assert winnings == {"alice": 101, "bob": 200}
+    
+    def test_empty_runouts_raises_error(self):
+        """Test that at least one runout is required."""
+        determiner = WinnerDeterminer(HandEvaluator())
+        pm = PotManager(["alice"])
+        with pytest.raises(ValueError, match="at least one runout"):
+            determiner.award_pots_multi_run([], pm.build_pots(), [], [])